@@ -231,7 +231,6 @@ class AWSServiceAdapter(AWSServicePort):
         """Update S3 configuration in settings."""
         try:
             from infrastructure.yaml_loader import get_settings_loader
-            import yaml
 
             settings_loader = get_settings_loader()
             current_settings = settings_loader._load_settings()  # Get raw dict
@@ -262,9 +261,8 @@ class AWSServiceAdapter(AWSServicePort):
                 'type': 's3_service'
             })
 
-            # Save back to settings.yaml
-            with open(settings_loader.settings_path, 'w') as f:
-                yaml.safe_dump(current_settings, f, default_flow_style=False, indent=2)
+            # Save back to settings.yaml (publishes the new snapshot)
+            settings_loader.save_settings(current_settings)
 
             return {
                 'success': True,
@@ -546,11 +544,8 @@ class DatabaseAdapter(DatabasePort):
             # Update with new config
             current_config['credentials']['postgresql_primary'].update(config)
 
-            # Save back to settings.yaml
-            import yaml
-            settings_path = settings_loader.settings_path
-            with open(settings_path, 'w') as f:
-                yaml.safe_dump(current_config, f, default_flow_style=False, indent=2)
+            # Save back to settings.yaml (publishes the new snapshot)
+            settings_loader.save_settings(current_config)
 
             return {
                 'success': True,
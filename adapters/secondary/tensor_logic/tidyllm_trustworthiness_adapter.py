@@ -44,12 +44,12 @@ except ImportError:
     TLM_AVAILABLE = False
     logging.warning("tlm package not available")
 
-# Import YOUR tidyllm-sentence package
-try:
-    from tidyllm_sentence import lsa_fit_transform, cosine_similarity
-    TIDYLLM_SENTENCE_AVAILABLE = True
-except ImportError:
-    TIDYLLM_SENTENCE_AVAILABLE = False
+# Import YOUR tidyllm-sentence package (loaded on first use)
+from common.utilities.lazy_imports import lazy_import, module_available
+
+tls = lazy_import("tidyllm_sentence")
+TIDYLLM_SENTENCE_AVAILABLE = module_available("tidyllm_sentence")
+if not TIDYLLM_SENTENCE_AVAILABLE:
     logging.warning("tidyllm-sentence not available")
 
 
@@ -206,10 +206,10 @@ class TidyLLMTrustworthinessAdapter(TrustworthinessPort):
         # Use YOUR tidyllm-sentence for embeddings
         try:
             texts = [query, response]
-            embeddings = lsa_fit_transform(texts)
+            embeddings = tls.lsa_fit_transform(texts)
 
             if len(embeddings) >= 2:
-                similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
+                similarity = tls.cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
                 # Normalize to 0-1 range (cosine is -1 to 1)
                 return (similarity + 1.0) / 2.0
 
@@ -388,7 +388,7 @@ class TidyLLMTrustworthinessAdapter(TrustworthinessPort):
 
         # Use embeddings for coherence
         try:
-            embeddings = lsa_fit_transform(sentences[:5])  # Limit to 5 sentences
+            embeddings = tls.lsa_fit_transform(sentences[:5])  # Limit to 5 sentences
 
             if len(embeddings) < 2:
                 return 0.8
@@ -396,7 +396,7 @@ class TidyLLMTrustworthinessAdapter(TrustworthinessPort):
             # Calculate pairwise similarities
             similarities = []
             for i in range(len(embeddings) - 1):
-                sim = cosine_similarity([embeddings[i]], [embeddings[i+1]])[0][0]
+                sim = tls.cosine_similarity([embeddings[i]], [embeddings[i+1]])[0][0]
                 similarities.append((sim + 1.0) / 2.0)  # Normalize
 
             # Average similarity
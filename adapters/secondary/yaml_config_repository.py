@@ -4,7 +4,6 @@ YAML Configuration Repository Adapter
 Secondary adapter for configuration persistence using YAML.
 """
 
-import yaml
 from typing import Optional
 from domain.ports.outbound.repository_port import ConfigurationRepositoryPort
 from domain.models.configuration import (
@@ -22,15 +21,17 @@ class YamlConfigRepository(ConfigurationRepositoryPort):
     def __init__(self, settings_loader):
         self.settings_loader = settings_loader
         self._cached_config = None
+        self._cached_version = None
 
     async def load(self) -> Configuration:
         """Load configuration from YAML file"""
-        if self._cached_config:
-            return self._cached_config
-
         try:
-            # Load raw YAML data
-            raw_config = self.settings_loader.load_settings()
+            # Settings snapshot (re-parsed only when the file changed)
+            snapshot = self.settings_loader.snapshot
+            if self._cached_config and self._cached_version == snapshot.version:
+                return self._cached_config
+
+            raw_config = snapshot.to_dict()
 
             # Map to domain model
             config = Configuration()
@@ -74,6 +75,7 @@ class YamlConfigRepository(ConfigurationRepositoryPort):
                 config.environment = raw_config["environment"]
 
             self._cached_config = config
+            self._cached_version = snapshot.version
             return config
 
         except Exception as e:
@@ -124,9 +126,8 @@ class YamlConfigRepository(ConfigurationRepositoryPort):
             if configuration.environment:
                 data["environment"] = configuration.environment
 
-            # Save to file
-            with open(self.settings_loader.settings_path, 'w') as f:
-                yaml.dump(data, f, default_flow_style=False)
+            # Save to file and publish the new settings snapshot
+            self.settings_loader.save_settings(data)
 
             # Clear cache
             self._cached_config = None
@@ -137,5 +138,5 @@ class YamlConfigRepository(ConfigurationRepositoryPort):
 
     async def reload(self) -> Configuration:
         """Reload configuration from source"""
-        self._cached_config = None
+        self.settings_loader.refresh()
         return await self.load()
\ No newline at end of file
@@ -37,10 +37,10 @@ import time
 
 # Core AWS imports
 try:
-    import boto3
     from botocore.exceptions import ClientError, NoCredentialsError, ProfileNotFound
     from botocore.config import Config
-    AWS_AVAILABLE = True
+    from common.utilities.lazy_imports import module_available
+    AWS_AVAILABLE = module_available("boto3")  # clients come from the shared AWS client factory
 except ImportError:
     AWS_AVAILABLE = False
 
@@ -273,8 +273,8 @@ class UnifiedSessionManager:
             return False
 
         try:
-            session = boto3.Session()
-            credentials = session.get_credentials()
+            from infrastructure.services.aws_client_factory import get_client_factory
+            credentials = get_client_factory().session().get_credentials()
             if credentials and not credentials.access_key:
                 # IAM role detected
                 self.config.credential_source = CredentialSource.IAM_ROLE
@@ -411,26 +411,30 @@ class UnifiedSessionManager:
         if POSTGRES_AVAILABLE and self.config.postgres_password:
             self._init_postgresql()
 
+    def _client_source(self):
+        """Shared client factory and the credential source discovered for this manager"""
+        from infrastructure.services.aws_client_factory import get_client_factory
+        factory = get_client_factory()
+
+        if self.config.credential_source == CredentialSource.IAM_ROLE:
+            return factory, factory.credential_key()
+        if self.config.credential_source in [CredentialSource.ENVIRONMENT, CredentialSource.SETTINGS_FILE]:
+            # Use credentials from environment or settings file
+            return factory, factory.credential_key(
+                access_key_id=self.config.s3_access_key_id,
+                secret_access_key=self.config.s3_secret_access_key
+            )
+        # Try default profile
+        return factory, factory.credential_key(profile_name=self.config.aws_profile)
+
     def _init_s3(self):
         """Initialize S3 connection"""
         try:
             start_time = time.time()
 
-            if self.config.credential_source == CredentialSource.IAM_ROLE:
-                session = boto3.Session()
-            elif self.config.credential_source in [CredentialSource.ENVIRONMENT, CredentialSource.SETTINGS_FILE]:
-                # Use credentials from environment or settings file
-                session = boto3.Session(
-                    aws_access_key_id=self.config.s3_access_key_id,
-                    aws_secret_access_key=self.config.s3_secret_access_key,
-                    region_name=self.config.s3_region
-                )
-            else:
-                # Try default profile
-                session = boto3.Session(profile_name=self.config.aws_profile)
-
-            self._s3_client = session.client('s3', region_name=self.config.s3_region)
-            self._s3_resource = session.resource('s3', region_name=self.config.s3_region)
+            factory, source = self._client_source()
+            self._s3_client = factory.client('s3', region=self.config.s3_region, source=source)
+            self._s3_resource = factory.resource('s3', region=self.config.s3_region, source=source)
 
             # Test connection
             self._s3_client.list_buckets()
@@ -459,21 +463,10 @@ class UnifiedSessionManager:
         try:
             start_time = time.time()
 
-            if self.config.credential_source == CredentialSource.IAM_ROLE:
-                session = boto3.Session()
-            elif self.config.credential_source in [CredentialSource.ENVIRONMENT, CredentialSource.SETTINGS_FILE]:
-                # Use credentials from environment or settings file
-                session = boto3.Session(
-                    aws_access_key_id=self.config.s3_access_key_id,
-                    aws_secret_access_key=self.config.s3_secret_access_key,
-                    region_name=self.config.bedrock_region
-                )
-            else:
-                session = boto3.Session(profile_name=self.config.aws_profile)
-
-            # Create both bedrock and bedrock-runtime clients
-            self._bedrock_client = session.client('bedrock', region_name=self.config.bedrock_region)
-            self._bedrock_runtime_client = session.client('bedrock-runtime', region_name=self.config.bedrock_region)
+            # Shared bedrock and bedrock-runtime clients
+            factory, source = self._client_source()
+            self._bedrock_client = factory.client('bedrock', region=self.config.bedrock_region, source=source)
+            self._bedrock_runtime_client = factory.client('bedrock-runtime', region=self.config.bedrock_region, source=source)
 
             # Test with a simple list models call (lightweight)
             try:
@@ -549,8 +542,11 @@ class UnifiedSessionManager:
         return self._s3_client
 
     def get_s3_resource(self):
-        """Get S3 resource (thread-safe)"""
-        return self._s3_resource
+        """Get S3 resource for the calling thread (boto3 resources are not thread-safe)"""
+        if self._s3_client is None:
+            return self._s3_resource
+        factory, source = self._client_source()
+        return factory.resource('s3', region=self.config.s3_region, source=source)
 
     def get_bedrock_client(self):
         """Get Bedrock client (thread-safe) - lazy initialization"""
@@ -0,0 +1,132 @@
+"""
+API Concurrency Controls
+========================
+
+Runs blocking work (LLM calls, document processing) off the event loop on a
+bounded thread pool, with a per-endpoint concurrency limit and a per-request
+timeout, so one slow model call cannot stall every other request on the
+worker.
+
+Limits are read from the environment:
+    API_WORKER_THREADS            size of the shared executor (default 16)
+    API_<ENDPOINT>_CONCURRENCY    in-flight calls per endpoint, e.g. API_CHAT_CONCURRENCY
+    API_<ENDPOINT>_TIMEOUT        seconds per call, e.g. API_CHAT_TIMEOUT
+    API_QUEUE_TIMEOUT             seconds to wait for a free slot before 503
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+
+class EndpointBusyError(Exception):
+    """Raised when an endpoint has no free concurrency slot in time."""
+    pass
+
+
+@dataclass
+class ConcurrencySettings:
+    """Executor size, per-endpoint limits and timeouts."""
+    worker_threads: int = 16
+    endpoint_limits: Dict[str, int] = field(default_factory=lambda: {"chat": 8, "chat_stream": 8, "qa": 4})
+    endpoint_timeouts: Dict[str, float] = field(default_factory=lambda: {"chat": 120.0, "chat_stream": 300.0, "qa": 300.0})
+    default_limit: int = 4
+    default_timeout: float = 60.0
+    queue_timeout: float = 5.0
+
+    @classmethod
+    def from_env(cls) -> "ConcurrencySettings":
+        settings = cls()
+        settings.worker_threads = int(os.environ.get("API_WORKER_THREADS", settings.worker_threads))
+        settings.queue_timeout = float(os.environ.get("API_QUEUE_TIMEOUT", settings.queue_timeout))
+        for endpoint in list(settings.endpoint_limits):
+            key = endpoint.upper()
+            if f"API_{key}_CONCURRENCY" in os.environ:
+                settings.endpoint_limits[endpoint] = int(os.environ[f"API_{key}_CONCURRENCY"])
+            if f"API_{key}_TIMEOUT" in os.environ:
+                settings.endpoint_timeouts[endpoint] = float(os.environ[f"API_{key}_TIMEOUT"])
+        return settings
+
+
+class BlockingCallRunner:
+    """Offload blocking callables to a bounded executor with per-endpoint limits.
+
+    A call that times out is abandoned by the request but keeps its executor
+    thread until it returns; the executor bound still caps total threads.
+    """
+
+    def __init__(self, settings: Optional[ConcurrencySettings] = None):
+        self.settings = settings or ConcurrencySettings.from_env()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.settings.worker_threads,
+            thread_name_prefix="api-blocking"
+        )
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def _semaphore(self, endpoint: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(endpoint)
+        if semaphore is None:
+            limit = self.settings.endpoint_limits.get(endpoint, self.settings.default_limit)
+            semaphore = self._semaphores[endpoint] = asyncio.Semaphore(limit)
+            self.stats[endpoint] = {"completed": 0, "timeouts": 0, "rejected": 0, "in_flight": 0}
+        return semaphore
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        return self._executor
+
+    def timeout_for(self, endpoint: str) -> float:
+        return self.settings.endpoint_timeouts.get(endpoint, self.settings.default_timeout)
+
+    @asynccontextmanager
+    async def slot(self, endpoint: str):
+        """Hold one of the endpoint's concurrency slots.
+
+        Raises:
+            EndpointBusyError: no slot became free within queue_timeout
+        """
+        semaphore = self._semaphore(endpoint)
+        stats = self.stats[endpoint]
+        try:
+            await asyncio.wait_for(semaphore.acquire(), self.settings.queue_timeout)
+        except asyncio.TimeoutError:
+            stats["rejected"] += 1
+            raise EndpointBusyError(f"Endpoint '{endpoint}' is at its concurrency limit")
+
+        stats["in_flight"] += 1
+        try:
+            yield
+        finally:
+            stats["in_flight"] -= 1
+            semaphore.release()
+
+    async def run(self, endpoint: str, func: Callable, *args,
+                  timeout: Optional[float] = None, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` in the executor under the endpoint's limits.
+
+        Raises:
+            EndpointBusyError: no slot became free within queue_timeout
+            asyncio.TimeoutError: the call exceeded the endpoint timeout
+        """
+        async with self.slot(endpoint):
+            stats = self.stats[endpoint]
+            try:
+                loop = asyncio.get_running_loop()
+                call = functools.partial(func, *args, **kwargs)
+                result = await asyncio.wait_for(
+                    loop.run_in_executor(self._executor, call),
+                    timeout if timeout is not None else self.timeout_for(endpoint)
+                )
+                stats["completed"] += 1
+                return result
+            except asyncio.TimeoutError:
+                stats["timeouts"] += 1
+                raise
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+API Load-Test Harness
+=====================
+
+Drives the FastAPI app in-process with a stub chat manager to show that
+slow LLM calls no longer stall the event loop: fast requests (/health)
+keep a flat p99 while slow /chat requests are in flight.
+
+Run with:
+    python -m api.load_test --slow-requests 8 --slow-seconds 2 --fast-requests 200
+
+Requires httpx (bundled with FastAPI's test dependencies).
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+import httpx
+
+from .concurrency import ConcurrencySettings
+from .main import create_app
+
+
+class StubChatManager:
+    """Chat manager stand-in whose chat() blocks like a slow model call."""
+
+    def __init__(self, delay_seconds: float = 2.0):
+        self.delay_seconds = delay_seconds
+        self.calls = 0
+
+    def chat(self, message: str, **kwargs) -> str:
+        self.calls += 1
+        time.sleep(self.delay_seconds)
+        return f"stub response to: {message[:40]}"
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _timed_get(client: httpx.AsyncClient, path: str) -> float:
+    started = time.perf_counter()
+    response = await client.get(path)
+    response.raise_for_status()
+    return time.perf_counter() - started
+
+
+async def _fast_latencies(client: httpx.AsyncClient, count: int, interval: float) -> List[float]:
+    latencies = []
+    for _ in range(count):
+        latencies.append(await _timed_get(client, "/health"))
+        await asyncio.sleep(interval)
+    return latencies
+
+
+def _summary(latencies: List[float]) -> Dict[str, float]:
+    return {
+        "count": len(latencies),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.mean(latencies) * 1000 if latencies else 0.0
+    }
+
+
+async def run_load_test(slow_requests: int = 8, slow_seconds: float = 2.0,
+                        fast_requests: int = 200, fast_interval: float = 0.005) -> Dict[str, Dict]:
+    """Measure /health latency alone, then while slow /chat calls are in flight."""
+    stub = StubChatManager(slow_seconds)
+    settings = ConcurrencySettings(worker_threads=max(4, slow_requests),
+                                   endpoint_limits={"chat": slow_requests},
+                                   endpoint_timeouts={"chat": slow_seconds * 5})
+    app = create_app(chat_manager_factory=lambda: stub, concurrency=settings)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+            baseline = await _fast_latencies(client, fast_requests, fast_interval)
+
+            slow_started = time.perf_counter()
+            slow_tasks = [
+                asyncio.create_task(client.post("/chat", json={"message": f"slow request {i}"}))
+                for i in range(slow_requests)
+            ]
+            await asyncio.sleep(0.05)  # Let the slow calls reach the executor
+            under_load = await _fast_latencies(client, fast_requests, fast_interval)
+            slow_responses = await asyncio.gather(*slow_tasks)
+            slow_wall = time.perf_counter() - slow_started
+
+    return {
+        "baseline": _summary(baseline),
+        "with_slow_requests_in_flight": _summary(under_load),
+        "slow_requests": {
+            "count": slow_requests,
+            "status_codes": sorted({r.status_code for r in slow_responses}),
+            "wall_seconds": slow_wall,
+            "stub_calls": stub.calls
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event-loop responsiveness load test")
+    parser.add_argument("--slow-requests", type=int, default=8)
+    parser.add_argument("--slow-seconds", type=float, default=2.0)
+    parser.add_argument("--fast-requests", type=int, default=200)
+    args = parser.parse_args()
+
+    results = asyncio.run(run_load_test(args.slow_requests, args.slow_seconds, args.fast_requests))
+
+    print("API LOAD TEST")
+    print("=" * 50)
+    for label in ("baseline", "with_slow_requests_in_flight"):
+        stats = results[label]
+        print(f"{label:32s} p50={stats['p50_ms']:.2f}ms p99={stats['p99_ms']:.2f}ms n={stats['count']}")
+    slow = results["slow_requests"]
+    print(f"slow /chat: {slow['count']} requests, status {slow['status_codes']}, "
+          f"{slow['wall_seconds']:.2f}s wall")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,25 @@ Compliance QA API - FastAPI Application
 Uses TidyLLM as library for AI/ML functionality
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import APIRouter, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
+import asyncio
 import sys
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 from datetime import datetime
 
+# Allow `python api/main.py` from the repo root as well as `uvicorn api.main:app`
+if __package__ in (None, ""):
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.concurrency import BlockingCallRunner, ConcurrencySettings, EndpointBusyError
+from api.streaming import StreamMetrics, open_token_stream, stream_tokens_as_sse
+from api.qa_jobs import QAJobManager, QAJobSettings
+
 # Import TidyLLM as library (assuming it's installed/importable)
 try:
     from packages.tidyllm.services.unified_chat_manager import UnifiedChatManager, ChatMode
@@ -26,6 +38,12 @@ except ImportError as e:
         ChatMode = None
         CorporateLLMGateway = None
 
+try:
+    from application.services.tensor_logic_application_service import TensorLogicApplicationService
+except ImportError as e:
+    print(f"Warning: Tensor logic service import failed: {e}")
+    TensorLogicApplicationService = None
+
 # API Models
 class ChatRequest(BaseModel):
     message: str
@@ -40,32 +58,98 @@ class ChatResponse(BaseModel):
     model: str
     timestamp: str
 
-class QARequest(BaseModel):
-    document_path: str
+class QAItem(BaseModel):
+    document_path: Optional[str] = None
+    document: Optional[Dict[str, Any]] = None
     question: str
+
+class QARequest(BaseModel):
+    document_path: Optional[str] = None
+    document: Optional[Dict[str, Any]] = None
+    question: Optional[str] = None
+    items: Optional[List[QAItem]] = None
     mode: Optional[str] = "rag"
+    compliance_standard: Optional[str] = "MVS_5.4.3"
+    temperature: Optional[float] = 0.0
+    async_job: Optional[bool] = None
 
 class HealthResponse(BaseModel):
     status: str
     version: str
     components: Dict[str, bool]
 
-# Initialize FastAPI
-app = FastAPI(
-    title="Compliance QA API",
-    description="Enterprise AI Platform powered by TidyLLM",
-    version="0.1.0"
-)
-
-# Initialize services
-chat_manager = None
-if UnifiedChatManager:
+def build_chat_manager():
+    """Default chat manager factory - one UnifiedChatManager per worker process."""
+    if not UnifiedChatManager:
+        return None
     try:
-        chat_manager = UnifiedChatManager()
+        return UnifiedChatManager()
     except Exception as e:
         print(f"Warning: Could not initialize chat manager: {e}")
+        return None
+
+
+def build_qa_service():
+    """Default QA service factory - one TensorLogicApplicationService per worker process."""
+    if not TensorLogicApplicationService:
+        return None
+    try:
+        return TensorLogicApplicationService()
+    except Exception as e:
+        print(f"Warning: Could not initialize QA service: {e}")
+        return None
 
-@app.get("/", response_model=Dict[str, str])
+
+def create_app(chat_manager_factory: Callable[[], Any] = build_chat_manager,
+               concurrency: Optional[ConcurrencySettings] = None,
+               qa_service_factory: Callable[[], Any] = build_qa_service,
+               qa_settings: Optional[QAJobSettings] = None) -> FastAPI:
+    """Create the API app.
+    
+    Managers are built once per worker in the lifespan hook and blocking
+    calls run on a bounded executor (see api/concurrency.py).
+    """
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        app.state.runner = BlockingCallRunner(concurrency)
+        app.state.stream_metrics = StreamMetrics()
+        # Construction may do I/O (sessions, clients); keep it off the loop
+        loop = asyncio.get_running_loop()
+        app.state.chat_manager = await loop.run_in_executor(None, chat_manager_factory)
+        qa_service = await loop.run_in_executor(None, qa_service_factory)
+        app.state.qa_jobs = (QAJobManager(app.state.runner, qa_service, qa_settings)
+                             if qa_service else None)
+        try:
+            yield
+        finally:
+            if app.state.qa_jobs:
+                await app.state.qa_jobs.shutdown()
+            app.state.runner.shutdown()
+    
+    app = FastAPI(
+        title="Compliance QA API",
+        description="Enterprise AI Platform powered by TidyLLM",
+        version="0.1.0",
+        lifespan=lifespan
+    )
+    app.include_router(router)
+    return app
+
+
+async def run_blocking(request: Request, endpoint: str, func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking call for an endpoint, mapping limits to HTTP errors."""
+    try:
+        return await request.app.state.runner.run(endpoint, func, *args, **kwargs)
+    except EndpointBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail=f"{endpoint} request timed out")
+
+
+router = APIRouter()
+
+@router.get("/", response_model=Dict[str, str])
 async def root():
     """Root endpoint with API information."""
     return {
@@ -75,12 +159,12 @@ async def root():
         "endpoints": "/docs"
     }
 
-@app.get("/health", response_model=HealthResponse)
-async def health():
+@router.get("/health", response_model=HealthResponse)
+async def health(http_request: Request):
     """Health check endpoint."""
     components = {
         "tidyllm": UnifiedChatManager is not None,
-        "chat_manager": chat_manager is not None,
+        "chat_manager": getattr(http_request.app.state, "chat_manager", None) is not None,
         "corporate_gateway": CorporateLLMGateway is not None
     }
 
@@ -90,9 +174,10 @@ async def health():
         components=components
     )
 
-@app.post("/chat", response_model=ChatResponse)
-async def chat_endpoint(request: ChatRequest):
+@router.post("/chat", response_model=ChatResponse)
+async def chat_endpoint(request: ChatRequest, http_request: Request):
     """Chat with AI models using TidyLLM."""
+    chat_manager = http_request.app.state.chat_manager
     if not chat_manager:
         raise HTTPException(
             status_code=503,
@@ -100,9 +185,10 @@ async def chat_endpoint(request: ChatRequest):
         )
 
     try:
-        # Use TidyLLM chat manager
+        # Use TidyLLM chat manager (blocking - runs on the bounded executor)
         mode = ChatMode(request.mode) if ChatMode else request.mode
-        response = chat_manager.chat(
+        response = await run_blocking(
+            http_request, "chat", chat_manager.chat,
             message=request.message,
             mode=mode,
             model=request.model,
@@ -117,21 +203,148 @@ async def chat_endpoint(request: ChatRequest):
             timestamp=str(datetime.utcnow())
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
 
-@app.post("/qa")
-async def qa_endpoint(request: QARequest):
-    """QA processing endpoint."""
-    # This would integrate with parent-level QA processing
+@router.post("/chat/stream")
+async def chat_stream_endpoint(request: ChatRequest, http_request: Request):
+    """Stream chat tokens as Server-Sent Events.
+    
+    Emits ``data: {"token": ...}`` frames, then an ``event: done`` frame
+    with the token count and time-to-first-byte, or an ``event: error`` frame.
+    """
+    started = time.perf_counter()
+    chat_manager = http_request.app.state.chat_manager
+    if not chat_manager:
+        raise HTTPException(
+            status_code=503,
+            detail="Chat service not available - TidyLLM not properly initialized"
+        )
+
+    mode = ChatMode(request.mode) if ChatMode else request.mode
+    token_factory = lambda: open_token_stream(
+        chat_manager,
+        message=request.message,
+        mode=mode,
+        model=request.model,
+        temperature=request.temperature,
+        max_tokens=request.max_tokens
+    )
+    events = stream_tokens_as_sse(
+        http_request.app.state.runner, "chat_stream", token_factory,
+        http_request.is_disconnected,
+        metrics=http_request.app.state.stream_metrics,
+        started=started
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/chat/stream/metrics")
+async def chat_stream_metrics(http_request: Request):
+    """Time-to-first-byte and completion counters for streamed chats."""
+    return http_request.app.state.stream_metrics.summary()
+
+def _qa_items(request: QARequest) -> List[Dict[str, Any]]:
+    """Normalise a single-document or batch QA request into indexed items."""
+    if request.items:
+        entries = request.items
+    elif request.question and (request.document_path or request.document):
+        entries = [QAItem(document_path=request.document_path, document=request.document,
+                          question=request.question)]
+    else:
+        raise HTTPException(
+            status_code=422,
+            detail="Provide 'items' or a 'question' with 'document_path' or 'document'"
+        )
+
+    items = []
+    for index, entry in enumerate(entries):
+        if not (entry.document_path or entry.document):
+            raise HTTPException(status_code=422, detail=f"Item {index} has no document")
+        # document_path is read in the worker (check_chunk), not on the event loop
+        items.append({
+            "index": index,
+            "document_path": entry.document_path,
+            "question": entry.question,
+            "document": dict(entry.document or {})
+        })
+    return items
+
+def _qa_jobs(http_request: Request) -> QAJobManager:
+    qa_jobs = http_request.app.state.qa_jobs
+    if not qa_jobs:
+        raise HTTPException(
+            status_code=503,
+            detail="QA service not available - tensor logic service not initialized"
+        )
+    return qa_jobs
+
+@router.post("/qa")
+async def qa_endpoint(request: QARequest, http_request: Request):
+    """Check one document or a batch of (document, question) pairs.
+    
+    Batches above the inline limit (or with async_job=true) are queued as a
+    job: poll /qa/jobs/{job_id} and download /qa/jobs/{job_id}/results.
+    """
+    qa_jobs = _qa_jobs(http_request)
+    items = _qa_items(request)
+    if not qa_jobs.settings.document_root and any(item["document_path"] for item in items):
+        raise HTTPException(
+            status_code=400,
+            detail="document_path is not accepted: QA_DOCUMENT_ROOT is not configured; send 'document' inline"
+        )
+    as_job = request.async_job
+    if as_job is None:
+        as_job = len(items) > qa_jobs.settings.sync_batch_limit
+
+    if as_job:
+        job = qa_jobs.submit(items, request.compliance_standard, request.temperature)
+        return JSONResponse(status_code=202, content={
+            **job.progress(),
+            "status_url": f"/qa/jobs/{job.job_id}",
+            "results_url": f"/qa/jobs/{job.job_id}/results"
+        })
+
+    try:
+        results = await qa_jobs.run_inline(items, request.compliance_standard, request.temperature)
+    except EndpointBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="qa request timed out")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"QA failed: {str(e)}")
+
     return {
-        "message": "QA processing endpoint - integration with compliance QA processor",
-        "document": request.document_path,
-        "question": request.question,
-        "mode": request.mode
+        "mode": request.mode,
+        "compliance_standard": request.compliance_standard,
+        "total": len(results),
+        "failed": sum(1 for r in results if r["status"] == "error"),
+        "results": results,
+        "timestamp": str(datetime.utcnow())
     }
 
-@app.get("/models")
+@router.get("/qa/jobs/{job_id}")
+async def qa_job_status(job_id: str, http_request: Request):
+    """Progress of a batch QA job."""
+    job = _qa_jobs(http_request).get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Unknown QA job: {job_id}")
+    return job.progress()
+
+@router.get("/qa/jobs/{job_id}/results")
+async def qa_job_results(job_id: str, http_request: Request):
+    """Stream a job's results as NDJSON, following the job until it finishes."""
+    job = _qa_jobs(http_request).get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Unknown QA job: {job_id}")
+    return StreamingResponse(job.iter_ndjson(), media_type="application/x-ndjson")
+
+@router.get("/models")
 async def list_models():
     """List available AI models."""
     try:
@@ -148,6 +361,9 @@ async def list_models():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Could not list models: {str(e)}")
 
+app = create_app()
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Serve the package module's app (the one `api` and load_test import)
+    uvicorn.run("api.main:app", host="0.0.0.0", port=8000)
\ No newline at end of file
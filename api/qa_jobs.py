@@ -0,0 +1,285 @@
+"""
+QA Batch Jobs
+=============
+
+Runs (document, question) pairs through
+``TensorLogicApplicationService.batch_check_compliance`` on the shared API
+executor.
+
+Small batches are answered inline. Large batches become jobs: the request
+returns a job id immediately, chunks are checked in the background under
+the "qa" concurrency limit, progress can be polled, and results can be
+downloaded as NDJSON while the job is still running.
+
+Limits are read from the environment:
+    QA_SYNC_BATCH_LIMIT     largest batch answered inline (default 20)
+    QA_CHUNK_SIZE           documents per batch_check_compliance call (default 25)
+    QA_JOB_PARALLELISM      chunks of one job checked concurrently (default 2)
+    QA_MAX_RETAINED_JOBS    finished jobs kept for polling (default 100)
+    QA_DOCUMENT_ROOT        directory document_path is resolved in (default: unset)
+
+``document_path`` is client-supplied, so it is only honoured when
+QA_DOCUMENT_ROOT is configured: without a root, requests that use it are
+rejected with 400 and clients must send the document inline. Paths are
+resolved (following symlinks) and must stay inside the root.
+"""
+
+import asyncio
+import json
+import os
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+
+from .concurrency import BlockingCallRunner, EndpointBusyError
+
+
+@dataclass
+class QAJobSettings:
+    """Batch sizing and job retention."""
+    sync_batch_limit: int = 20
+    chunk_size: int = 25
+    job_parallelism: int = 2
+    max_retained_jobs: int = 100
+    document_root: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> "QAJobSettings":
+        settings = cls()
+        settings.sync_batch_limit = int(os.environ.get("QA_SYNC_BATCH_LIMIT", settings.sync_batch_limit))
+        settings.chunk_size = max(1, int(os.environ.get("QA_CHUNK_SIZE", settings.chunk_size)))
+        settings.job_parallelism = max(1, int(os.environ.get("QA_JOB_PARALLELISM", settings.job_parallelism)))
+        settings.max_retained_jobs = int(os.environ.get("QA_MAX_RETAINED_JOBS", settings.max_retained_jobs))
+        settings.document_root = os.environ.get("QA_DOCUMENT_ROOT", settings.document_root)
+        return settings
+
+
+def load_document(item: Dict[str, Any], document_root: Optional[str] = None) -> Dict[str, Any]:
+    """Document dict for a QA item, reading its ``document_path`` if given.
+
+    JSON files are used as the document and other files become
+    ``{"content": text}``; fields of an inline ``document`` override what
+    was read. Paths must stay inside ``document_root``; without a root,
+    ``document_path`` is refused.
+    """
+    document: Dict[str, Any] = {}
+    path = item.get("document_path")
+    if path:
+        if not document_root:
+            raise ValueError("document_path is not accepted: no QA document root is configured")
+        root = Path(document_root).resolve()
+        resolved = (root / path).resolve()
+        if resolved != root and root not in resolved.parents:
+            raise ValueError(f"document_path is outside the QA document root: {path}")
+        text = resolved.read_text(encoding="utf-8")
+        if resolved.suffix.lower() == ".json":
+            loaded = json.loads(text)
+            document = loaded if isinstance(loaded, dict) else {"content": loaded}
+        else:
+            document = {"content": text}
+        document.setdefault("document_path", path)
+    document.update(item.get("document") or {})
+    return document
+
+
+def check_chunk(service: Any, items: List[Dict[str, Any]], compliance_standard: str,
+                temperature: float, document_root: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Check one chunk of QA items and return one result record per item.
+
+    batch_check_compliance drops failed documents from its results and lists
+    them by index in ``errors``; only a service that does not report errors
+    has its chunk re-checked item by item to attribute them.
+    """
+    outcomes: List[Any] = [None] * len(items)
+    loaded = []
+    for position, item in enumerate(items):
+        try:
+            loaded.append((position, load_document(item, document_root)))
+        except (OSError, ValueError) as e:
+            outcomes[position] = (None, f"Could not load document: {e}")
+
+    if loaded:
+        documents = [document for _, document in loaded]
+        questions = [items[position].get("question") for position, _ in loaded]
+        batch = service.batch_check_compliance(documents, compliance_standard, temperature,
+                                               questions=questions)
+        errors = getattr(batch, "errors", None) or {}
+
+        if len(batch.results) + len(errors) == len(loaded):
+            results = iter(batch.results)
+            for offset, (position, _) in enumerate(loaded):
+                outcomes[position] = (None, errors[offset]) if offset in errors else (next(results), None)
+        else:
+            for (position, document), question in zip(loaded, questions):
+                try:
+                    outcomes[position] = (service.check_compliance(document, compliance_standard,
+                                                                   temperature, question=question), None)
+                except Exception as e:
+                    outcomes[position] = (None, str(e))
+
+    records = []
+    for item, (result, error) in zip(items, outcomes):
+        record = {
+            "index": item["index"],
+            "document_path": item.get("document_path"),
+            "question": item.get("question"),
+            "compliance_standard": compliance_standard
+        }
+        if error is None:
+            record["status"] = "ok"
+            record["result"] = result.to_dict()
+        else:
+            record["status"] = "error"
+            record["error"] = error
+        records.append(record)
+    return records
+
+
+@dataclass
+class QAJob:
+    """Progress and results of one batch QA job."""
+    job_id: str
+    total: int
+    compliance_standard: str
+    temperature: float
+    status: str = "queued"
+    processed: int = 0
+    failed: int = 0
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    finished_at: Optional[str] = None
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    def progress(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "total": self.total,
+            "processed": self.processed,
+            "failed": self.failed,
+            "progress": round(self.processed / self.total, 4) if self.total else 1.0,
+            "compliance_standard": self.compliance_standard,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "error": self.error
+        }
+
+    def _notify(self):
+        # Wake current readers and arm a fresh event for the next change
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def iter_ndjson(self) -> AsyncIterator[str]:
+        """Yield result lines as they become available until the job finishes."""
+        sent = 0
+        while True:
+            changed = self._changed
+            while sent < len(self.results):
+                # Results hold enums and datetimes; encode them as the JSON endpoints do
+                yield json.dumps(jsonable_encoder(self.results[sent])) + "\n"
+                sent += 1
+            if self.done:
+                return
+            await changed.wait()
+
+
+class QAJobManager:
+    """Run QA batches inline or as background jobs on the API runner."""
+
+    def __init__(self, runner: BlockingCallRunner, service: Any,
+                 settings: Optional[QAJobSettings] = None):
+        self.runner = runner
+        self.service = service
+        self.settings = settings or QAJobSettings.from_env()
+        self.jobs: "OrderedDict[str, QAJob]" = OrderedDict()
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def _chunks(self, items: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        size = self.settings.chunk_size
+        return [items[i:i + size] for i in range(0, len(items), size)]
+
+    async def run_inline(self, items: List[Dict[str, Any]], compliance_standard: str,
+                         temperature: float) -> List[Dict[str, Any]]:
+        """Check a small batch within the request."""
+        records = []
+        for chunk in self._chunks(items):
+            records.extend(await self.runner.run(
+                "qa", check_chunk, self.service, chunk, compliance_standard, temperature,
+                self.settings.document_root
+            ))
+        return records
+
+    def submit(self, items: List[Dict[str, Any]], compliance_standard: str,
+               temperature: float) -> QAJob:
+        """Start a background job and return it immediately."""
+        job = QAJob(job_id=uuid.uuid4().hex, total=len(items),
+                    compliance_standard=compliance_standard, temperature=temperature)
+        self.jobs[job.job_id] = job
+        self._evict_finished()
+        self._tasks[job.job_id] = asyncio.create_task(self._run_job(job, items))
+        return job
+
+    def get(self, job_id: str) -> Optional[QAJob]:
+        return self.jobs.get(job_id)
+
+    async def _run_job(self, job: QAJob, items: List[Dict[str, Any]]):
+        job.status = "running"
+        job._notify()
+        pending = iter(self._chunks(items))
+
+        async def worker():
+            for chunk in pending:
+                try:
+                    while True:
+                        try:
+                            records = await self.runner.run(
+                                "qa", check_chunk, self.service, chunk,
+                                job.compliance_standard, job.temperature,
+                                self.settings.document_root
+                            )
+                            break
+                        except EndpointBusyError:
+                            continue  # Background jobs wait for a slot instead of failing
+                except Exception as e:
+                    # Timeouts and service errors fail the chunk, not the job
+                    reason = "timed out" if isinstance(e, asyncio.TimeoutError) else str(e)
+                    records = [{"index": item["index"], "document_path": item.get("document_path"),
+                                "question": item.get("question"),
+                                "compliance_standard": job.compliance_standard, "status": "error",
+                                "error": f"Chunk failed: {reason}"} for item in chunk]
+                job.results.extend(records)
+                job.processed += len(records)
+                job.failed += sum(1 for r in records if r["status"] == "error")
+                job._notify()
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(self.settings.job_parallelism)))
+            job.status = "completed"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.utcnow().isoformat()
+            job._notify()
+            self._tasks.pop(job.job_id, None)
+
+    def _evict_finished(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.done]
+        excess = len(self.jobs) - self.settings.max_retained_jobs
+        for job_id in finished[:max(0, excess)]:
+            del self.jobs[job_id]
+
+    async def shutdown(self):
+        for task in list(self._tasks.values()):
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
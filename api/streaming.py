@@ -0,0 +1,191 @@
+"""
+Chat Token Streaming
+====================
+
+Server-Sent Events support for /chat/stream.
+
+The chat manager's token generator is blocking, so it is drained on the
+shared API executor and tokens are handed to the event loop through an
+asyncio queue. When the client goes away the producer is told to stop and
+the generator is closed, so an abandoned request stops pulling tokens
+from the model.
+
+Chat managers may expose ``stream_chat(message, **kwargs)`` yielding text
+chunks. Managers without it fall back to a single ``chat()`` call whose
+response is sent as one event, so the endpoint works with any manager.
+
+Offline use:
+    app = create_app(chat_manager_factory=lambda: FakeTokenSource(delay_seconds=0.05))
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional
+
+from .concurrency import BlockingCallRunner, EndpointBusyError
+
+_DONE = object()
+
+
+def sse_event(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Format one Server-Sent Event frame."""
+    lines = []
+    if event:
+        lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def open_token_stream(chat_manager: Any, **chat_kwargs) -> Iterator[str]:
+    """Return a blocking iterator of response chunks for a chat request."""
+    stream_chat = getattr(chat_manager, "stream_chat", None)
+    if callable(stream_chat):
+        return iter(stream_chat(**chat_kwargs))
+    return iter([chat_manager.chat(**chat_kwargs)])
+
+
+class FakeTokenSource:
+    """Offline chat manager that streams a canned answer word by word."""
+
+    def __init__(self, text: Optional[str] = None, delay_seconds: float = 0.02,
+                 first_token_delay: Optional[float] = None):
+        self.text = text or ("This is a streamed response from the fake token source, "
+                             "used to exercise the chat streaming endpoint offline.")
+        self.delay_seconds = delay_seconds
+        self.first_token_delay = delay_seconds if first_token_delay is None else first_token_delay
+        self.calls = 0
+        self.tokens_emitted = 0
+        self.closed_early = 0
+
+    def stream_chat(self, message: str, **kwargs) -> Iterator[str]:
+        self.calls += 1
+        words = self.text.split(" ")
+        finished = False
+        try:
+            for index, word in enumerate(words):
+                time.sleep(self.first_token_delay if index == 0 else self.delay_seconds)
+                self.tokens_emitted += 1
+                yield word if index == 0 else " " + word
+            finished = True
+        finally:
+            if not finished:
+                self.closed_early += 1
+
+    def chat(self, message: str, **kwargs) -> str:
+        return "".join(self.stream_chat(message, **kwargs))
+
+
+class StreamMetrics:
+    """Rolling time-to-first-byte and completion counters for streamed chats."""
+
+    def __init__(self, window: int = 1000):
+        self.ttfb_ms = deque(maxlen=window)
+        self.completed = 0
+        self.disconnected = 0
+        self.failed = 0
+
+    def record_ttfb(self, seconds: float):
+        self.ttfb_ms.append(seconds * 1000)
+
+    def summary(self) -> Dict[str, Any]:
+        samples = sorted(self.ttfb_ms)
+
+        def pct(p: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))]
+
+        return {
+            "completed": self.completed,
+            "disconnected": self.disconnected,
+            "failed": self.failed,
+            "ttfb_samples": len(samples),
+            "ttfb_p50_ms": round(pct(50), 2),
+            "ttfb_p99_ms": round(pct(99), 2)
+        }
+
+
+async def stream_tokens_as_sse(runner: BlockingCallRunner, endpoint: str, token_factory: Callable[[], Iterator[str]],
+                               is_disconnected: Callable[[], Any],
+                               metrics: Optional[StreamMetrics] = None,
+                               started: Optional[float] = None) -> AsyncIterator[str]:
+    """Drive a blocking token iterator on the runner's executor and yield SSE frames.
+
+    ``token_factory`` is called on the executor thread, so manager calls that
+    block before the first token never run on the event loop.
+    """
+    started = time.perf_counter() if started is None else started
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    cancel = threading.Event()
+
+    def produce():
+        tokens = None
+        try:
+            tokens = token_factory()
+            for token in tokens:
+                if cancel.is_set():
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, token)
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+        finally:
+            close = getattr(tokens, "close", None)
+            if close:
+                close()  # Lets the model client abort the upstream request
+            loop.call_soon_threadsafe(queue.put_nowait, _DONE)
+
+    try:
+        async with runner.slot(endpoint):
+            deadline = started + runner.timeout_for(endpoint)
+            loop.run_in_executor(runner.executor, produce)
+            token_count = 0
+            ttfb = None
+            outcome = "disconnected"
+            try:
+                while True:
+                    # Checked every iteration so a source that keeps emitting still times out
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        outcome = "failed"
+                        runner.stats[endpoint]["timeouts"] += 1
+                        yield sse_event({"error": f"{endpoint} request timed out"}, event="error")
+                        return
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout=min(0.5, remaining))
+                    except asyncio.TimeoutError:
+                        if await is_disconnected():
+                            return
+                        continue
+
+                    if item is _DONE:
+                        break
+                    if isinstance(item, Exception):
+                        outcome = "failed"
+                        yield sse_event({"error": f"Chat failed: {item}"}, event="error")
+                        return
+
+                    if ttfb is None:
+                        ttfb = time.perf_counter() - started
+                        if metrics:
+                            metrics.record_ttfb(ttfb)
+                    token_count += 1
+                    yield sse_event({"token": item})
+
+                outcome = "completed"
+                runner.stats[endpoint]["completed"] += 1
+                yield sse_event({
+                    "tokens": token_count,
+                    "ttfb_ms": round(ttfb * 1000, 2) if ttfb is not None else None,
+                    "total_ms": round((time.perf_counter() - started) * 1000, 2)
+                }, event="done")
+            finally:
+                # Also reached when a disconnect cancels this generator mid-stream
+                cancel.set()
+                if metrics:
+                    setattr(metrics, outcome, getattr(metrics, outcome) + 1)
+    except EndpointBusyError as e:
+        yield sse_event({"error": str(e)}, event="error")
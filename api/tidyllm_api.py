@@ -23,9 +23,46 @@ Basic Usage:
     answer = tidyllm.query("What is machine learning?")
 """
 
+import threading
 from typing import List, Dict, Any
 from datetime import datetime
 
+# Shared per-process managers - built once, reused by every call
+_managers: Dict[str, Any] = {}
+_managers_lock = threading.Lock()
+
+
+def _get_manager(name: str, factory):
+    manager = _managers.get(name)
+    if manager is None:
+        with _managers_lock:
+            manager = _managers.get(name)
+            if manager is None:
+                manager = _managers[name] = factory()
+    return manager
+
+
+def get_chat_manager():
+    """Return the process-wide UnifiedChatManager."""
+    def build():
+        from tidyllm.services import UnifiedChatManager
+        return UnifiedChatManager()
+    return _get_manager("chat", build)
+
+
+def get_rag_manager():
+    """Return the process-wide UnifiedRAGManager."""
+    def build():
+        from tidyllm.services import UnifiedRAGManager
+        return UnifiedRAGManager()
+    return _get_manager("rag", build)
+
+
+def reset_managers():
+    """Drop cached managers (e.g. after configuration changes or in a new worker)."""
+    with _managers_lock:
+        _managers.clear()
+
 # Basic API functions
 def chat(message: str, chat_type: str = "rag", model_name: str = "claude-3-sonnet",
          temperature: float = 0.7, reasoning: bool = False, **kwargs):
@@ -55,9 +92,9 @@ def chat(message: str, chat_type: str = "rag", model_name: str = "claude-3-sonne
     """
     try:
         # Use UnifiedChatManager for all chat processing
-        from tidyllm.services import UnifiedChatManager, ChatMode
+        from tidyllm.services import ChatMode
 
-        chat_manager = UnifiedChatManager()
+        chat_manager = get_chat_manager()
 
         # Map string types to ChatMode enums
         mode_mapping = {
@@ -97,8 +134,8 @@ def chat(message: str, chat_type: str = "rag", model_name: str = "claude-3-sonne
 def query(question: str, context: str = None, **kwargs) -> str:
     """Query with optional context using V3 RAG services."""
     try:
-        from tidyllm.services import UnifiedRAGManager, RAGSystemType
-        rag_manager = UnifiedRAGManager()
+        from tidyllm.services import RAGSystemType
+        rag_manager = get_rag_manager()
         result = rag_manager.query(
             system_type=RAGSystemType.INTELLIGENT,
             query=question,
@@ -152,9 +189,8 @@ def list_models(**kwargs) -> List[Dict[str, Any]]:
     """List all available AI models across backends."""
     try:
         # from .gateways.ai_processing_gateway import AIProcessingGateway  # V1 DEPRECATED
-        from tidyllm.services import UnifiedRAGManager  # Use V3 services
         # Use V3 services instead of V1 gateways
-        rag_manager = UnifiedRAGManager()
+        rag_manager = get_rag_manager()
         status = rag_manager.health_check()
 
         # Transform into expected format
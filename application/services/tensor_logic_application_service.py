@@ -96,7 +96,8 @@ class TensorLogicApplicationService:
         self,
         document: Dict[str, Any],
         compliance_standard: str = 'MVS_5.4.3',
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        question: Optional[str] = None
     ) -> InferenceResult:
         """
         Use case: Check document compliance against standard.
@@ -105,6 +106,7 @@ class TensorLogicApplicationService:
             document: Document to check
             compliance_standard: Standard to check against (e.g., 'MVS_5.4.3')
             temperature: Reasoning temperature (default 0.0 for certifiable)
+            question: Question to answer (default: is the document compliant)
 
         Returns:
             InferenceResult with compliance assessment
@@ -112,7 +114,7 @@ class TensorLogicApplicationService:
         logger.info(f"Checking compliance: standard={compliance_standard}, T={temperature}")
 
         result = self.tensor_logic_service.infer(
-            query=f"Is this document {compliance_standard} compliant?",
+            query=question or f"Is this document {compliance_standard} compliant?",
             context={
                 'document': document,
                 'compliance_standard': compliance_standard
@@ -269,7 +271,8 @@ class TensorLogicApplicationService:
         self,
         documents: List[Dict[str, Any]],
         compliance_standard: str = 'MVS_5.4.3',
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        questions: Optional[List[Optional[str]]] = None
     ) -> BatchInferenceResult:
         """
         Use case: Check multiple documents in batch.
@@ -278,15 +281,18 @@ class TensorLogicApplicationService:
             documents: List of documents
             compliance_standard: Standard to check against
             temperature: Reasoning temperature
+            questions: Per-document questions (default: is the document compliant)
 
         Returns:
-            BatchInferenceResult with all results
+            BatchInferenceResult with all results; failed documents are
+            listed by index in ``errors``
         """
         logger.info(f"Batch compliance check: {len(documents)} documents")
 
+        questions = questions or [None] * len(documents)
         queries = [
-            f"Is this document {compliance_standard} compliant?"
-            for _ in documents
+            question or f"Is this document {compliance_standard} compliant?"
+            for question in questions
         ]
 
         contexts = [
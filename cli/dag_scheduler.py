@@ -0,0 +1,383 @@
+"""
+RAG2DAG Concurrent Scheduler
+============================
+
+Executes a RAG2DAG workflow's ``dag_nodes`` concurrently.
+
+Nodes are topologically ordered from their ``input_from`` edges and every
+node whose inputs are complete is dispatched to a worker pool bounded by
+``max_parallel_nodes``. A failed node cancels all of its transitive
+dependents while independent branches keep running. Completed node outputs
+are checkpointed after every node so a rerun into the same output directory
+resumes where the last run stopped.
+
+Usage:
+    scheduler = ConcurrentDAGScheduler(run_node, max_parallel_nodes=8,
+                                       checkpoint=DAGCheckpoint(output_dir / "checkpoint.json"))
+    run = scheduler.execute(workflow)
+    print(run.summary())
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# node_runner(node, inputs, workflow) -> output; inputs maps dependency node_id -> output
+NodeRunner = Callable[[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Any]
+
+
+def _file_identity(path: str) -> List[Any]:
+    try:
+        stat = os.stat(path)
+        return [str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns]
+    except OSError:
+        return [str(path), None, None]
+
+
+def node_fingerprint(node: Dict[str, Any], inputs: Optional[Dict[str, Any]] = None,
+                     workflow: Optional[Dict[str, Any]] = None) -> str:
+    """Hash everything that determines a node's output.
+
+    That is the node definition, its upstream outputs, and the workflow's
+    ``query`` and ``input_files`` (by path, size and modification time).
+    """
+    workflow = workflow or {}
+    material = json.dumps({
+        'operation': node.get('operation'),
+        'model_id': node.get('model_id'),
+        'instruction': node.get('instruction'),
+        'input_from': sorted(node.get('input_from') or []),
+        'inputs': inputs or {},
+        'query': workflow.get('query'),
+        'input_files': [_file_identity(path) for path in workflow.get('input_files') or []]
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+def topological_order(nodes: List[Dict[str, Any]]) -> List[str]:
+    """Return node ids in dependency order (declaration order among peers).
+
+    Raises:
+        ValueError: unknown dependency or dependency cycle
+    """
+    order_index = {node['node_id']: i for i, node in enumerate(nodes)}
+    indegree = {node_id: 0 for node_id in order_index}
+    dependents: Dict[str, List[str]] = {node_id: [] for node_id in order_index}
+    for node in nodes:
+        for dep in node.get('input_from') or []:
+            if dep not in order_index:
+                raise ValueError(f"Node {node['node_id']} depends on unknown node {dep}")
+            indegree[node['node_id']] += 1
+            dependents[dep].append(node['node_id'])
+
+    ready = sorted((n for n, d in indegree.items() if d == 0), key=order_index.get)
+    ordered = []
+    while ready:
+        node_id = ready.pop(0)
+        ordered.append(node_id)
+        for child in dependents[node_id]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                ready.append(child)
+        ready.sort(key=order_index.get)
+
+    if len(ordered) != len(nodes):
+        cyclic = sorted(set(order_index) - set(ordered))
+        raise ValueError(f"Dependency cycle between nodes: {', '.join(cyclic)}")
+    return ordered
+
+
+class DAGCheckpoint:
+    """JSON checkpoint of completed node outputs, rewritten atomically."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text(encoding='utf-8')).get('nodes', {})
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def lookup(self, node: Dict[str, Any], inputs: Dict[str, Any],
+               workflow: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the checkpointed entry if the node and everything it read are unchanged."""
+        entry = self.entries.get(node['node_id'])
+        if entry and entry.get('fingerprint') == node_fingerprint(node, inputs, workflow):
+            return entry
+        return None
+
+    def record(self, node: Dict[str, Any], inputs: Dict[str, Any], workflow: Dict[str, Any],
+               output: Any, duration: float):
+        try:
+            json.dumps(output)
+        except (TypeError, ValueError):
+            output = str(output)
+        self.entries[node['node_id']] = {
+            'fingerprint': node_fingerprint(node, inputs, workflow),
+            'output': output,
+            'duration_seconds': round(duration, 3),
+            'completed_at': datetime.now().isoformat()
+        }
+        self._write()
+
+    def _write(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+                json.dump({'nodes': self.entries}, handle, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+@dataclass
+class DAGNodeResult:
+    """Outcome of one node."""
+    node_id: str
+    status: str  # completed, failed, cancelled
+    output: Any = None
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+    from_checkpoint: bool = False
+
+
+@dataclass
+class DAGRunResult:
+    """Outcome of a workflow run."""
+    workflow_id: str
+    max_parallel_nodes: int
+    nodes: Dict[str, DAGNodeResult] = field(default_factory=dict)
+    wall_time_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return all(r.status == 'completed' for r in self.nodes.values())
+
+    def count(self, status: str) -> int:
+        return sum(1 for r in self.nodes.values() if r.status == status)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'workflow_id': self.workflow_id,
+            'max_parallel_nodes': self.max_parallel_nodes,
+            'wall_time_seconds': round(self.wall_time_seconds, 3),
+            'completed': self.count('completed'),
+            'failed': self.count('failed'),
+            'cancelled': self.count('cancelled'),
+            'resumed_from_checkpoint': sum(1 for r in self.nodes.values() if r.from_checkpoint)
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.summary(),
+            'nodes': {
+                node_id: {
+                    'status': r.status,
+                    'output': r.output,
+                    'error': r.error,
+                    'duration_seconds': round(r.duration_seconds, 3),
+                    'from_checkpoint': r.from_checkpoint
+                }
+                for node_id, r in self.nodes.items()
+            }
+        }
+
+
+class ConcurrentDAGScheduler:
+    """Run DAG nodes on a bounded worker pool as their inputs become ready."""
+
+    def __init__(self, node_runner: NodeRunner, max_parallel_nodes: int = 3,
+                 checkpoint: Optional[DAGCheckpoint] = None,
+                 on_node_done: Optional[Callable[[DAGNodeResult], None]] = None):
+        self.node_runner = node_runner
+        self.max_parallel_nodes = max(1, max_parallel_nodes)
+        self.checkpoint = checkpoint
+        self.on_node_done = on_node_done
+        self._stop = threading.Event()
+
+    def stop(self):
+        """Stop dispatching new nodes; running nodes finish, the rest are cancelled."""
+        self._stop.set()
+
+    def execute(self, workflow: Dict[str, Any]) -> DAGRunResult:
+        nodes = {node['node_id']: node for node in workflow.get('dag_nodes', [])}
+        order = topological_order(list(nodes.values()))
+        position = {node_id: i for i, node_id in enumerate(order)}
+        dependents: Dict[str, List[str]] = {node_id: [] for node_id in nodes}
+        for node in nodes.values():
+            for dep in node.get('input_from') or []:
+                dependents[dep].append(node['node_id'])
+
+        run = DAGRunResult(workflow_id=workflow.get('workflow_id', ''),
+                           max_parallel_nodes=self.max_parallel_nodes)
+        outputs: Dict[str, Any] = {}
+        waiting = {node_id: set(nodes[node_id].get('input_from') or []) for node_id in order}
+        started = time.perf_counter()
+
+        def finish(result: DAGNodeResult) -> List[str]:
+            """Record a result and return dependents that became ready."""
+            run.nodes[result.node_id] = result
+            if self.on_node_done:
+                self.on_node_done(result)
+            if result.status != 'completed':
+                self._cancel_dependents(result.node_id, dependents, run)
+                return []
+            outputs[result.node_id] = result.output
+            newly_ready = []
+            for child in dependents[result.node_id]:
+                pending = waiting.get(child)
+                if pending is None:
+                    continue
+                pending.discard(result.node_id)
+                if not pending:
+                    newly_ready.append(child)
+            return newly_ready
+
+        ready: List[str] = []
+        for node_id in order:
+            if node_id in run.nodes or waiting[node_id]:
+                continue
+            ready.append(node_id)
+
+        # Resume: replay checkpointed nodes without running them
+        resumed = True
+        while resumed and self.checkpoint:
+            resumed = False
+            for node_id in list(ready):
+                node = nodes[node_id]
+                inputs = {dep: outputs[dep] for dep in node.get('input_from') or []}
+                entry = self.checkpoint.lookup(node, inputs, workflow)
+                if entry is None:
+                    continue
+                ready.remove(node_id)
+                del waiting[node_id]
+                ready.extend(finish(DAGNodeResult(node_id=node_id, status='completed',
+                                                  output=entry['output'],
+                                                  duration_seconds=entry.get('duration_seconds', 0.0),
+                                                  from_checkpoint=True)))
+                resumed = True
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel_nodes,
+                                thread_name_prefix='rag2dag-node') as pool:
+            in_flight = {}
+            while ready or in_flight:
+                ready.sort(key=position.get)
+                while ready and len(in_flight) < self.max_parallel_nodes and not self._stop.is_set():
+                    node_id = ready.pop(0)
+                    del waiting[node_id]
+                    node = nodes[node_id]
+                    inputs = {dep: outputs[dep] for dep in node.get('input_from') or []}
+                    in_flight[pool.submit(self._run_node, node, inputs, workflow)] = (node_id, inputs)
+
+                if not in_flight:
+                    break  # Stopped with nothing running
+
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    node_id, inputs = in_flight.pop(future)
+                    result = future.result()
+                    if result.status == 'completed' and self.checkpoint:
+                        self.checkpoint.record(nodes[node_id], inputs, workflow,
+                                               result.output, result.duration_seconds)
+                    ready.extend(finish(result))
+
+        # Anything never dispatched (stop requested) is cancelled
+        for node_id in order:
+            if node_id not in run.nodes:
+                run.nodes[node_id] = DAGNodeResult(node_id=node_id, status='cancelled',
+                                                   error='Execution stopped')
+        run.nodes = {node_id: run.nodes[node_id] for node_id in order}
+        run.wall_time_seconds = time.perf_counter() - started
+        return run
+
+    def _run_node(self, node: Dict[str, Any], inputs: Dict[str, Any],
+                  workflow: Dict[str, Any]) -> DAGNodeResult:
+        started = time.perf_counter()
+        try:
+            output = self.node_runner(node, inputs, workflow)
+            return DAGNodeResult(node_id=node['node_id'], status='completed', output=output,
+                                 duration_seconds=time.perf_counter() - started)
+        except Exception as e:
+            return DAGNodeResult(node_id=node['node_id'], status='failed', error=str(e),
+                                 duration_seconds=time.perf_counter() - started)
+
+    @staticmethod
+    def _cancel_dependents(node_id: str, dependents: Dict[str, List[str]], run: DAGRunResult):
+        stack = list(dependents[node_id])
+        while stack:
+            child = stack.pop()
+            if child in run.nodes:
+                continue
+            run.nodes[child] = DAGNodeResult(node_id=child, status='cancelled',
+                                             error=f"Upstream node {node_id} did not complete")
+            stack.extend(dependents[child])
+
+
+def stub_node_runner(latency_seconds: float = 0.2, fail_nodes: Optional[List[str]] = None) -> NodeRunner:
+    """Model-free node runner that sleeps like a Bedrock call."""
+    fail_nodes = set(fail_nodes or [])
+
+    def run(node: Dict[str, Any], inputs: Dict[str, Any], workflow: Dict[str, Any]) -> str:
+        time.sleep(latency_seconds)
+        if node['node_id'] in fail_nodes:
+            raise RuntimeError(f"stub failure in {node['node_id']}")
+        return f"{node.get('operation', 'node')} output ({len(inputs)} inputs)"
+
+    return run
+
+
+def model_node_runner(invoke: Callable[..., Optional[str]]) -> NodeRunner:
+    """Node runner that prompts a text model with the node's instruction.
+
+    The prompt adds the workflow query, its input files and the upstream
+    outputs. ``invoke(prompt, model_id=...)`` returns the generated text or
+    None on failure (as ``BedrockService.invoke_model`` does).
+    """
+    def run(node: Dict[str, Any], inputs: Dict[str, Any], workflow: Dict[str, Any]) -> str:
+        sections = [node.get('instruction', '')]
+        if workflow.get('query'):
+            sections.append(f"Question: {workflow['query']}")
+        if workflow.get('input_files'):
+            sections.append("Input files:\n" + "\n".join(f"- {path}" for path in workflow['input_files']))
+        for dep, output in inputs.items():
+            sections.append(f"Output of {dep}:\n{output}")
+        text = invoke("\n\n".join(sections), model_id=node.get('model_id'))
+        if text is None:
+            raise RuntimeError(f"Model {node.get('model_id')} returned no output")
+        return text
+
+    return run
+
+
+def _demo_workflow(fan_out: int = 8) -> Dict[str, Any]:
+    """Extract -> N parallel analyses -> synthesis, the shape of the multi-document patterns."""
+    nodes = [{'node_id': 'extract', 'operation': 'extract', 'model_id': 'stub.haiku',
+              'instruction': 'Extract sections', 'input_from': [], 'parallel_group': None}]
+    for i in range(fan_out):
+        nodes.append({'node_id': f'analyze_{i}', 'operation': 'analyze', 'model_id': 'stub.haiku',
+                      'instruction': f'Analyze section {i}', 'input_from': ['extract'],
+                      'parallel_group': 'analysis'})
+    nodes.append({'node_id': 'synthesize', 'operation': 'synthesize', 'model_id': 'stub.sonnet',
+                  'instruction': 'Synthesize findings',
+                  'input_from': [f'analyze_{i}' for i in range(fan_out)], 'parallel_group': None})
+    return {'workflow_id': 'wf_demo', 'dag_nodes': nodes}
+
+
+if __name__ == "__main__":
+    workflow = _demo_workflow(fan_out=8)
+    for parallel in (1, 3, 8):
+        run = ConcurrentDAGScheduler(stub_node_runner(0.2), max_parallel_nodes=parallel).execute(workflow)
+        print(f"max_parallel_nodes={parallel}: {run.wall_time_seconds:.2f}s "
+              f"({run.count('completed')}/{len(run.nodes)} completed)")
@@ -17,6 +17,7 @@ from datetime import datetime
 from .converter import RAG2DAGConverter, RAGPatternType
 from .config import RAG2DAGConfig, BedrockModel
 from .executor import DAGExecutor
+from .dag_scheduler import ConcurrentDAGScheduler, DAGCheckpoint, model_node_runner, stub_node_runner
 
 
 class RAG2DAGCLI:
@@ -67,6 +68,8 @@ Examples:
                                  help='Preview workflow without execution')
         create_parser.add_argument('--wait', action='store_true',
                                  help='Wait for completion and show results')
+        create_parser.add_argument('--stub-nodes', type=float, metavar='SECONDS',
+                                 help='Run nodes with a stub model of the given latency (no Bedrock calls)')
         
         # Interactive mode
         interactive_parser = subparsers.add_parser('interactive', help='Interactive workflow builder')
@@ -205,6 +208,10 @@ Examples:
         output_dir = Path(args.output) if args.output else Path(f"results/{workflow_id}")
         output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Node fingerprints include these, so a resume reruns nodes whose inputs changed
+        workflow.setdefault('query', args.query)
+        workflow.setdefault('input_files', files)
+        
         workflow_file = output_dir / "workflow.json"
         with open(workflow_file, 'w') as f:
             json.dump(workflow, f, indent=2)
@@ -213,14 +220,69 @@ Examples:
         print(f"Results will be saved to: {output_dir}")
         
         if args.wait:
-            print("\nExecuting workflow...")
-            # TODO: Implement actual execution
-            print("Workflow execution not yet implemented")
-            return 0
+            return self._execute_workflow(workflow, output_dir, args.stub_nodes)
         else:
             print("\nUse 'tidyllm rag2dag status' to monitor progress")
             return 0
     
+    def _execute_workflow(self, workflow: Dict[str, Any], output_dir: Path,
+                          stub_latency: Optional[float] = None) -> int:
+        """Run the DAG concurrently, checkpointing into output_dir so reruns resume."""
+        max_parallel = workflow['execution_plan'].get('max_parallel_nodes') or self.config.max_parallel_nodes
+        node_runner = self._node_runner(stub_latency)
+        if node_runner is None:
+            print("\nBedrock is not available, so nodes cannot be executed. "
+                  "Use --stub-nodes SECONDS to run the scheduler without model calls.")
+            return 1
+        
+        def report(result):
+            source = " (checkpoint)" if result.from_checkpoint else ""
+            detail = f" - {result.error}" if result.error else ""
+            print(f"  [{result.status.upper()}] {result.node_id} "
+                  f"{result.duration_seconds:.1f}s{source}{detail}")
+        
+        print(f"\nExecuting workflow ({max_parallel} max parallel)...")
+        scheduler = ConcurrentDAGScheduler(
+            node_runner,
+            max_parallel_nodes=max_parallel,
+            checkpoint=DAGCheckpoint(output_dir / "checkpoint.json"),
+            on_node_done=report
+        )
+        try:
+            run = scheduler.execute(workflow)
+        except KeyboardInterrupt:
+            scheduler.stop()
+            raise
+        
+        with open(output_dir / "results.json", 'w') as f:
+            json.dump(run.to_dict(), f, indent=2, default=str)
+        
+        summary = run.summary()
+        print(f"\nExecution finished in {summary['wall_time_seconds']}s: "
+              f"{summary['completed']} completed, {summary['failed']} failed, "
+              f"{summary['cancelled']} cancelled")
+        if not run.succeeded:
+            print("Rerun the same command with --output to resume from the checkpoint")
+        return 0 if run.succeeded else 1
+    
+    def _node_runner(self, stub_latency: Optional[float] = None):
+        """Per-node runner: stub, the DAG executor's execute_node, or Bedrock (None if unavailable)."""
+        if stub_latency is not None:
+            return stub_node_runner(stub_latency)
+        
+        execute_node = getattr(self.executor, 'execute_node', None)
+        if execute_node is not None:
+            return lambda node, inputs, workflow: execute_node(node, inputs)
+        
+        try:
+            from infrastructure.services.bedrock_service import get_bedrock_service
+        except ImportError:
+            return None
+        bedrock = get_bedrock_service()
+        if not bedrock.is_available():
+            return None
+        return model_node_runner(bedrock.invoke_model)
+    
     def handle_interactive(self, args) -> int:
         """Handle interactive workflow builder."""
         print("RAG2DAG Interactive Workflow Builder")
@@ -398,8 +460,9 @@ Examples:
         elif config_name == 'quality':
             self.config = RAG2DAGConfig.create_quality_config()
         
-        # Recreate converter with new config
+        # Recreate converter and executor with new config
         self.converter = RAG2DAGConverter(self.config)
+        self.executor = DAGExecutor(self.config)
     
     def _interactive_file_selection(self) -> List[str]:
         """Interactive file selection."""
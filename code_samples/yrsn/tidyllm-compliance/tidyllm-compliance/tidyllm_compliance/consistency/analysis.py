@@ -10,8 +10,46 @@ Monitor argument consistency for determining review scope based on:
 Part of the tidyllm-verse: Educational ML with complete transparency
 """
 
-import re
-from typing import Dict, List, Tuple, Any
+import copy
+from typing import Dict, List, Tuple, Any, Union
+
+from ..document_context import DocumentAnalysisContext, compile_lexicon, compile_pattern
+from ..pattern_matcher import findall_item
+
+CONSISTENCY_FRAMEWORK = {
+    'logical_structure_patterns': {
+        'premise_indicators': r'(?:because|since|given that|assuming|based on)',
+        'conclusion_indicators': r'(?:therefore|thus|hence|consequently|as a result)',
+        'evidence_indicators': r'(?:evidence shows|data indicates|research demonstrates)',
+        'qualification_indicators': r'(?:however|although|despite|nevertheless|on the other hand)'
+    },
+    
+    'scope_determination_criteria': {
+        'materiality_indicators': r'(?:material|significant|substantial|major impact)',
+        'risk_level_indicators': r'(?:high risk|critical|urgent|immediate attention)',
+        'regulatory_indicators': r'(?:regulatory|compliance|legal requirement|mandatory)',
+        'financial_impact_indicators': r'(?:\$[\d,]+|[\d]+%|material impact|financial exposure)'
+    },
+    
+    'consistency_checks': {
+        'internal_contradictions': [
+            (r'(?:always|never|all|none)', r'(?:sometimes|may|might|could)'),
+            (r'(?:increase|grow|expand)', r'(?:decrease|shrink|reduce)'),
+            (r'(?:approve|accept|endorse)', r'(?:reject|deny|oppose)')
+        ],
+        
+        'temporal_consistency': [
+            r'(?:before|after|during|while)[\s\w]*\d{4}',
+            r'(?:previous|current|future|next)[\s\w]*(?:year|quarter|month)'
+        ],
+        
+        'quantitative_consistency': [
+            r'\$?[\d,]+\.?\d*[kmb]?',  # Monetary amounts
+            r'\d+\.?\d*%',  # Percentages
+            r'[\d,]+\s*(?:units|items|cases|samples)'  # Quantities
+        ]
+    }
+}
 
 class ConsistencyAnalyzer:
     """Monitor argument consistency for determining review scope."""
@@ -20,44 +58,14 @@ class ConsistencyAnalyzer:
         self.consistency_framework = self._initialize_consistency_framework()
         
     def _initialize_consistency_framework(self) -> Dict[str, Any]:
-        """Initialize argument consistency analysis framework."""
-        return {
-            'logical_structure_patterns': {
-                'premise_indicators': r'(?:because|since|given that|assuming|based on)',
-                'conclusion_indicators': r'(?:therefore|thus|hence|consequently|as a result)',
-                'evidence_indicators': r'(?:evidence shows|data indicates|research demonstrates)',
-                'qualification_indicators': r'(?:however|although|despite|nevertheless|on the other hand)'
-            },
-            
-            'scope_determination_criteria': {
-                'materiality_indicators': r'(?:material|significant|substantial|major impact)',
-                'risk_level_indicators': r'(?:high risk|critical|urgent|immediate attention)',
-                'regulatory_indicators': r'(?:regulatory|compliance|legal requirement|mandatory)',
-                'financial_impact_indicators': r'(?:\$[\d,]+|[\d]+%|material impact|financial exposure)'
-            },
-            
-            'consistency_checks': {
-                'internal_contradictions': [
-                    (r'(?:always|never|all|none)', r'(?:sometimes|may|might|could)'),
-                    (r'(?:increase|grow|expand)', r'(?:decrease|shrink|reduce)'),
-                    (r'(?:approve|accept|endorse)', r'(?:reject|deny|oppose)')
-                ],
-                
-                'temporal_consistency': [
-                    r'(?:before|after|during|while)[\s\w]*\d{4}',
-                    r'(?:previous|current|future|next)[\s\w]*(?:year|quarter|month)'
-                ],
-                
-                'quantitative_consistency': [
-                    r'\$?[\d,]+\.?\d*[kmb]?',  # Monetary amounts
-                    r'\d+\.?\d*%',  # Percentages
-                    r'[\d,]+\s*(?:units|items|cases|samples)'  # Quantities
-                ]
-            }
-        }
+        """Initialize argument consistency analysis framework (a per-instance copy)."""
+        return copy.deepcopy(CONSISTENCY_FRAMEWORK)
     
-    def analyze_document(self, document_text: str) -> Dict[str, Any]:
-        """Analyze document for argument consistency and determine review scope."""
+    def analyze_document(self, document_text: Union[str, DocumentAnalysisContext]) -> Dict[str, Any]:
+        """Analyze document for argument consistency and determine review scope.
+        
+        Accepts raw text or a DocumentAnalysisContext shared with other analyzers.
+        """
         analysis_results = {
             'consistency_score': 0.0,
             'logical_structure_score': 0.0,
@@ -67,18 +75,18 @@ class ConsistencyAnalyzer:
             'priority_level': 'medium'
         }
         
-        text_lower = document_text.lower()
+        context = DocumentAnalysisContext.of(document_text)
         
         # Analyze logical structure
-        structure_score = self._analyze_logical_structure(text_lower)
+        structure_score = self._analyze_logical_structure(context)
         analysis_results['logical_structure_score'] = structure_score
         
         # Check for internal contradictions
-        contradictions = self._detect_contradictions(text_lower)
+        contradictions = self._detect_contradictions(context)
         analysis_results['identified_issues'].extend(contradictions)
         
         # Analyze scope determination factors
-        scope_factors = self._analyze_scope_factors(text_lower)
+        scope_factors = self._analyze_scope_factors(context)
         analysis_results['scope_factors'] = scope_factors
         
         # Determine review scope
@@ -92,36 +100,42 @@ class ConsistencyAnalyzer:
         
         return analysis_results
     
-    def _analyze_logical_structure(self, text: str) -> float:
+    def _analyze_logical_structure(self, text: Union[str, DocumentAnalysisContext]) -> float:
         """Analyze the logical structure of arguments."""
+        context = DocumentAnalysisContext.of(text)
         structure_elements = 0
-        total_expected = len(self.consistency_framework['logical_structure_patterns'])
+        patterns = compile_lexicon(self.consistency_framework['logical_structure_patterns'])
+        total_expected = len(patterns)
         
-        for element_type, pattern in self.consistency_framework['logical_structure_patterns'].items():
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in patterns.values():
+            if context.search(pattern):
                 structure_elements += 1
         
         return structure_elements / total_expected
     
-    def _detect_contradictions(self, text: str) -> List[str]:
+    def _detect_contradictions(self, text: Union[str, DocumentAnalysisContext]) -> List[str]:
         """Detect potential internal contradictions."""
+        context = DocumentAnalysisContext.of(text)
         contradictions = []
         
         for positive_pattern, negative_pattern in self.consistency_framework['consistency_checks']['internal_contradictions']:
-            positive_matches = re.findall(positive_pattern, text, re.IGNORECASE)
-            negative_matches = re.findall(negative_pattern, text, re.IGNORECASE)
+            positive_match = context.search(compile_pattern(positive_pattern))
+            negative_match = context.search(compile_pattern(negative_pattern)) if positive_match else None
             
-            if positive_matches and negative_matches:
-                contradictions.append(f"Potential contradiction: {positive_matches[0]} vs {negative_matches[0]}")
+            if positive_match and negative_match:
+                contradictions.append(
+                    f"Potential contradiction: {findall_item(positive_match)} vs {findall_item(negative_match)}"
+                )
         
         return contradictions
     
-    def _analyze_scope_factors(self, text: str) -> Dict[str, Any]:
+    def _analyze_scope_factors(self, text: Union[str, DocumentAnalysisContext]) -> Dict[str, Any]:
         """Analyze factors that determine review scope."""
+        context = DocumentAnalysisContext.of(text)
         scope_factors = {}
         
-        for factor_type, pattern in self.consistency_framework['scope_determination_criteria'].items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for factor_type, pattern in compile_lexicon(self.consistency_framework['scope_determination_criteria']).items():
+            matches = context.findall(pattern)
             scope_factors[factor_type] = {
                 'found': len(matches) > 0,
                 'count': len(matches),
@@ -0,0 +1,56 @@
+"""
+Shared Document Analysis Context
+
+One preprocessing pass shared by the document analyzers.
+
+A ``DocumentAnalysisContext`` lowercases the text once, so running the
+consistency analyzer, the evidence validator and the model-risk monitor
+over the same document normalizes it once. Analyzers compile their
+lexicons with ``compile_lexicon``, which caches each compiled regex, so
+the per-document cost is only the matching itself.
+
+Usage:
+    context = DocumentAnalysisContext(document_text)
+    consistency = ConsistencyAnalyzer().analyze_document(context)
+    evidence = EvidenceValidator().validate_document(context)
+
+Part of the tidyllm-verse: Educational ML with complete transparency
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Union
+
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str, flags: int = re.IGNORECASE) -> "re.Pattern":
+    """Compile a regex once per (pattern, flags)."""
+    return re.compile(pattern, flags)
+
+
+def compile_lexicon(patterns: Dict[str, str], flags: int = re.IGNORECASE) -> Dict[str, "re.Pattern"]:
+    """Compiled ``{name: regex}`` lexicon; unchanged patterns reuse their compiled form."""
+    return {name: compile_pattern(pattern, flags) for name, pattern in patterns.items()}
+
+
+class DocumentAnalysisContext:
+    """Normalized text for one document."""
+
+    def __init__(self, document_text: str):
+        self.text = document_text
+        self.text_lower = document_text.lower()
+
+    @classmethod
+    def of(cls, document: Union[str, "DocumentAnalysisContext"]) -> "DocumentAnalysisContext":
+        """Accept either raw text or an existing context."""
+        if isinstance(document, cls):
+            return document
+        return cls(document)
+
+    def search(self, pattern: "re.Pattern") -> Optional["re.Match"]:
+        """First match of a compiled pattern in the lowercased text."""
+        return pattern.search(self.text_lower)
+
+    def findall(self, pattern: "re.Pattern") -> List[Any]:
+        """``pattern.findall`` over the lowercased text."""
+        return pattern.findall(self.text_lower)
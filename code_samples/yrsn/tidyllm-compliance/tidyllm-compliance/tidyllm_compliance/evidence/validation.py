@@ -7,8 +7,38 @@ Determines whether documents contain sufficient authentic evidence markers.
 Part of the tidyllm-verse: Educational ML with complete transparency
 """
 
-import re
-from typing import Dict, Any
+import copy
+from typing import Dict, Any, Union
+
+from ..document_context import DocumentAnalysisContext, compile_lexicon
+from ..pattern_matcher import findall_item
+
+EVIDENCE_CRITERIA = {
+    'authenticity_indicators': {
+        'digital_signatures': r'(?:digitally signed|electronic signature|authenticated)',
+        'timestamps': r'\d{4}-\d{2}-\d{2}[\sT]\d{2}:\d{2}:\d{2}',
+        'version_control': r'(?:version|revision|draft)[\s#:]*(\d+\.?\d*)',
+        'author_identification': r'(?:author|prepared by|created by)[\s:]*([^\n]+)',
+        'source_attribution': r'(?:source|reference|citation)[\s:]*([^\n]+)'
+    },
+    
+    'completeness_requirements': {
+        'executive_summary': r'(?:executive summary|overview|abstract)',
+        'methodology_section': r'(?:methodology|approach|method)',
+        'data_analysis': r'(?:data analysis|findings|results)',
+        'conclusions': r'(?:conclusion|summary|recommendation)',
+        'appendices': r'(?:appendix|attachment|exhibit)',
+        'references': r'(?:reference|bibliography|citation)'
+    },
+    
+    'quality_indicators': {
+        'peer_review': r'(?:peer review|reviewed by|quality assurance)',
+        'data_validation': r'(?:data validation|verified|confirmed)',
+        'cross_references': r'(?:see|refer to|as shown in)[\s\w]*(?:table|figure|section)',
+        'quantitative_evidence': r'\d+\.?\d*%|\$[\d,]+|\d+\s*(?:units|cases|samples)',
+        'statistical_significance': r'(?:p-value|confidence interval|statistically significant)'
+    }
+}
 
 class EvidenceValidator:
     """Monitor and validate evidence authenticity and completeness."""
@@ -17,36 +47,14 @@ class EvidenceValidator:
         self.validation_criteria = self._initialize_evidence_criteria()
         
     def _initialize_evidence_criteria(self) -> Dict[str, Any]:
-        """Initialize evidence validation criteria."""
-        return {
-            'authenticity_indicators': {
-                'digital_signatures': r'(?:digitally signed|electronic signature|authenticated)',
-                'timestamps': r'\d{4}-\d{2}-\d{2}[\sT]\d{2}:\d{2}:\d{2}',
-                'version_control': r'(?:version|revision|draft)[\s#:]*(\d+\.?\d*)',
-                'author_identification': r'(?:author|prepared by|created by)[\s:]*([^\n]+)',
-                'source_attribution': r'(?:source|reference|citation)[\s:]*([^\n]+)'
-            },
-            
-            'completeness_requirements': {
-                'executive_summary': r'(?:executive summary|overview|abstract)',
-                'methodology_section': r'(?:methodology|approach|method)',
-                'data_analysis': r'(?:data analysis|findings|results)',
-                'conclusions': r'(?:conclusion|summary|recommendation)',
-                'appendices': r'(?:appendix|attachment|exhibit)',
-                'references': r'(?:reference|bibliography|citation)'
-            },
-            
-            'quality_indicators': {
-                'peer_review': r'(?:peer review|reviewed by|quality assurance)',
-                'data_validation': r'(?:data validation|verified|confirmed)',
-                'cross_references': r'(?:see|refer to|as shown in)[\s\w]*(?:table|figure|section)',
-                'quantitative_evidence': r'\d+\.?\d*%|\$[\d,]+|\d+\s*(?:units|cases|samples)',
-                'statistical_significance': r'(?:p-value|confidence interval|statistically significant)'
-            }
-        }
+        """Initialize evidence validation criteria (a per-instance copy)."""
+        return copy.deepcopy(EVIDENCE_CRITERIA)
     
-    def validate_document(self, document_text: str) -> Dict[str, Any]:
-        """Validate evidence document for authenticity and completeness."""
+    def validate_document(self, document_text: Union[str, DocumentAnalysisContext]) -> Dict[str, Any]:
+        """Validate evidence document for authenticity and completeness.
+        
+        Accepts raw text or a DocumentAnalysisContext shared with other analyzers.
+        """
         validation_results = {
             'authenticity_score': 0.0,
             'completeness_score': 0.0,
@@ -56,26 +64,29 @@ class EvidenceValidator:
             'recommendations': []
         }
         
-        text_lower = document_text.lower()
+        context = DocumentAnalysisContext.of(document_text)
         
         # Assess authenticity
         auth_found = 0
-        auth_total = len(self.validation_criteria['authenticity_indicators'])
+        authenticity = compile_lexicon(self.validation_criteria['authenticity_indicators'])
+        auth_total = len(authenticity)
         
-        for indicator, pattern in self.validation_criteria['authenticity_indicators'].items():
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
+        for indicator, pattern in authenticity.items():
+            match = context.search(pattern)
+            if match:
                 auth_found += 1
-                validation_results['findings'][f'authenticity_{indicator}'] = matches[0] if isinstance(matches[0], str) else str(matches[0])
+                first = findall_item(match)
+                validation_results['findings'][f'authenticity_{indicator}'] = first if isinstance(first, str) else str(first)
         
         validation_results['authenticity_score'] = auth_found / auth_total
         
         # Assess completeness
         complete_found = 0
-        complete_total = len(self.validation_criteria['completeness_requirements'])
+        completeness = compile_lexicon(self.validation_criteria['completeness_requirements'])
+        complete_total = len(completeness)
         
-        for requirement, pattern in self.validation_criteria['completeness_requirements'].items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
+        for requirement, pattern in completeness.items():
+            if context.search(pattern):
                 complete_found += 1
                 validation_results['findings'][f'completeness_{requirement}'] = True
             else:
@@ -85,10 +96,11 @@ class EvidenceValidator:
         
         # Assess quality
         quality_found = 0
-        quality_total = len(self.validation_criteria['quality_indicators'])
+        quality = compile_lexicon(self.validation_criteria['quality_indicators'])
+        quality_total = len(quality)
         
-        for indicator, pattern in self.validation_criteria['quality_indicators'].items():
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
+        for indicator, pattern in quality.items():
+            matches = context.findall(pattern)
             if matches:
                 quality_found += 1
                 validation_results['findings'][f'quality_{indicator}'] = len(matches)
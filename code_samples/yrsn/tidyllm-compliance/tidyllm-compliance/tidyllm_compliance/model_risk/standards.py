@@ -9,10 +9,17 @@ Compliance monitoring for model risk management based on:
 Part of the tidyllm-verse: Educational ML with complete transparency
 """
 
+import os
 import re
-from typing import Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass
 
+from ..document_context import DocumentAnalysisContext
+from ..pattern_matcher import MultiPatternMatcher, findall_item
+
+PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
 @dataclass
 class ComplianceRule:
     """Structure for compliance rules and standards."""
@@ -27,6 +34,40 @@ class ModelRiskMonitor:
     
     def __init__(self):
         self.standards = self._initialize_model_risk_standards()
+        self._compile_standards()
+    
+    def _compile_standards(self):
+        """Compile every rule's patterns and element keywords into one matcher.
+        
+        Pattern keys are qualified by rule, so rules may reuse pattern names.
+        Keywords are literals of the same matcher, so one scan answers both.
+        """
+        patterns = {}
+        self._rule_plans: Dict[str, List[tuple]] = {}
+        self._all_keywords = set()
+        for rule_key, rule in self.standards.items():
+            plan = []
+            for element in rule.required_elements:
+                element_keywords = element.lower().split()
+                self._all_keywords.update(element_keywords)
+                relevant_patterns = [
+                    pattern_name for pattern_name in rule.validation_patterns
+                    if any(keyword in pattern_name for keyword in element_keywords)
+                ]
+                plan.append((element, element_keywords, relevant_patterns))
+            for pattern_name, pattern in rule.validation_patterns.items():
+                patterns[(rule_key, pattern_name)] = pattern
+            self._rule_plans[rule_key] = plan
+        self._matcher = MultiPatternMatcher(patterns, PATTERN_FLAGS, literals=self._all_keywords)
+    
+    def _scan_document(self, document_text: Union[str, DocumentAnalysisContext]) -> Dict[str, Any]:
+        """Normalize once and run the single combined scan shared by all rules."""
+        text_lower = DocumentAnalysisContext.of(document_text).text_lower
+        first_matches, keywords_present = self._matcher.scan(text_lower)
+        return {
+            'keywords_present': keywords_present,
+            'first_matches': first_matches
+        }
     
     def _initialize_model_risk_standards(self) -> Dict[str, ComplianceRule]:
         """Initialize model risk development standards (e.g., SR 11-7, OCC guidance)."""
@@ -98,8 +139,11 @@ class ModelRiskMonitor:
             )
         }
     
-    def assess_document_compliance(self, document_text: str) -> Dict[str, Any]:
-        """Assess a document against model risk standards."""
+    def assess_document_compliance(self, document_text: Union[str, DocumentAnalysisContext]) -> Dict[str, Any]:
+        """Assess a document against model risk standards.
+        
+        Accepts raw text or a DocumentAnalysisContext shared with other analyzers.
+        """
         compliance_results = {
             'overall_score': 0.0,
             'rule_assessments': {},
@@ -109,9 +153,10 @@ class ModelRiskMonitor:
         
         total_rules = len(self.standards)
         passing_rules = 0
+        scan = self._scan_document(document_text)
         
         for rule_id, rule in self.standards.items():
-            assessment = self._assess_single_rule(document_text, rule)
+            assessment = self._assess_single_rule(document_text, rule, scan=scan, rule_key=rule_id)
             compliance_results['rule_assessments'][rule_id] = assessment
             
             if assessment['compliance_score'] >= 0.7:  # 70% threshold
@@ -129,30 +174,49 @@ class ModelRiskMonitor:
         compliance_results['overall_score'] = passing_rules / total_rules
         return compliance_results
     
-    def _assess_single_rule(self, document_text: str, rule: ComplianceRule) -> Dict[str, Any]:
+    def assess_documents(self, documents: List[str], max_workers: Optional[int] = None,
+                         use_processes: bool = True) -> List[Dict[str, Any]]:
+        """Assess many documents in parallel, returning results in input order.
+        
+        Regex scanning holds the GIL, so documents are spread over processes
+        by default; each worker builds its own monitor with these standards.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        if len(documents) < 2 or max_workers == 1:
+            return [self.assess_document_compliance(text) for text in documents]
+        
+        chunksize = max(1, len(documents) // (max_workers * 4))
+        if use_processes:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker_monitor,
+                                     initargs=(self.standards,)) as pool:
+                return list(pool.map(_assess_in_worker, documents, chunksize=chunksize))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.assess_document_compliance, documents))
+    
+    def _assess_single_rule(self, document_text: str, rule: ComplianceRule,
+                            scan: Optional[Dict[str, Any]] = None,
+                            rule_key: Optional[str] = None) -> Dict[str, Any]:
         """Assess document against a single compliance rule."""
-        text_lower = document_text.lower()
+        if rule_key is None:
+            rule_key = next(key for key, candidate in self.standards.items() if candidate is rule)
+        if scan is None:
+            scan = self._scan_document(document_text)
+        keywords_present = scan['keywords_present']
+        first_matches = scan['first_matches']
         
         found_elements = []
         missing_elements = []
         pattern_matches = {}
         
-        # Check for required elements using patterns
-        for element in rule.required_elements:
-            element_found = False
+        # Check for required elements using keywords and patterns from the shared scan
+        for element, element_keywords, relevant_patterns in self._rule_plans[rule_key]:
+            element_found = any(keyword in keywords_present for keyword in element_keywords)
             
-            # Check if element keywords appear in text
-            element_keywords = element.lower().split()
-            if any(keyword in text_lower for keyword in element_keywords):
-                element_found = True
-            
-            # Check specific patterns if available
-            for pattern_name, pattern in rule.validation_patterns.items():
-                if any(keyword in pattern_name for keyword in element_keywords):
-                    matches = re.findall(pattern, text_lower, re.IGNORECASE | re.MULTILINE)
-                    if matches:
-                        element_found = True
-                        pattern_matches[pattern_name] = matches[0] if matches else None
+            for pattern_name in relevant_patterns:
+                match = first_matches.get((rule_key, pattern_name))
+                if match:
+                    element_found = True
+                    pattern_matches[pattern_name] = findall_item(match)
             
             if element_found:
                 found_elements.append(element)
@@ -194,4 +258,19 @@ class ModelRiskMonitor:
                 'severity': rule.severity
             }
         
-        return summary
\ No newline at end of file
+        return summary
+
+
+_worker_monitor: Optional[ModelRiskMonitor] = None
+
+
+def _init_worker_monitor(standards: Dict[str, ComplianceRule]):
+    """Build one monitor per worker process with the parent's standards."""
+    global _worker_monitor
+    _worker_monitor = ModelRiskMonitor.__new__(ModelRiskMonitor)
+    _worker_monitor.standards = standards
+    _worker_monitor._compile_standards()
+
+
+def _assess_in_worker(document_text: str) -> Dict[str, Any]:
+    return _worker_monitor.assess_document_compliance(document_text)
@@ -0,0 +1,127 @@
+"""
+Multi-Pattern Matcher
+
+Compiles a named set of regular expressions into one combined scanner.
+
+All patterns are joined into a single zero-width lookahead alternation, so
+one pass over the text yields every offset at which *some* pattern
+matches. Individual patterns are then only tried at those candidate
+offsets, which gives exactly the results of running ``re.search`` /
+``re.findall`` per pattern without rescanning the document once per
+pattern.
+
+Plain substrings ("literals", e.g. keywords) are matched by one escaped
+alternation that drops each literal once seen; ``scan`` returns the
+pattern matches together with the literals that occur, exactly as
+``literal in text`` would. Literals are not part of the lookahead scan:
+``re`` tries every alternative at every offset, so there they would cost
+literals x document length again.
+
+Part of the tidyllm-verse: Educational ML with complete transparency
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+def findall_item(match: "re.Match") -> Any:
+    """Return what ``re.findall`` would have produced for this match."""
+    groups = match.re.groups
+    if groups == 0:
+        return match.group(0)
+    if groups == 1:
+        return match.group(1)
+    return match.groups(default='')
+
+
+class MultiPatternMatcher:
+    """Match many named patterns against a text with a single combined scan."""
+
+    def __init__(self, patterns: Dict[str, str], flags: int = 0, literals: Iterable[str] = ()):
+        self.patterns = dict(patterns)
+        self.flags = flags
+        self._compiled = {name: re.compile(pattern, flags) for name, pattern in self.patterns.items()}
+        alternatives = "|".join(f"(?:{pattern})" for pattern in self.patterns.values())
+        self._combined = re.compile(f"(?={alternatives})" if alternatives else r"(?!)", flags)
+
+        # Longest first, so the literal found at an offset is the longest one
+        # there; the shorter literals starting at that offset are its prefixes.
+        self.literals = sorted(set(literals), key=len, reverse=True)
+        self._fold = str.lower if flags & re.IGNORECASE else str
+        self._literal_by_text = {self._fold(literal): literal for literal in self.literals}
+        self._literal_prefixes = {
+            literal: [other for other in self.literals if self._fold(literal).startswith(self._fold(other))]
+            for literal in self.literals
+        }
+
+    def iter_candidate_positions(self, text: str) -> Iterator[int]:
+        """Offsets at which at least one pattern matches, lazily and in order."""
+        for match in self._combined.finditer(text):
+            yield match.start()
+
+    def candidate_positions(self, text: str) -> List[int]:
+        """Offsets at which at least one pattern matches."""
+        return list(self.iter_candidate_positions(text))
+
+    def first_matches(self, text: str, names: Optional[Iterable[str]] = None,
+                      positions: Optional[Iterable[int]] = None) -> Dict[str, "re.Match"]:
+        """Leftmost match per pattern (the ``re.search`` result), for patterns that match.
+
+        The scan stops as soon as every requested pattern has been found.
+        """
+        remaining = list(self._compiled if names is None else names)
+        positions = self.iter_candidate_positions(text) if positions is None else positions
+        found: Dict[str, "re.Match"] = {}
+        for position in positions:
+            if not remaining:
+                break
+            still_missing = []
+            for name in remaining:
+                match = self._compiled[name].match(text, position)
+                if match:
+                    found[name] = match
+                else:
+                    still_missing.append(name)
+            remaining = still_missing
+        return found
+
+    def literals_present(self, text: str) -> Set[str]:
+        """Literals occurring anywhere in the text (``{l for l in literals if l in text}``)."""
+        missing = set(self.literals)
+        present: Set[str] = set()
+        position = 0
+        while missing:
+            # Rebuilt only when a literal is first seen; ``re`` caches the compile
+            scanner = re.compile("|".join(re.escape(literal) for literal in self.literals
+                                          if literal in missing), self.flags)
+            match = scanner.search(text, position)
+            if match is None:
+                break
+            for literal in self._literal_prefixes[self._literal_by_text[self._fold(match.group(0))]]:
+                if literal in missing:
+                    missing.discard(literal)
+                    present.add(literal)
+            position = match.start() + 1
+        return present
+
+    def scan(self, text: str) -> Tuple[Dict[str, "re.Match"], Set[str]]:
+        """``first_matches(text)`` and ``literals_present(text)`` from one call."""
+        return self.first_matches(text), self.literals_present(text)
+
+    def all_matches(self, text: str, names: Optional[Iterable[str]] = None,
+                    positions: Optional[Iterable[int]] = None) -> Dict[str, List["re.Match"]]:
+        """Non-overlapping matches per pattern (the ``re.finditer`` sequence)."""
+        names = list(self._compiled if names is None else names)
+        positions = self.iter_candidate_positions(text) if positions is None else positions
+        results: Dict[str, List["re.Match"]] = {name: [] for name in names}
+        next_start = {name: 0 for name in names}
+        for position in positions:
+            for name in names:
+                if position < next_start[name]:
+                    continue
+                match = self._compiled[name].match(text, position)
+                if match:
+                    results[name].append(match)
+                    # finditer resumes at the match end (one past it for empty matches)
+                    next_start[name] = match.end() if match.end() > position else position + 1
+        return results
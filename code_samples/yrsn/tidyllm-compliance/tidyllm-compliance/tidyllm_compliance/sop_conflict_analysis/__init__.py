@@ -12,10 +12,12 @@ from .yrsn_analyzer import YRSNNoiseAnalyzer
 from .conflict_reporter import SOPConflictReporter
 from .temporal_resolver import TemporalResolver
 from .fallback_strategy import ComplianceSOPFallback
+from .sop_corpus_index import SOPCorpusIndex
 
 __all__ = [
     'YRSNNoiseAnalyzer',
     'SOPConflictReporter', 
     'TemporalResolver',
-    'ComplianceSOPFallback'
+    'ComplianceSOPFallback',
+    'SOPCorpusIndex'
 ]
\ No newline at end of file
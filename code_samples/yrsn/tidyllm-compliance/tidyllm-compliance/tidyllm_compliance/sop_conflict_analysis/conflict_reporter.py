@@ -10,14 +10,104 @@ Part of tidyllm-compliance: Automated compliance with complete transparency
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple
 import csv
 
 from .yrsn_analyzer import YRSNNoiseAnalyzer
 from .fallback_strategy import ComplianceSOPFallback
 
+CSV_HEADER = [
+    'Query', 'Compliance_Status', 'YRSN_Noise_Score', 'Quality_Assessment',
+    'Actionable_Ratio', 'Guidance_Count', 'Sources', 'Retrieval_Method'
+]
+
+
+class ComplianceReportFold:
+    """Running aggregates for every compliance report, updated one result at a time
+    
+    Results must be added in input order. max_listed_queries caps the
+    affected-query lists kept for recommendations (None keeps them all).
+    """
+    
+    def __init__(self, max_listed_queries: Optional[int] = None):
+        self.max_listed_queries = max_listed_queries
+        self.total = 0
+        self.compliant = 0          # noise < 50
+        self.high_risk = 0          # noise >= 70
+        self.above_50 = 0           # noise > 50
+        self.above_70 = 0           # noise > 70
+        self.noise_sum = 0.0
+        self.noise_max = float('-inf')
+        self.noise_min = float('inf')
+        self.no_guidance = 0
+        self.high_noise_queries: List[str] = []
+        self.no_guidance_queries: List[str] = []
+    
+    def _listed(self, queries: List[str], query: str):
+        if self.max_listed_queries is None or len(queries) < self.max_listed_queries:
+            queries.append(query)
+    
+    def add(self, result: Dict[str, Any]):
+        noise = result['yrsn_noise_score']
+        self.total += 1
+        self.noise_sum += noise
+        self.noise_max = max(self.noise_max, noise)
+        self.noise_min = min(self.noise_min, noise)
+        if noise < 50:
+            self.compliant += 1
+        if noise >= 70:
+            self.high_risk += 1
+            self._listed(self.high_noise_queries, result['query'])
+        if noise > 50:
+            self.above_50 += 1
+        if noise > 70:
+            self.above_70 += 1
+        if result['compliance_status'] == 'NO_GUIDANCE_FOUND':
+            self.no_guidance += 1
+            self._listed(self.no_guidance_queries, result['query'])
+
+
+class IncrementalJsonReport:
+    """JSON report whose list section is written item by item"""
+    
+    def __init__(self, path: Path, list_key: str):
+        self.path = Path(path)
+        self.list_key = list_key
+        self._file = None
+        self._count = 0
+    
+    def __enter__(self):
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._file.write('{\n  ' + json.dumps(self.list_key) + ': [')
+        return self
+    
+    def append(self, item: Dict[str, Any]):
+        body = json.dumps(item, indent=2, ensure_ascii=False).replace('\n', '\n    ')
+        self._file.write((',\n    ' if self._count else '\n    ') + body)
+        self._count += 1
+    
+    def close(self, fields: Dict[str, Any]):
+        """Finish the list and write the remaining top-level fields"""
+        if self._file is None:
+            return
+        self._file.write('\n  ]' if self._count else ']')
+        for key, value in fields.items():
+            body = json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+            self._file.write(',\n  ' + json.dumps(key) + ': ' + body)
+        self._file.write('\n}\n')
+        self._file.close()
+        self._file = None
+    
+    def __exit__(self, exc_type, exc, tb):
+        if self._file is not None:
+            # Interrupted run: still leave valid JSON behind
+            self.close({'incomplete': True})
+        return False
+
+
 class SOPConflictReporter:
     """Compliance-owned SOP conflict detection and reporting system"""
     
@@ -39,8 +129,20 @@ class SOPConflictReporter:
         print("Compliance validation: YRSN analysis enabled")
         print("=" * 60)
     
-    def generate_compliance_report(self, queries: List[str] = None, authoritative_date: str = "2025-09-05") -> Dict[str, Any]:
-        """Generate comprehensive compliance conflict report"""
+    def generate_compliance_report(self, queries: Iterable[str] = None, authoritative_date: str = "2025-09-05",
+                                   max_workers: Optional[int] = None,
+                                   include_details: bool = True,
+                                   max_listed_queries: int = 50) -> Dict[str, Any]:
+        """Generate comprehensive compliance conflict report
+        
+        Queries are analyzed on a worker pool with a bounded number in flight
+        and their results are taken in input order. Every report aggregate is
+        folded in as results arrive, and the CSV and detailed/YRSN JSON reports
+        are written incrementally. With include_details=False the per-query
+        breakdowns are left in those files instead of being returned and the
+        recommendations list at most max_listed_queries queries each, so
+        memory stays flat for large query suites.
+        """
         
         # Default compliance queries
         if not queries:
@@ -49,65 +151,135 @@ class SOPConflictReporter:
                 'Which embedding system should be used: tidyllm-sentence or tidyllm-vectorqa?'
             ]
         
-        compliance_results = []
+        max_workers = max_workers or min(8, (os.cpu_count() or 1) + 4)
+        fold = ComplianceReportFold(None if include_details else max_listed_queries)
+        detailed_items = [] if include_details else None
+        yrsn_items = [] if include_details else None
         
-        for query in queries:
-            # Retrieve guidance using compliance fallback strategy
-            guidance_result = self.fallback_strategy.retrieve_compliant_guidance(query, authoritative_date)
+        csv_path = self.output_dir / f"compliance_analysis_{self.timestamp}.csv"
+        detailed_path = self.output_dir / f"compliance_detailed_analysis_{self.timestamp}.json"
+        yrsn_path = self.output_dir / f"compliance_yrsn_validation_{self.timestamp}.json"
+        
+        with open(csv_path, 'w', newline='', encoding='utf-8') as csv_file, \
+                IncrementalJsonReport(detailed_path, 'query_breakdown') as detailed_report, \
+                IncrementalJsonReport(yrsn_path, 'validation_details') as yrsn_report:
+            writer = csv.writer(csv_file)
+            writer.writerow(CSV_HEADER)
+            
+            for index, result in self._iter_query_results(queries, authoritative_date, max_workers):
+                fold.add(result)
+                detailed_item = self._detailed_item(index, result)
+                yrsn_item = self._yrsn_item(result)
+                writer.writerow(self._csv_row(result))
+                detailed_report.append(detailed_item)
+                yrsn_report.append(yrsn_item)
+                if include_details:
+                    detailed_items.append(detailed_item)
+                    yrsn_items.append(yrsn_item)
             
-            # Validate guidance quality using YRSN analysis
-            if guidance_result.guidance_content:
-                yrsn_validation = self.yrsn_analyzer.analyze_guidance_quality(
-                    guidance_result.guidance_content, 
-                    query
-                )
-                
-                compliance_results.append({
-                    'query': query,
-                    'compliance_status': guidance_result.compliance_status,
-                    'guidance_content': guidance_result.guidance_content,
-                    'sources': guidance_result.sources,
-                    'confidence_level': guidance_result.confidence_level,
-                    'retrieval_method': guidance_result.retrieval_method,
-                    'yrsn_noise_score': yrsn_validation.noise_percentage,
-                    'quality_assessment': yrsn_validation.quality_assessment,
-                    'actionable_content_ratio': yrsn_validation.actionable_content_ratio,
-                    'specific_guidance_found': yrsn_validation.specific_guidance_found
-                })
-            else:
-                compliance_results.append({
-                    'query': query,
-                    'compliance_status': 'NO_GUIDANCE_FOUND',
-                    'guidance_content': [],
-                    'sources': [],
-                    'confidence_level': 'NONE',
-                    'retrieval_method': 'none',
-                    'yrsn_noise_score': 100.0,
-                    'quality_assessment': 'COMPLIANCE FAILURE - No guidance found',
-                    'actionable_content_ratio': 0.0,
-                    'specific_guidance_found': 0
-                })
+            detailed_analysis = self._generate_detailed_analysis(fold, detailed_items)
+            yrsn_validation = self._generate_yrsn_validation_report(fold, yrsn_items)
+            detailed_report.close({k: v for k, v in detailed_analysis.items() if k != 'query_breakdown'})
+            yrsn_report.close({k: v for k, v in yrsn_validation.items() if k != 'validation_details'})
+        
+        print(f"[SAVED] CSV Analysis: {csv_path.name}")
+        print(f"[SAVED] detailed_analysis: {detailed_path.name}")
+        print(f"[SAVED] yrsn_validation: {yrsn_path.name}")
+        
+        if not include_details:
+            detailed_analysis['query_breakdown_file'] = str(detailed_path)
+            yrsn_validation['validation_details_file'] = str(yrsn_path)
         
-        # Generate comprehensive compliance reports
         reports = {
-            'compliance_summary': self._generate_compliance_summary(compliance_results),
-            'detailed_analysis': self._generate_detailed_analysis(compliance_results),
-            'yrsn_validation': self._generate_yrsn_validation_report(compliance_results),
-            'recommendations': self._generate_compliance_recommendations(compliance_results)
+            'compliance_summary': self._generate_compliance_summary(fold),
+            'detailed_analysis': detailed_analysis,
+            'yrsn_validation': yrsn_validation,
+            'recommendations': self._generate_compliance_recommendations(fold)
         }
         
-        # Save compliance reports
-        self._save_compliance_reports(reports)
-        self._generate_compliance_csv(compliance_results)
+        # Save the aggregate-only reports and the dashboard
+        self._save_compliance_reports({
+            name: reports[name] for name in ('compliance_summary', 'recommendations')
+        })
         self._create_compliance_dashboard(reports)
         
         return reports
     
-    def _generate_compliance_summary(self, results: List[Dict]) -> Dict[str, Any]:
+    def _iter_query_results(self, queries: Iterable[str], authoritative_date: str,
+                            max_workers: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (query number, result) in input order.
+        
+        Results that complete ahead of an earlier query wait in a reorder
+        buffer; running plus buffered queries never exceed 2x workers.
+        """
+        query_iter = enumerate(queries, 1)
+        window = max_workers * 2
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sop-conflict") as pool:
+            in_flight = {}
+            completed: Dict[int, Dict[str, Any]] = {}
+            next_index = 1
+            
+            def submit_next() -> bool:
+                for index, query in query_iter:
+                    in_flight[pool.submit(self._analyze_query, query, authoritative_date)] = index
+                    return True
+                return False
+            
+            while len(in_flight) < window and submit_next():
+                pass
+            while in_flight:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    completed[in_flight.pop(future)] = future.result()
+                while next_index in completed:
+                    yield next_index, completed.pop(next_index)
+                    next_index += 1
+                while len(in_flight) + len(completed) < window and submit_next():
+                    pass
+    
+    def _analyze_query(self, query: str, authoritative_date: str) -> Dict[str, Any]:
+        """Retrieve and YRSN-validate guidance for a single query"""
+        # Retrieve guidance using compliance fallback strategy
+        guidance_result = self.fallback_strategy.retrieve_compliant_guidance(query, authoritative_date)
+        
+        # Validate guidance quality using YRSN analysis
+        if guidance_result.guidance_content:
+            yrsn_validation = self.yrsn_analyzer.analyze_guidance_quality(
+                guidance_result.guidance_content, 
+                query
+            )
+            
+            return {
+                'query': query,
+                'compliance_status': guidance_result.compliance_status,
+                'guidance_content': guidance_result.guidance_content,
+                'sources': guidance_result.sources,
+                'confidence_level': guidance_result.confidence_level,
+                'retrieval_method': guidance_result.retrieval_method,
+                'yrsn_noise_score': yrsn_validation.noise_percentage,
+                'quality_assessment': yrsn_validation.quality_assessment,
+                'actionable_content_ratio': yrsn_validation.actionable_content_ratio,
+                'specific_guidance_found': yrsn_validation.specific_guidance_found
+            }
+        
+        return {
+            'query': query,
+            'compliance_status': 'NO_GUIDANCE_FOUND',
+            'guidance_content': [],
+            'sources': [],
+            'confidence_level': 'NONE',
+            'retrieval_method': 'none',
+            'yrsn_noise_score': 100.0,
+            'quality_assessment': 'COMPLIANCE FAILURE - No guidance found',
+            'actionable_content_ratio': 0.0,
+            'specific_guidance_found': 0
+        }
+    
+    def _generate_compliance_summary(self, fold: "ComplianceReportFold") -> Dict[str, Any]:
         """Generate executive compliance summary"""
-        total_queries = len(results)
-        compliant_queries = len([r for r in results if r['yrsn_noise_score'] < 50])
-        high_risk_queries = len([r for r in results if r['yrsn_noise_score'] >= 70])
+        total_queries = fold.total
+        compliant_queries = fold.compliant
+        high_risk_queries = fold.high_risk
         
         return {
             'report_type': 'Compliance Executive Summary',
@@ -122,83 +294,84 @@ class SOPConflictReporter:
             'recommendation': 'Review high-risk responses for compliance' if high_risk_queries > 0 else 'All responses meet compliance standards'
         }
     
-    def _generate_detailed_analysis(self, results: List[Dict]) -> Dict[str, Any]:
-        """Generate detailed compliance analysis"""
+    def _detailed_item(self, index: int, result: Dict) -> Dict[str, Any]:
         return {
+            'query_id': f"COMP-{index:03d}",
+            'query': result['query'],
+            'compliance_details': {
+                'status': result['compliance_status'],
+                'yrsn_noise_score': result['yrsn_noise_score'],
+                'quality_assessment': result['quality_assessment'],
+                'actionable_content_ratio': result['actionable_content_ratio'],
+                'guidance_sources': result['sources'],
+                'retrieval_method': result['retrieval_method'],
+                'confidence_level': result['confidence_level']
+            },
+            'guidance_content': result['guidance_content'][:3] if result['guidance_content'] else [],
+            'compliance_recommendation': self._get_compliance_recommendation(result)
+        }
+    
+    def _generate_detailed_analysis(self, fold: "ComplianceReportFold",
+                                    items: Optional[List[Dict]]) -> Dict[str, Any]:
+        """Generate detailed compliance analysis"""
+        report = {
             'report_type': 'Detailed Compliance Analysis',
             'generated_at': datetime.now().isoformat(),
             'analysis_scope': {
-                'queries_processed': len(results),
+                'queries_processed': fold.total,
                 'yrsn_validation_enabled': True,
                 'fallback_strategy_used': True
-            },
-            'query_breakdown': [
-                {
-                    'query_id': f"COMP-{i:03d}",
-                    'query': result['query'],
-                    'compliance_details': {
-                        'status': result['compliance_status'],
-                        'yrsn_noise_score': result['yrsn_noise_score'],
-                        'quality_assessment': result['quality_assessment'],
-                        'actionable_content_ratio': result['actionable_content_ratio'],
-                        'guidance_sources': result['sources'],
-                        'retrieval_method': result['retrieval_method'],
-                        'confidence_level': result['confidence_level']
-                    },
-                    'guidance_content': result['guidance_content'][:3] if result['guidance_content'] else [],
-                    'compliance_recommendation': self._get_compliance_recommendation(result)
-                }
-                for i, result in enumerate(results, 1)
-            ]
+            }
         }
+        if items is not None:
+            report['query_breakdown'] = items
+        return report
     
-    def _generate_yrsn_validation_report(self, results: List[Dict]) -> Dict[str, Any]:
-        """Generate YRSN validation compliance report"""
-        yrsn_scores = [r['yrsn_noise_score'] for r in results]
-        
+    def _yrsn_item(self, result: Dict) -> Dict[str, Any]:
         return {
+            'query': result['query'],
+            'noise_score': result['yrsn_noise_score'],
+            'quality_level': self._categorize_quality(result['yrsn_noise_score']),
+            'actionable_ratio': result['actionable_content_ratio'],
+            'specific_guidance_count': result['specific_guidance_found']
+        }
+    
+    def _generate_yrsn_validation_report(self, fold: "ComplianceReportFold",
+                                         items: Optional[List[Dict]]) -> Dict[str, Any]:
+        """Generate YRSN validation compliance report"""
+        report = {
             'report_type': 'YRSN Validation Report',
             'generated_at': datetime.now().isoformat(),
             'yrsn_metrics': {
-                'average_noise_score': sum(yrsn_scores) / len(yrsn_scores) if yrsn_scores else 100,
-                'highest_noise_score': max(yrsn_scores) if yrsn_scores else 100,
-                'lowest_noise_score': min(yrsn_scores) if yrsn_scores else 100,
-                'queries_above_50_percent_noise': len([s for s in yrsn_scores if s > 50]),
-                'queries_above_70_percent_noise': len([s for s in yrsn_scores if s > 70])
-            },
-            'validation_details': [
-                {
-                    'query': result['query'],
-                    'noise_score': result['yrsn_noise_score'],
-                    'quality_level': self._categorize_quality(result['yrsn_noise_score']),
-                    'actionable_ratio': result['actionable_content_ratio'],
-                    'specific_guidance_count': result['specific_guidance_found']
-                }
-                for result in results
-            ]
+                'average_noise_score': fold.noise_sum / fold.total if fold.total else 100,
+                'highest_noise_score': fold.noise_max if fold.total else 100,
+                'lowest_noise_score': fold.noise_min if fold.total else 100,
+                'queries_above_50_percent_noise': fold.above_50,
+                'queries_above_70_percent_noise': fold.above_70
+            }
         }
+        if items is not None:
+            report['validation_details'] = items
+        return report
     
-    def _generate_compliance_recommendations(self, results: List[Dict]) -> Dict[str, Any]:
+    def _generate_compliance_recommendations(self, fold: "ComplianceReportFold") -> Dict[str, Any]:
         """Generate compliance recommendations"""
-        high_noise_results = [r for r in results if r['yrsn_noise_score'] >= 70]
-        
         recommendations = []
         
-        if high_noise_results:
+        if fold.high_risk:
             recommendations.append({
                 'priority': 'HIGH',
                 'action': 'Review High-Noise Responses',
-                'description': f'{len(high_noise_results)} queries have >70% noise and require guidance improvement',
-                'affected_queries': [r['query'] for r in high_noise_results]
+                'description': f'{fold.high_risk} queries have >70% noise and require guidance improvement',
+                'affected_queries': fold.high_noise_queries
             })
         
-        no_guidance_results = [r for r in results if r['compliance_status'] == 'NO_GUIDANCE_FOUND']
-        if no_guidance_results:
+        if fold.no_guidance:
             recommendations.append({
                 'priority': 'CRITICAL',
                 'action': 'Provide Missing Guidance',
-                'description': f'{len(no_guidance_results)} queries have no guidance available',
-                'affected_queries': [r['query'] for r in no_guidance_results]
+                'description': f'{fold.no_guidance} queries have no guidance available',
+                'affected_queries': fold.no_guidance_queries
             })
         
         return {
@@ -251,31 +424,17 @@ class SOPConflictReporter:
             
             print(f"[SAVED] {report_name}: {filename}")
     
-    def _generate_compliance_csv(self, results: List[Dict]):
-        """Generate CSV report for compliance analysis"""
-        filename = f"compliance_analysis_{self.timestamp}.csv"
-        filepath = self.output_dir / filename
-        
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'Query', 'Compliance_Status', 'YRSN_Noise_Score', 'Quality_Assessment',
-                'Actionable_Ratio', 'Guidance_Count', 'Sources', 'Retrieval_Method'
-            ])
-            
-            for result in results:
-                writer.writerow([
-                    result['query'],
-                    result['compliance_status'],
-                    result['yrsn_noise_score'],
-                    result['quality_assessment'],
-                    result['actionable_content_ratio'],
-                    result['specific_guidance_found'],
-                    '; '.join(result['sources'][:3]),
-                    result['retrieval_method']
-                ])
-        
-        print(f"[SAVED] CSV Analysis: {filename}")
+    def _csv_row(self, result: Dict) -> List[Any]:
+        return [
+            result['query'],
+            result['compliance_status'],
+            result['yrsn_noise_score'],
+            result['quality_assessment'],
+            result['actionable_content_ratio'],
+            result['specific_guidance_found'],
+            '; '.join(result['sources'][:3]),
+            result['retrieval_method']
+        ]
     
     def _create_compliance_dashboard(self, reports: Dict[str, Any]):
         """Create compliance dashboard in markdown format"""
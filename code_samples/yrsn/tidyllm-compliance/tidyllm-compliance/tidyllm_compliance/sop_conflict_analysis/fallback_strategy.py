@@ -10,10 +10,14 @@ Part of tidyllm-compliance: Automated compliance with complete transparency
 
 import os
 import sys
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from typing import Dict, List, Any, Optional, Union
 from pathlib import Path
 from dataclasses import dataclass
 
+from .sop_corpus_index import SOPCorpusIndex, IndexedSOPDocument
+
 @dataclass
 class ComplianceResult:
     """Results from compliance SOP guidance retrieval"""
@@ -26,10 +30,49 @@ class ComplianceResult:
 class ComplianceSOPFallback:
     """Compliance-owned fallback system for SOP guidance"""
     
-    def __init__(self, base_path: str = None):
+    def __init__(self, base_path: str = None, refresh_interval: float = 5.0):
         self.base_path = Path(base_path) if base_path else Path(".")
         self.yrsn_analyzer = None  # Will be set by importing module
         
+        # SOP corpus is loaded once per authoritative date and refreshed by mtime
+        # in the background; missing date folders are remembered for refresh_interval
+        self.refresh_interval = refresh_interval
+        self._corpus_indexes: Dict[str, SOPCorpusIndex] = {}
+        self._missing_dates: Dict[str, float] = {}
+        self._index_lock = threading.Lock()
+        self._most_recent_date: Optional[str] = None
+        self._most_recent_checked = 0.0
+        self._risk_processor = None
+        self._risk_processor_unavailable = False
+    
+    def _get_corpus_index(self, authoritative_date: str) -> Optional[SOPCorpusIndex]:
+        """Return the in-memory index for a date folder, or None if the folder does not exist.
+
+        Existing folders are indexed once and kept current by the index's
+        background refresher; a missing folder is re-checked at most once per
+        refresh_interval. Neither touches the disk on the common query path.
+        """
+        index = self._corpus_indexes.get(authoritative_date)
+        if index is not None:
+            return index if index.exists else None
+
+        missing_since = self._missing_dates.get(authoritative_date)
+        if missing_since is not None and time.monotonic() - missing_since < self.refresh_interval:
+            return None
+
+        with self._index_lock:
+            index = self._corpus_indexes.get(authoritative_date)
+            if index is None:
+                docs_path = self.base_path / "docs" / authoritative_date
+                if not docs_path.is_dir():
+                    self._missing_dates[authoritative_date] = time.monotonic()
+                    return None
+                self._missing_dates.pop(authoritative_date, None)
+                index = SOPCorpusIndex(docs_path, self.refresh_interval)
+                index.start_refresher()
+                self._corpus_indexes[authoritative_date] = index
+        return index if index.exists else None
+        
     def retrieve_compliant_guidance(self, query: str, authoritative_date: str = None) -> ComplianceResult:
         """
         Retrieve SOP guidance using compliance-approved fallback strategy
@@ -71,9 +114,9 @@ class ComplianceSOPFallback:
         if not authoritative_date:
             authoritative_date = self._get_most_recent_date()
             
-        docs_path = self.base_path / "docs" / authoritative_date
+        corpus = self._get_corpus_index(authoritative_date)
         
-        if not docs_path.exists():
+        if corpus is None:
             return ComplianceResult(
                 guidance_content=[],
                 sources=[f"ERROR: Date folder {authoritative_date} not found"],
@@ -84,20 +127,9 @@ class ComplianceSOPFallback:
         
         keywords = self._extract_compliance_keywords(query)
         
-        for doc_file in docs_path.glob("*.md"):
-            try:
-                with open(doc_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                # Check if document contains relevant compliance guidance
-                if any(keyword.lower() in content.lower() for keyword in keywords):
-                    relevant_sections = self._extract_compliance_sections(content, keywords)
-                    if relevant_sections:
-                        guidance_content.extend(relevant_sections)
-                        sources.append(doc_file.name)
-                        
-            except Exception as e:
-                continue
+        for doc_name, relevant_sections in corpus.search(keywords):
+            guidance_content.extend(relevant_sections)
+            sources.append(doc_name)
         
         return ComplianceResult(
             guidance_content=guidance_content,
@@ -110,11 +142,9 @@ class ComplianceSOPFallback:
     def _check_risk_management_fallback(self, query: str) -> ComplianceResult:
         """Check risk management domainRAG fallback for compliance guidance"""
         try:
-            # Import risk management system
-            sys.path.append(str(self.base_path))
-            from risk_management_sop_drop_zone import RiskDocumentProcessor
-            
-            risk_processor = RiskDocumentProcessor()
+            risk_processor = self._get_risk_processor()
+            if risk_processor is None:
+                raise ImportError("risk_management_sop_drop_zone not available")
             
             # Check risk processor for guidance
             guidance_result = risk_processor._check_existing_guidance(query)
@@ -153,6 +183,18 @@ class ComplianceSOPFallback:
             compliance_status='SYSTEM_UNAVAILABLE'
         )
     
+    def _get_risk_processor(self):
+        """Import and construct the risk management processor once."""
+        if self._risk_processor is None and not self._risk_processor_unavailable:
+            try:
+                if str(self.base_path) not in sys.path:
+                    sys.path.append(str(self.base_path))
+                from risk_management_sop_drop_zone import RiskDocumentProcessor
+                self._risk_processor = RiskDocumentProcessor()
+            except Exception:
+                self._risk_processor_unavailable = True
+        return self._risk_processor
+    
     def _extract_compliance_keywords(self, query: str) -> List[str]:
         """Extract compliance-relevant keywords from query"""
         import re
@@ -171,29 +213,36 @@ class ComplianceSOPFallback:
             
         return keywords
     
-    def _extract_compliance_sections(self, content: str, keywords: List[str]) -> List[str]:
-        """Extract sections that contain actual compliance guidance"""
-        lines = content.split('\n')
-        relevant_sections = []
-        
-        for i, line in enumerate(lines):
-            if any(keyword.lower() in line.lower() for keyword in keywords):
-                # Extract surrounding context for compliance guidance
-                start = max(0, i - 2)
-                end = min(len(lines), i + 3)
-                section = '\n'.join(lines[start:end]).strip()
-                
-                # Only include if it contains actionable guidance
-                if any(indicator in section.lower() for indicator in ['use', 'should', 'must', 'required']):
-                    relevant_sections.append(section)
-                    
-        return relevant_sections[:5]  # Top 5 most relevant sections
+    def _extract_compliance_sections(self, content: Union[str, IndexedSOPDocument],
+                                     keywords: List[str]) -> List[str]:
+        """Extract sections that contain actual compliance guidance
+        
+        Accepts an indexed document (the query path) or raw content.
+        """
+        if isinstance(content, str):
+            content = IndexedSOPDocument.from_content('<content>', content)
+        
+        line_numbers = set()
+        for keyword in {k.lower() for k in keywords}:
+            for word, word_lines in content.postings.items():
+                if keyword in word:
+                    line_numbers.update(word_lines)
+        
+        # Top 5 most relevant sections
+        return SOPCorpusIndex.guidance_sections(content, sorted(line_numbers), limit=5)
     
     def _get_most_recent_date(self) -> str:
         """Get the most recent date folder for compliance purposes"""
+        now = time.monotonic()
+        if self._most_recent_date and now - self._most_recent_checked < self.refresh_interval:
+            return self._most_recent_date
+        self._most_recent_checked = now
+        
         docs_path = self.base_path / "docs"
         if not docs_path.exists():
-            return "2025-09-05"  # Default fallback
+            self._most_recent_date = "2025-09-05"  # Default fallback
+            return self._most_recent_date
             
         date_folders = [f.name for f in docs_path.iterdir() if f.is_dir() and f.name.startswith("2025")]
-        return max(date_folders) if date_folders else "2025-09-05"
\ No newline at end of file
+        self._most_recent_date = max(date_folders) if date_folders else "2025-09-05"
+        return self._most_recent_date
\ No newline at end of file
@@ -0,0 +1,195 @@
+"""
+SOP Corpus Index
+================
+
+In-memory index of the SOP markdown corpus for one authoritative date.
+
+Every ``docs/<date>/*.md`` file is read once and split into lines, and an
+inverted index maps each lowercased word to the lines containing it.
+Compliance keywords are plain word characters, so a keyword occurs in a
+line exactly when it occurs inside one of the line's words. Keyword lookups
+therefore only touch matching lines instead of rescanning file contents.
+
+The index is refreshed by mtime off the query path: a background thread
+re-stats the directory every ``refresh_interval`` seconds (started with
+``start_refresher``) and only changed files are re-read. Refreshes build
+the new index outside the query lock and swap it in, so queries never
+wait on disk I/O.
+
+Part of tidyllm-compliance: Automated compliance with complete transparency
+"""
+
+import re
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+WORD_PATTERN = re.compile(r'\w+')
+GUIDANCE_INDICATORS = ('use', 'should', 'must', 'required')
+
+
+@dataclass
+class IndexedSOPDocument:
+    """One SOP file split into lines with a word -> line-number index."""
+    name: str
+    lines: List[str]
+    mtime_ns: int = 0
+    size: int = 0
+    postings: Dict[str, Set[int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_content(cls, name: str, content: str, mtime_ns: int = 0, size: int = 0) -> "IndexedSOPDocument":
+        doc = cls(name=name, lines=content.split('\n'), mtime_ns=mtime_ns, size=size)
+        for line_number, line in enumerate(doc.lines):
+            for word in WORD_PATTERN.findall(line.lower()):
+                doc.postings.setdefault(word, set()).add(line_number)
+        return doc
+
+    def section(self, line_number: int) -> str:
+        """Two lines of context either side, as the fallback has always returned."""
+        start = max(0, line_number - 2)
+        end = min(len(self.lines), line_number + 3)
+        return '\n'.join(self.lines[start:end]).strip()
+
+
+class SOPCorpusIndex:
+    """Inverted index over the SOP files of one date folder."""
+
+    def __init__(self, docs_path: Path, refresh_interval: float = 5.0):
+        self.docs_path = Path(docs_path)
+        self.refresh_interval = refresh_interval
+        self.documents: Dict[str, IndexedSOPDocument] = {}
+        self._word_docs: Dict[str, Set[str]] = {}
+        self._keyword_words: Dict[str, List[str]] = {}
+        self.exists = False
+        self._last_checked = 0.0
+        self._lock = threading.RLock()  # Queries may run on reporter worker threads
+        self._refresh_lock = threading.Lock()  # Serializes rescans without blocking queries
+        self._refresher: Optional[threading.Thread] = None
+        self._stop_refresher = threading.Event()
+        self.refresh(force=True)
+
+    def refresh(self, force: bool = False) -> bool:
+        """Re-read files whose mtime or size changed. Returns True if the index changed."""
+        with self._refresh_lock:
+            return self._refresh(force)
+
+    def start_refresher(self):
+        """Refresh every ``refresh_interval`` seconds on a daemon thread (no-op if running)."""
+        if self.refresh_interval <= 0 or (self._refresher and self._refresher.is_alive()):
+            return
+        self._stop_refresher.clear()
+        self._refresher = threading.Thread(
+            target=_refresh_periodically,
+            args=(weakref.ref(self), self._stop_refresher, self.refresh_interval),
+            name=f"sop-index-{self.docs_path.name}", daemon=True
+        )
+        self._refresher.start()
+
+    def close(self):
+        """Stop the background refresher."""
+        self._stop_refresher.set()
+
+    def _refresh(self, force: bool) -> bool:
+        now = time.monotonic()
+        if not force and now - self._last_checked < self.refresh_interval:
+            return False
+        self._last_checked = now
+
+        current: Dict[str, Tuple[Path, int, int]] = {}
+        self.exists = self.docs_path.is_dir()
+        if self.exists:
+            for doc_file in sorted(self.docs_path.glob("*.md")):
+                try:
+                    stat = doc_file.stat()
+                except OSError:
+                    continue
+                current[doc_file.name] = (doc_file, stat.st_mtime_ns, stat.st_size)
+
+        changed = set(self.documents) - set(current)
+        documents = {}
+        for name, (doc_file, mtime_ns, size) in current.items():
+            existing = self.documents.get(name)
+            if existing and existing.mtime_ns == mtime_ns and existing.size == size:
+                documents[name] = existing
+                continue
+            try:
+                with open(doc_file, 'r', encoding='utf-8', errors='ignore') as f:
+                    documents[name] = IndexedSOPDocument.from_content(name, f.read(), mtime_ns, size)
+                changed.add(name)
+            except Exception:
+                continue
+
+        if not changed:
+            return False
+
+        word_docs: Dict[str, Set[str]] = {}
+        for name, doc in documents.items():
+            for word in doc.postings:
+                word_docs.setdefault(word, set()).add(name)
+        with self._lock:
+            self.documents = documents
+            self._word_docs = word_docs
+            self._keyword_words = {}
+        return True
+
+    def _words_containing(self, keyword: str) -> List[str]:
+        """Indexed words that contain the keyword (memoized per index version)."""
+        words = self._keyword_words.get(keyword)
+        if words is None:
+            words = [word for word in self._word_docs if keyword in word]
+            self._keyword_words[keyword] = words
+        return words
+
+    def matching_lines(self, keywords: List[str]) -> Dict[str, List[int]]:
+        """Line numbers per document that contain any keyword, in document order."""
+        hits: Dict[str, Set[int]] = {}
+        with self._lock:
+            for keyword in {k.lower() for k in keywords}:
+                for word in self._words_containing(keyword):
+                    for name in self._word_docs[word]:
+                        hits.setdefault(name, set()).update(self.documents[name].postings[word])
+        return {name: sorted(lines) for name, lines in hits.items()}
+
+    @staticmethod
+    def guidance_sections(doc: IndexedSOPDocument, line_numbers: List[int],
+                          limit: int = 5) -> List[str]:
+        """Actionable sections around matching lines, first ``limit`` in document order."""
+        sections = []
+        for line_number in line_numbers:
+            section = doc.section(line_number)
+            lowered = section.lower()
+            if any(indicator in lowered for indicator in GUIDANCE_INDICATORS):
+                sections.append(section)
+                if len(sections) == limit:
+                    break
+        return sections
+
+    def search(self, keywords: List[str], limit: int = 5) -> List[Tuple[str, List[str]]]:
+        """Return (document name, sections) for every document with guidance, in file order."""
+        with self._lock:
+            matches = self.matching_lines(keywords)
+            documents = self.documents
+        results = []
+        for name in sorted(matches):
+            sections = self.guidance_sections(documents[name], matches[name], limit)
+            if sections:
+                results.append((name, sections))
+        return results
+
+
+def _refresh_periodically(index_ref: "weakref.ref[SOPCorpusIndex]", stop: threading.Event,
+                          interval: float):
+    """Refresher loop; holds the index weakly so an unused index can still be collected."""
+    while not stop.wait(interval):
+        index = index_ref()
+        if index is None:
+            return
+        try:
+            index.refresh(force=True)
+        except Exception:
+            pass  # A failed rescan keeps serving the previous index
+        del index
@@ -9,14 +9,18 @@ standards the highest priority.
 Part of tidyllm-compliance: Automated compliance with complete transparency
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
+from collections import OrderedDict
 import json
+import re
+import threading
 from dataclasses import dataclass
 
 # Import existing compliance components
 from ..model_risk import ModelRiskMonitor
 from ..evidence import EvidenceValidator
+from ..document_context import DocumentAnalysisContext
 
 # Import SOP conflict analysis components
 from ..sop_conflict_analysis import SOPConflictReporter, YRSNNoiseAnalyzer, TemporalResolver, ComplianceSOPFallback
@@ -72,6 +76,42 @@ class SOPValidator:
             'guidance': 0.6,    # General guidance - medium precedence
             'fallback': 0.4     # General compliance rules - lowest precedence
         }
+        
+        # Stage/keyword indexes over the golden answers, plus memoized lookups
+        self.query_cache_size = 1024
+        self._query_cache: "OrderedDict[Tuple[str, str], Tuple[SOPAnswer, ...]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._build_answer_index()
+    
+    def _build_answer_index(self):
+        """Index golden answers by workflow stage and answer_id keyword.
+        
+        Precedence order is computed once here, so queries only merge the
+        candidate ids and sort them by their precomputed rank.
+        """
+        self._stage_index: Dict[Optional[str], List[str]] = {}
+        self._keyword_index: Dict[str, List[str]] = {}
+        for answer_id, sop_answer in self.sop_answers.items():
+            self._stage_index.setdefault(sop_answer.workflow_stage, []).append(answer_id)
+            for keyword in set(answer_id.split('_')):
+                self._keyword_index.setdefault(keyword, []).append(answer_id)
+        
+        ranked = sorted(
+            self.sop_answers,
+            key=lambda answer_id: (
+                self.precedence_levels.get(self.sop_answers[answer_id].precedence_level, 0),
+                self.sop_answers[answer_id].confidence
+            ),
+            reverse=True
+        )
+        self._precedence_rank = {answer_id: rank for rank, answer_id in enumerate(ranked)}
+        with self._query_cache_lock:
+            self._query_cache.clear()
+    
+    def add_sop_answer(self, answer_id: str, sop_answer: SOPAnswer):
+        """Add or replace a golden answer and refresh the indexes."""
+        self.sop_answers[answer_id] = sop_answer
+        self._build_answer_index()
     
     def _load_sop_golden_answers(self) -> Dict[str, SOPAnswer]:
         """Load SOP golden answers from knowledge base."""
@@ -188,21 +228,31 @@ class SOPValidator:
     
     def _query_sop_answers(self, question: str, context: Dict[str, Any]) -> List[SOPAnswer]:
         """Query SOP golden answers for relevant responses."""
-        matches = []
-        
         # Get current workflow stage from context
         current_stage = context.get('workflow_stage', 'unknown')
-        
-        # Find SOP answers relevant to current stage and question
-        for answer_id, sop_answer in self.sop_answers.items():
-            if (sop_answer.workflow_stage == current_stage or 
-                any(keyword in question.lower() for keyword in answer_id.split('_'))):
-                matches.append(sop_answer)
-        
-        # Sort by precedence level and confidence
-        matches.sort(key=lambda x: (self.precedence_levels.get(x.precedence_level, 0), x.confidence), reverse=True)
-        
-        return matches
+        normalized_question = question.lower()
+        
+        cache_key = (normalized_question, current_stage)
+        with self._query_cache_lock:
+            cached = self._query_cache.get(cache_key)
+            if cached is not None:
+                self._query_cache.move_to_end(cache_key)
+                return list(cached)
+        
+        # Answers for the current stage, plus answers whose id keywords are words of the question
+        answer_ids = set(self._stage_index.get(current_stage, []))
+        for token in set(re.findall(r'[a-z0-9]+', normalized_question)):
+            answer_ids.update(self._keyword_index.get(token, ()))
+        
+        # Sort by precedence level and confidence (precomputed)
+        matches = tuple(self.sop_answers[answer_id]
+                        for answer_id in sorted(answer_ids, key=self._precedence_rank.get))
+        
+        with self._query_cache_lock:
+            self._query_cache[cache_key] = matches
+            if len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+        return list(matches)
     
     def _check_sop_compliance(self, sop_answers: List[SOPAnswer], context: Dict[str, Any]) -> bool:
         """Check if context meets SOP compliance requirements."""
@@ -257,8 +307,10 @@ class SOPValidator:
         document_text = context.get('document_text', '')
         
         if document_text:
-            model_risk_result = self.model_risk_monitor.assess_document_compliance(document_text)
-            evidence_result = self.evidence_validator.validate_document(document_text)
+            # One normalization shared by both validators
+            document_context = DocumentAnalysisContext(document_text)
+            model_risk_result = self.model_risk_monitor.assess_document_compliance(document_context)
+            evidence_result = self.evidence_validator.validate_document(document_context)
             
             return {
                 'recommendations': [
@@ -288,11 +340,11 @@ class SOPValidator:
             'compliance_rules': []
         }
         
-        for answer_id, sop_answer in self.sop_answers.items():
-            if sop_answer.workflow_stage == stage:
-                stage_requirements['sop_answers'].append(sop_answer)
-                if sop_answer.checklist_items:
-                    stage_requirements['checklist_items'].extend(sop_answer.checklist_items)
+        for answer_id in self._stage_index.get(stage, []):
+            sop_answer = self.sop_answers[answer_id]
+            stage_requirements['sop_answers'].append(sop_answer)
+            if sop_answer.checklist_items:
+                stage_requirements['checklist_items'].extend(sop_answer.checklist_items)
         
         return stage_requirements
     
@@ -10,6 +10,7 @@ Available modules:
 - data_normalizer: Data normalization utilities for portals
 - step_ordering: Step and workflow ordering utilities
 - json_scrubber: JSON content cleaning utilities
+- lazy_imports: Deferred imports for heavy optional dependencies
 """
 
 from .path_manager import PathManager, get_path_manager, get_config_path, get_data_path, get_logs_path
@@ -24,6 +25,7 @@ from .step_ordering import (
     validate_step_order
 )
 from .json_scrubber import JSONScrubber, safe_load_json_with_scrubbing
+from .lazy_imports import LazyModule, lazy_import, module_available
 
 __all__ = [
     # Path management
@@ -51,5 +53,10 @@ __all__ = [
 
     # JSON scrubbing
     'JSONScrubber',
-    'safe_load_json_with_scrubbing'
+    'safe_load_json_with_scrubbing',
+
+    # Lazy imports
+    'LazyModule',
+    'lazy_import',
+    'module_available'
 ]
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""
+Lazy Imports
+============
+
+Deferred loading for heavy optional dependencies (pandas, boto3, MLflow,
+DSPy, tidyllm_sentence).
+
+``lazy_import("pandas")`` returns a module proxy immediately; the real
+import runs on first attribute access, so importing a portal or service
+no longer pays for libraries it never uses. ``module_available`` answers
+the ``*_AVAILABLE`` question from the import system's finder without
+importing anything.
+
+The two checks differ for a package that is installed but broken (a
+missing native library, an incompatible dependency). ``module_available``
+reports it as available, because the finder can locate it. Its first use
+then raises ``ImportError``, just as the old eager ``try: import`` would
+have at startup. Code that must fall back instead of failing should ask
+the proxy: ``proxy.is_available()`` really imports the module and returns
+False if that fails. The failure is remembered, so the import is not
+retried on every access.
+
+Usage:
+    from common.utilities.lazy_imports import lazy_import, module_available
+
+    pd = lazy_import("pandas")
+    PANDAS_AVAILABLE = module_available("pandas")
+
+    def load(path):
+        return pd.read_parquet(path)   # pandas is imported here
+
+    def summarize(rows):
+        if not pd.is_available():      # installed but broken -> fallback
+            return rows
+        return pd.DataFrame(rows).describe()
+"""
+
+import importlib
+import importlib.util
+import threading
+import types
+from typing import Any
+
+
+def module_available(name: str) -> bool:
+    """True if ``name`` can be found on the import path (without importing it).
+
+    A module that is found but fails to import still reports True; see
+    ``LazyModule.is_available`` for the import-verified check.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        # find_spec imports parent packages for dotted names
+        return False
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+        self.__dict__['_lazy_error'] = None
+        self.__dict__['_lazy_lock'] = threading.Lock()
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            with self.__dict__['_lazy_lock']:
+                module = self.__dict__['_lazy_module']
+                if module is None:
+                    error = self.__dict__['_lazy_error']
+                    if error is None:
+                        try:
+                            module = importlib.import_module(self.__name__)
+                        except ImportError as e:
+                            error = e
+                            self.__dict__['_lazy_error'] = e
+                        else:
+                            self.__dict__['_lazy_module'] = module
+                    if error is not None:
+                        raise ImportError(f"Optional dependency '{self.__name__}' could not be imported: {error}",
+                                          name=self.__name__) from error
+        return module
+
+    def is_available(self) -> bool:
+        """Import the module if needed; False (instead of raising) if the import fails."""
+        try:
+            self._load()
+            return True
+        except ImportError:
+            return False
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        if self.__dict__['_lazy_module'] is not None:
+            state = "loaded"
+        elif self.__dict__['_lazy_error'] is not None:
+            state = "import failed"
+        else:
+            state = "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Return a proxy for module ``name``; the import happens on first use."""
+    return LazyModule(name)
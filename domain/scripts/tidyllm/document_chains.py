@@ -13,7 +13,11 @@ This preserves the existing sophisticated chaining while providing a clean user
 
 import json
 import logging
-from typing import Dict, List, Any, Optional, Union, Callable
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Union, Callable, Iterable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
@@ -75,6 +79,42 @@ class ChainConfig:
     timeout_per_stage: float = 30.0
     retry_attempts: int = 1
     enable_caching: bool = True
+    queue_size: int = 4  # Bounded queue between pipeline stages
+
+
+@dataclass
+class StageStats:
+    """Throughput and queue-depth statistics for one chain stage."""
+    stage: str
+    items_processed: int = 0
+    items_skipped: int = 0
+    busy_time: float = 0.0
+    wall_time: float = 0.0
+    max_queue_depth: int = 0
+    queue_depth_total: int = 0
+    queue_depth_samples: int = 0
+    
+    def sample_queue(self, depth: int):
+        """Record the depth of the stage's input queue."""
+        self.max_queue_depth = max(self.max_queue_depth, depth)
+        self.queue_depth_total += depth
+        self.queue_depth_samples += 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "items_processed": self.items_processed,
+            "items_skipped": self.items_skipped,
+            "busy_time": self.busy_time,
+            "throughput_per_sec": self.items_processed / self.wall_time if self.wall_time > 0 else 0.0,
+            "utilization": self.busy_time / self.wall_time if self.wall_time > 0 else 0.0,
+            "max_queue_depth": self.max_queue_depth,
+            "avg_queue_depth": (self.queue_depth_total / self.queue_depth_samples
+                                if self.queue_depth_samples else 0.0)
+        }
+
+
+_END_OF_STREAM = object()
 
 
 class DocumentOperationChain:
@@ -88,17 +128,36 @@ class DocumentOperationChain:
     - Provide metrics and logging
     """
     
-    def __init__(self, operation: DocumentOperation, handler: Callable, **config):
-        """Initialize chain operation."""
+    def __init__(self, operation: DocumentOperation, handler: Callable,
+                 *, depends_on: Optional[List[str]] = None, **config):
+        """Initialize chain operation.
+        
+        Args:
+            operation: Operation type
+            handler: Callable taking (context, **config)
+            depends_on: Operation names this one reads from. None means it
+                depends on every earlier operation in the chain; an explicit
+                list lets PARALLEL mode run it alongside its siblings.
+            **config: Passed through to the handler
+        """
         self.operation = operation
         self.handler = handler
+        self.depends_on = depends_on
         self.config = config
         self.metrics = {"calls": 0, "errors": 0, "total_time": 0.0}
+        self._metrics_lock = threading.Lock()
+    
+    @property
+    def name(self) -> str:
+        return self.operation.value
     
     def __call__(self, context: ChainContext) -> ChainContext:
         """Execute this operation in the chain."""
-        start_time = datetime.now()
-        self.metrics["calls"] += 1
+        return self.apply(context, *self.run(context))
+    
+    def run(self, context: ChainContext) -> Tuple[Any, Optional[str]]:
+        """Run the handler without touching the context; returns (result, error)."""
+        start_time = time.perf_counter()
         
         try:
             logger.info(f"Executing {self.operation.value} operation")
@@ -106,22 +165,32 @@ class DocumentOperationChain:
             # Execute the handler with context
             result = self.handler(context, **self.config)
             
-            # Update context with result
-            if result is not None:
-                context.data = result
-            context.add_result(self.operation.value, result)
-            
-            processing_time = (datetime.now() - start_time).total_seconds()
-            self.metrics["total_time"] += processing_time
+            processing_time = time.perf_counter() - start_time
+            with self._metrics_lock:
+                self.metrics["calls"] += 1
+                self.metrics["total_time"] += processing_time
             
             logger.info(f"Completed {self.operation.value} in {processing_time:.2f}s")
+            return result, None
             
         except Exception as e:
-            self.metrics["errors"] += 1
+            with self._metrics_lock:
+                self.metrics["calls"] += 1
+                self.metrics["errors"] += 1
             error_msg = f"Error in {self.operation.value}: {str(e)}"
-            context.errors.append(error_msg)
             logger.error(error_msg)
+            return None, error_msg
+    
+    def apply(self, context: ChainContext, result: Any, error: Optional[str]) -> ChainContext:
+        """Merge the outcome of run() into the context."""
+        if error:
+            context.errors.append(error)
+            return context
         
+        # Update context with result
+        if result is not None:
+            context.data = result
+        context.add_result(self.operation.value, result)
         return context
     
     def __rshift__(self, next_operation: 'DocumentOperationChain') -> 'DocumentChain':
@@ -142,6 +211,8 @@ class DocumentChain:
         self.operations = operations or []
         self.config = ChainConfig()
         self.execution_history: List[Dict[str, Any]] = []
+        self.stage_stats: Dict[str, StageStats] = {}
+        self._stats_lock = threading.Lock()  # DAG levels time operations on pool threads
     
     def add(self, operation: DocumentOperationChain) -> 'DocumentChain':
         """Add operation to chain."""
@@ -165,6 +236,8 @@ class DocumentChain:
         execution_start = datetime.now()
         
         logger.info(f"Executing document chain with {len(self.operations)} operations")
+        self._reset_stage_stats()
+        batch_start = time.perf_counter()
         
         try:
             if self.config.execution_mode == ChainExecutionMode.SEQUENTIAL:
@@ -175,6 +248,7 @@ class DocumentChain:
                 context = self._execute_parallel(context)
             else:  # AUTO
                 context = self._execute_auto(context)
+            self._close_stage_stats(time.perf_counter() - batch_start)
             
             execution_time = (datetime.now() - execution_start).total_seconds()
             
@@ -184,7 +258,8 @@ class DocumentChain:
                 "execution_time": execution_time,
                 "operations": [op.operation.value for op in self.operations],
                 "success": not context.has_errors(),
-                "errors": context.errors.copy()
+                "errors": context.errors.copy(),
+                "stage_stats": self.get_stage_stats()
             })
             
             logger.info(f"Chain execution completed in {execution_time:.2f}s")
@@ -198,7 +273,7 @@ class DocumentChain:
     def _execute_sequential(self, context: ChainContext) -> ChainContext:
         """Execute operations sequentially."""
         for operation in self.operations:
-            context = operation(context)
+            context = operation.apply(context, *self._timed_run(operation, context))
             
             # Stop on error if configured
             if self.config.stop_on_error and context.has_errors():
@@ -207,15 +282,192 @@ class DocumentChain:
         
         return context
     
+    def execute_many(self, items: Iterable[Any]) -> List[ChainContext]:
+        """Execute the chain once per item, returning one context per item.
+        
+        PIPELINE mode streams items through the stages over bounded queues,
+        so item N+1 is in the first stage while item N is in a later one.
+        PARALLEL mode runs whole items concurrently on a pool of
+        ``max_parallel`` workers. SEQUENTIAL runs items one at a time.
+        Results are returned in input order.
+        """
+        execution_start = datetime.now()
+        batch_start = time.perf_counter()
+        mode = self.config.execution_mode
+        if mode == ChainExecutionMode.AUTO:
+            mode = (ChainExecutionMode.SEQUENTIAL if len(self.operations) <= 3
+                    else ChainExecutionMode.PIPELINE)
+        
+        if mode == ChainExecutionMode.PIPELINE:
+            contexts = self._stream_pipeline(ChainContext(data=item) for item in items)
+        elif mode == ChainExecutionMode.PARALLEL:
+            self._reset_stage_stats()
+            # Items are independent; each one still honors its operation levels
+            with ThreadPoolExecutor(max_workers=max(1, self.config.max_parallel),
+                                    thread_name_prefix="doc-chain") as pool:
+                contexts = list(pool.map(self._run_levels, (ChainContext(data=item) for item in items)))
+        else:
+            self._reset_stage_stats()
+            contexts = [self._execute_sequential(ChainContext(data=item)) for item in items]
+        self._close_stage_stats(time.perf_counter() - batch_start)
+        
+        execution_time = (datetime.now() - execution_start).total_seconds()
+        self.execution_history.append({
+            "timestamp": execution_start.isoformat(),
+            "execution_time": execution_time,
+            "operations": [op.operation.value for op in self.operations],
+            "items": len(contexts),
+            "execution_mode": mode.value,
+            "success": all(not c.has_errors() for c in contexts),
+            "errors": [error for c in contexts for error in c.errors],
+            "stage_stats": self.get_stage_stats()
+        })
+        logger.info(f"Chain processed {len(contexts)} items in {execution_time:.2f}s ({mode.value})")
+        return contexts
+    
+    def get_stage_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage throughput and queue depth from the most recent run."""
+        return {name: stats.to_dict() for name, stats in self.stage_stats.items()}
+    
+    def _reset_stage_stats(self):
+        self.stage_stats = {op.name: StageStats(stage=op.name) for op in self.operations}
+    
+    def _close_stage_stats(self, batch_seconds: float):
+        """Give stages the batch's wall time (pipeline stages already timed their own span)."""
+        for stats in self.stage_stats.values():
+            if stats.wall_time == 0.0:
+                stats.wall_time = batch_seconds
+    
     def _execute_pipeline(self, context: ChainContext) -> ChainContext:
-        """Execute operations in pipeline mode (streaming)."""
-        # For now, same as sequential - could add streaming later
-        return self._execute_sequential(context)
+        """Execute operations in pipeline mode (streaming).
+        
+        A single context flows through the stage workers; use execute_many()
+        to overlap several documents across stages.
+        """
+        return self._stream_pipeline([context])[0]
+    
+    def _stream_pipeline(self, contexts: Iterable[ChainContext]) -> List[ChainContext]:
+        """Stream contexts through one worker thread per stage over bounded queues."""
+        self._reset_stage_stats()
+        if not self.operations:
+            return list(contexts)
+        
+        queues = [queue.Queue(maxsize=max(1, self.config.queue_size))
+                  for _ in self.operations]
+        queues.append(queue.Queue())  # Unbounded sink drained by this thread
+        pipeline_start = time.perf_counter()
+        feeder_errors: List[str] = []
+        
+        def feed():
+            try:
+                for context in contexts:
+                    queues[0].put(context)
+            except Exception as e:
+                feeder_errors.append(f"Pipeline input failed: {str(e)}")
+            finally:
+                queues[0].put(_END_OF_STREAM)
+        
+        def stage_worker(index: int, operation: DocumentOperationChain):
+            stats = self.stage_stats[operation.name]
+            inbox, outbox = queues[index], queues[index + 1]
+            while True:
+                stats.sample_queue(inbox.qsize())
+                context = inbox.get()
+                if context is _END_OF_STREAM:
+                    stats.wall_time = time.perf_counter() - pipeline_start
+                    outbox.put(_END_OF_STREAM)
+                    return
+                if self.config.stop_on_error and context.has_errors():
+                    stats.items_skipped += 1
+                else:
+                    started = time.perf_counter()
+                    operation(context)
+                    stats.busy_time += time.perf_counter() - started
+                    stats.items_processed += 1
+                outbox.put(context)
+        
+        threads = [threading.Thread(target=feed, name="doc-chain-feed", daemon=True)]
+        threads.extend(
+            threading.Thread(target=stage_worker, args=(i, op),
+                             name=f"doc-chain-{op.name}", daemon=True)
+            for i, op in enumerate(self.operations)
+        )
+        for thread in threads:
+            thread.start()
+        
+        results = []
+        while True:
+            context = queues[-1].get()
+            if context is _END_OF_STREAM:
+                break
+            results.append(context)
+        for thread in threads:
+            thread.join()
+        
+        if feeder_errors:
+            if results:
+                results[-1].errors.extend(feeder_errors)
+            else:
+                results.append(ChainContext(errors=feeder_errors))
+        return results
     
     def _execute_parallel(self, context: ChainContext) -> ChainContext:
         """Execute operations in parallel where possible."""
-        # For now, same as sequential - would need dependency analysis
-        return self._execute_sequential(context)
+        return self._run_levels(context)
+    
+    def _dependency_levels(self) -> List[List[DocumentOperationChain]]:
+        """Group operations into levels whose members do not depend on each other."""
+        levels: List[List[DocumentOperationChain]] = []
+        level_of: Dict[str, int] = {}
+        for operation in self.operations:
+            if operation.depends_on is None:
+                # Implicit dependency on everything before it
+                level = max(level_of.values(), default=-1) + 1
+            else:
+                level = max((level_of[dep] + 1 for dep in operation.depends_on if dep in level_of),
+                            default=0)
+            while len(levels) <= level:
+                levels.append([])
+            levels[level].append(operation)
+            level_of[operation.name] = level
+        return levels
+    
+    def _run_levels(self, context: ChainContext) -> ChainContext:
+        """Run dependency levels in order, fanning out each level over a pool."""
+        levels = self._dependency_levels()
+        pool = None
+        try:
+            for level in levels:
+                if len(level) == 1 or self.config.max_parallel <= 1:
+                    outcomes = [self._timed_run(op, context) for op in level]
+                else:
+                    if pool is None:
+                        pool = ThreadPoolExecutor(max_workers=self.config.max_parallel,
+                                                  thread_name_prefix="doc-chain-op")
+                    futures = [pool.submit(self._timed_run, op, context) for op in level]
+                    outcomes = [future.result() for future in futures]
+                
+                # Merge in declaration order so context.data is deterministic
+                for operation, (result, error) in zip(level, outcomes):
+                    operation.apply(context, result, error)
+                
+                if self.config.stop_on_error and context.has_errors():
+                    logger.warning(f"Stopping chain execution due to errors: {context.errors}")
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+        return context
+    
+    def _timed_run(self, operation: DocumentOperationChain, context: ChainContext) -> Tuple[Any, Optional[str]]:
+        started = time.perf_counter()
+        outcome = operation.run(context)
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            stats = self.stage_stats.setdefault(operation.name, StageStats(stage=operation.name))
+            stats.items_processed += 1
+            stats.busy_time += elapsed
+        return outcome
     
     def _execute_auto(self, context: ChainContext) -> ChainContext:
         """Auto-select best execution mode."""
@@ -251,20 +503,29 @@ class BackendDocumentPipeline:
             "indices_created": 0,
             "total_processing_time": 0.0
         }
+        self._stats_lock = threading.Lock()
+    
+    def _bump(self, stat: str, amount: Union[int, float]):
+        """Thread-safe stats update (stages may run on different threads)."""
+        with self._stats_lock:
+            self.processing_stats[stat] += amount
     
     def create_ingest_operation(self, source_config: Dict[str, Any]) -> DocumentOperationChain:
         """Create document ingestion operation."""
         def ingest_handler(context: ChainContext, **config) -> Dict[str, Any]:
             """Ingest documents from various sources."""
-            source_type = source_config.get("type", "local")
-            source_path = source_config.get("path", "")
-            domain = source_config.get("domain", "default")
+            # Streamed runs carry a per-item source config as the context data
+            item_config = context.data if isinstance(context.data, dict) and "type" in context.data else {}
+            effective_config = {**source_config, **item_config}
+            source_type = effective_config.get("type", "local")
+            source_path = effective_config.get("path", "")
+            domain = effective_config.get("domain", "default")
             
             if source_type == "s3":
                 from .knowledge_resource_server.sources import S3KnowledgeSource
                 source = S3KnowledgeSource(
-                    bucket=source_config["bucket"],
-                    prefix=source_config.get("prefix", "")
+                    bucket=effective_config["bucket"],
+                    prefix=effective_config.get("prefix", "")
                 )
             elif source_type == "local":
                 from .knowledge_resource_server.sources import LocalKnowledgeSource
@@ -276,7 +537,7 @@ class BackendDocumentPipeline:
             self.knowledge_server.register_domain(domain, source)
             
             doc_count = source.get_document_count()
-            self.processing_stats["documents_processed"] += doc_count
+            self._bump("documents_processed", doc_count)
             
             return {
                 "domain": domain,
@@ -296,7 +557,7 @@ class BackendDocumentPipeline:
             
             # Mock embedding generation - in production would generate real embeddings
             embeddings_generated = doc_count * 100  # Assume 100 chunks per document
-            self.processing_stats["embeddings_generated"] += embeddings_generated
+            self._bump("embeddings_generated", embeddings_generated)
             
             return {
                 "domain": domain,
@@ -319,7 +580,7 @@ class BackendDocumentPipeline:
             
             # Mock index creation
             indices_created = 1
-            self.processing_stats["indices_created"] += indices_created
+            self._bump("indices_created", indices_created)
             
             return {
                 "vector_db": vector_db,
@@ -391,10 +652,33 @@ class BackendDocumentPipeline:
         pipeline.configure(
             execution_mode=ChainExecutionMode(execution_mode),
             stop_on_error=pipeline_config.get("stop_on_error", True),
-            timeout_per_stage=pipeline_config.get("timeout_per_stage", 30.0)
+            timeout_per_stage=pipeline_config.get("timeout_per_stage", 30.0),
+            max_parallel=pipeline_config.get("max_parallel", 3),
+            queue_size=pipeline_config.get("queue_size", 4)
         )
         
         return pipeline
+    
+    def process_sources(self, source_configs: Iterable[Dict[str, Any]], **pipeline_config) -> List[ChainContext]:
+        """Run INGEST → EMBED → INDEX → TRACK → REPORT over many sources.
+        
+        Defaults to PIPELINE mode so ingest of source N+1 overlaps embedding
+        and indexing of source N. Per-stage throughput and queue depth are
+        attached to each returned context as ``metadata["stage_stats"]``.
+        """
+        source_configs = list(source_configs)
+        pipeline_config.setdefault("execution_mode", ChainExecutionMode.PIPELINE.value)
+        base_config = source_configs[0] if source_configs else {}
+        pipeline = self.create_full_pipeline(base_config, **pipeline_config)
+        
+        started = time.perf_counter()
+        contexts = pipeline.execute_many(source_configs)
+        self._bump("total_processing_time", time.perf_counter() - started)
+        
+        stage_stats = pipeline.get_stage_stats()
+        for context in contexts:
+            context.metadata["stage_stats"] = stage_stats
+        return contexts
 
 
 # =============================================================================
@@ -25,11 +25,44 @@ sys.path.append(str(Path(__file__).parent.parent))
 from scripts.start_unified_sessions import UnifiedSessionManager
 from flow.agreements.mvr_analysis import MVRAnalysisFlowAgreement, MVRAnalysisConfig
 import json
+import struct
+from array import array
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import tidyllm.tlm as np  # TidyLLM native math
 import tidyllm_sentence as tls  # TidyLLM native embeddings
 import polars as pl  # Approved data processing
 
+NPY_MAGIC = b"\x93NUMPY"
+
+
+def encode_float32_npy(rows) -> tuple:
+    """
+    Encode a 2-D list of floats as a little-endian float32 .npy file.
+
+    Written with array/struct so no numpy is needed here; the result loads
+    with numpy.load() wherever numpy is available. Returns (bytes, shape).
+    """
+    if hasattr(rows, 'tolist'):
+        rows = rows.tolist()
+    rows = [list(row) for row in rows]
+    width = len(rows[0]) if rows else 0
+    if any(len(row) != width for row in rows):
+        raise ValueError("Embedding rows must all have the same dimension")
+
+    values = array('f')
+    for row in rows:
+        values.extend(float(v) for v in row)
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    shape = (len(rows), width)
+    header = "{'descr': '<f4', 'fortran_order': False, 'shape': (%d, %d), }" % shape
+    # Magic (6) + version (2) + header length (2) + header, padded to 64 bytes
+    padding = 64 - (10 + len(header) + 1) % 64
+    header = (header + " " * padding + "\n").encode('latin1')
+    return NPY_MAGIC + b"\x01\x00" + struct.pack('<H', len(header)) + header + values.tobytes(), shape
+
 
 class S3MVRProcessor:
     """
@@ -41,7 +74,7 @@ class S3MVRProcessor:
     - TidyLLM native stack only
     """
     
-    def __init__(self):
+    def __init__(self, upload_workers: int = 5):
         # Use unified session manager (REQUIRED)
         self.session_mgr = UnifiedSessionManager()
         self.s3_client = self.session_mgr.get_s3_client()
@@ -63,6 +96,32 @@ class S3MVRProcessor:
             output_directory="s3://nsc-mvp1/mvr-reports/"  # S3 output
         )
         self.flow_agreement = MVRAnalysisFlowAgreement(self.mvr_config)
+        
+        # Shared pool for S3 uploads (reports + embedding artifacts)
+        self.upload_workers = upload_workers
+        self._upload_pool = None
+    
+    def _get_upload_pool(self) -> ThreadPoolExecutor:
+        if self._upload_pool is None:
+            self._upload_pool = ThreadPoolExecutor(max_workers=self.upload_workers,
+                                                   thread_name_prefix="mvr-upload")
+        return self._upload_pool
+    
+    def _upload_all(self, uploads: dict):
+        """Upload {key: bytes} concurrently; raise if any upload failed."""
+        pool = self._get_upload_pool()
+        futures = {
+            pool.submit(self.session_mgr.upload_to_s3, s3_config["bucket"], key, body): key
+            for key, body in uploads.items()
+        }
+        errors = []
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                errors.append(f"{futures[future]}: {e}")
+        if errors:
+            raise RuntimeError(f"S3 upload failed for {len(errors)} object(s): {'; '.join(errors)}")
     
     def process_mvr_from_s3(self, bucket: str, key: str) -> dict:
         """
@@ -82,45 +141,51 @@ class S3MVRProcessor:
         # Generate embeddings using TidyLLM native (NOT sentence-transformers)
         embeddings, model = tls.tfidf_fit_transform([text_content])
         
-        # Process through three report types
+        # Process through three report types (sections parsed once)
+        sections = self._parse_sections_native(text_content)
         reports = {
-            "compliance": self._generate_compliance_report(text_content, embeddings),
-            "intelligence": self._generate_intelligence_report(text_content, embeddings),
-            "knowledge": self._generate_knowledge_report(text_content, embeddings)
+            "compliance": self._generate_compliance_report(text_content, embeddings, sections),
+            "intelligence": self._generate_intelligence_report(text_content, embeddings, sections),
+            "knowledge": self._generate_knowledge_report(text_content, embeddings, sections)
         }
         
         # Save all outputs directly to S3 (NO LOCAL STORAGE)
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         doc_name = Path(key).stem
         
+        uploads = {}
+        report_keys = {}
         for report_type, report_data in reports.items():
-            # Save report to S3
             report_key = f"reports/{report_type}/{doc_name}_{timestamp}.json"
-            self.session_mgr.upload_to_s3(
-                s3_config["bucket"],
-                report_key,
-                json.dumps(report_data, indent=2).encode()
-            )
-            print(f"✅ {report_type.capitalize()} report saved to S3: {report_key}")
+            report_keys[report_type] = report_key
+            uploads[report_key] = json.dumps(report_data, indent=2, default=str).encode()
         
-        # Save embeddings to S3
-        embeddings_key = f"embeddings/{doc_name}_{timestamp}.json"
-        embeddings_data = {
+        # Embeddings as a float32 .npy artifact plus a small JSON manifest
+        embeddings_key = f"embeddings/{doc_name}_{timestamp}.npy"
+        manifest_key = f"embeddings/{doc_name}_{timestamp}.json"
+        npy_bytes, shape = encode_float32_npy(embeddings)
+        uploads[embeddings_key] = npy_bytes
+        uploads[manifest_key] = json.dumps({
             "document": key,
-            "embeddings": embeddings.tolist() if hasattr(embeddings, 'tolist') else embeddings,
+            "artifact": embeddings_key,
+            "format": "npy",
+            "dtype": "float32",
+            "shape": list(shape),
+            "bytes": len(npy_bytes),
             "model_info": "tidyllm_sentence_tfidf"
-        }
-        self.session_mgr.upload_to_s3(
-            s3_config["bucket"],
-            embeddings_key,
-            json.dumps(embeddings_data).encode()
-        )
+        }).encode()
+        
+        # Reports and artifacts go up concurrently
+        self._upload_all(uploads)
+        for report_type, report_key in report_keys.items():
+            print(f"✅ {report_type.capitalize()} report saved to S3: {report_key}")
+        print(f"✅ Embeddings saved to S3: {embeddings_key} ({shape[0]}x{shape[1]} float32)")
         
         # Log to MLflow (PostgreSQL direct)
         self.session_mgr.log_mlflow_experiment({
             "document": f"s3://{bucket}/{key}",
             "reports_generated": list(reports.keys()),
-            "embedding_dims": len(embeddings[0]) if embeddings else 0,
+            "embedding_dims": shape[1],
             "timestamp": timestamp
         })
         
@@ -128,7 +193,55 @@ class S3MVRProcessor:
             "status": "success",
             "document": f"s3://{bucket}/{key}",
             "reports": reports,
-            "embeddings_location": f"s3://nsc-mvp1/{embeddings_key}"
+            "report_locations": {t: f"s3://nsc-mvp1/{k}" for t, k in report_keys.items()},
+            "embeddings_location": f"s3://nsc-mvp1/{embeddings_key}",
+            "embeddings_manifest": f"s3://nsc-mvp1/{manifest_key}"
+        }
+    
+    def list_mvr_keys(self, bucket: str, prefix: str) -> list:
+        """List object keys under a prefix, following pagination."""
+        keys = []
+        kwargs = {"Bucket": bucket, "Prefix": prefix}
+        while True:
+            response = self.s3_client.list_objects_v2(**kwargs)
+            keys.extend(obj["Key"] for obj in response.get("Contents", []) if not obj["Key"].endswith("/"))
+            if not response.get("IsTruncated"):
+                return keys
+            kwargs["ContinuationToken"] = response["NextContinuationToken"]
+    
+    def process_prefix(self, bucket: str, prefix: str, max_workers: int = 4,
+                       include_reports: bool = False) -> dict:
+        """
+        Process every MVR document under an S3 prefix on a worker pool.
+        
+        A failing document is recorded in "errors" and does not stop the
+        batch. Reports are left in S3 unless include_reports is set.
+        """
+        keys = self.list_mvr_keys(bucket, prefix)
+        print(f"📋 {len(keys)} MVR documents under s3://{bucket}/{prefix}")
+        
+        results, errors = {}, {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mvr-doc") as pool:
+            futures = {pool.submit(self.process_mvr_from_s3, bucket, key): key for key in keys}
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors[key] = str(e)
+                    print(f"❌ Failed: s3://{bucket}/{key}: {e}")
+                    continue
+                if not include_reports:
+                    result = {k: v for k, v in result.items() if k != "reports"}
+                results[key] = result
+        
+        return {
+            "status": "success" if not errors else ("partial" if results else "failed"),
+            "prefix": f"s3://{bucket}/{prefix}",
+            "processed": len(results),
+            "failed": len(errors),
+            "results": results,
+            "errors": errors
         }
     
     def _extract_text_from_stream(self, document_stream: bytes) -> str:
@@ -146,10 +259,11 @@ class S3MVRProcessor:
         
         return text
     
-    def _generate_compliance_report(self, text: str, embeddings) -> dict:
+    def _generate_compliance_report(self, text: str, embeddings, sections: list = None) -> dict:
         """Generate compliance report using TidyLLM native processing."""
         # Parse sections using TidyLLM native methods
-        sections = self._parse_sections_native(text)
+        if sections is None:
+            sections = self._parse_sections_native(text)
         
         report = {
             "type": "compliance",
@@ -169,10 +283,11 @@ class S3MVRProcessor:
         
         return report
     
-    def _generate_intelligence_report(self, text: str, embeddings) -> dict:
+    def _generate_intelligence_report(self, text: str, embeddings, sections: list = None) -> dict:
         """Generate intelligence report using TidyLLM native processing."""
         # Use polars for data processing (NOT pandas)
-        sections = self._parse_sections_native(text)
+        if sections is None:
+            sections = self._parse_sections_native(text)
         
         # Create polars dataframe
         df = pl.DataFrame({
@@ -193,9 +308,10 @@ class S3MVRProcessor:
         
         return report
     
-    def _generate_knowledge_report(self, text: str, embeddings) -> dict:
+    def _generate_knowledge_report(self, text: str, embeddings, sections: list = None) -> dict:
         """Generate knowledge extraction report using TidyLLM native."""
-        sections = self._parse_sections_native(text)
+        if sections is None:
+            sections = self._parse_sections_native(text)
         
         report = {
             "type": "knowledge",
@@ -254,6 +370,18 @@ def main():
         help="S3 key of MVR document to process"
     )
     
+    parser.add_argument(
+        "--prefix",
+        help="Process every MVR document under this S3 prefix"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Documents processed concurrently with --prefix (default: 4)"
+    )
+    
     parser.add_argument(
         "--list",
         action="store_true",
@@ -290,12 +418,19 @@ def main():
         # Process specific document
         result = processor.process_mvr_from_s3(args.bucket, args.key)
         print("\n📊 Processing Complete:")
-        print(json.dumps(result, indent=2))
+        print(json.dumps(result, indent=2, default=str))
+    
+    elif args.prefix:
+        # Process every document under the prefix
+        summary = processor.process_prefix(args.bucket, args.prefix, max_workers=args.workers)
+        print(f"\n📊 Batch Complete: {summary['processed']} processed, {summary['failed']} failed")
+        print(json.dumps(summary, indent=2, default=str))
     
     else:
         print("Usage:")
         print("  python scripts/mvr_analysis_s3.py --list")
         print("  python scripts/mvr_analysis_s3.py --key mvr-raw/document.pdf")
+        print("  python scripts/mvr_analysis_s3.py --prefix mvr-raw/ --workers 8")
         print("\nAll processing happens S3 → S3 with no local storage!")
 
 
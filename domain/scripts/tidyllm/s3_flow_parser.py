@@ -15,7 +15,6 @@ Works across: CLI, API, UI, Chat, AND S3 Events
 import json
 import boto3
 import asyncio
-from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -27,6 +26,10 @@ from .universal_flow_parser import UniversalFlowParser, FlowParserInterface, Bra
 
 logger = logging.getLogger("s3_flow_parser")
 
+# Compiled once; matched against the filename part of every S3 key
+BRACKET_TRIGGER_PATTERN = re.compile(r'\[([^\]]+)\]\.trigger$')
+BRACKET_CACHE_SIZE = 4096  # Parsed trigger filenames kept between events
+
 @dataclass 
 class S3Event:
     """Represents an S3 event that could trigger a workflow."""
@@ -36,6 +39,7 @@ class S3Event:
     event_time: str
     object_size: int = 0
     etag: str = ""
+    sequencer: str = ""
     
     @classmethod
     def from_lambda_record(cls, record: Dict[str, Any]) -> 'S3Event':
@@ -47,8 +51,14 @@ class S3Event:
             event_name=record['eventName'],
             event_time=record['eventTime'],
             object_size=s3_data['object'].get('size', 0),
-            etag=s3_data['object'].get('eTag', '')
+            etag=s3_data['object'].get('eTag', ''),
+            sequencer=s3_data['object'].get('sequencer', '')
         )
+    
+    @property
+    def dedup_key(self) -> Tuple[str, str, str, str]:
+        """Identity of the underlying object version (S3 delivers at least once)."""
+        return (self.bucket_name, self.object_key, self.etag, self.sequencer)
 
 @dataclass
 class S3TriggerRule:
@@ -58,7 +68,100 @@ class S3TriggerRule:
     drop_zones: List[str]        # Drop zones that trigger this workflow
     action: Optional[str] = None # Specific action to execute
     conditions: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class S3RoutedEvent:
+    """An S3 event resolved to a workflow action."""
+    event: S3Event
+    workflow_name: str
+    action: str
+    parameters: List[str] = field(default_factory=list)
+
+
+@dataclass
+class S3EventBatch:
+    """Result of routing a full Lambda payload in one pass."""
+    groups: Dict[str, List[S3RoutedEvent]] = field(default_factory=dict)
+    unmatched: List[S3Event] = field(default_factory=list)
+    duplicates: int = 0
+    invalid_records: int = 0
+    total_records: int = 0
+    
+    @property
+    def matched(self) -> int:
+        return sum(len(events) for events in self.groups.values())
+
+
+class S3TriggerIndex:
+    """
+    Drop-zone trigger rules compiled into a prefix trie.
+    
+    The trie is keyed on bucket (or the wildcard for rules without a bucket
+    condition) and then on key path segments, so matching an event walks at
+    most the depth of its key instead of scanning every rule. Suffix and
+    regex conditions are only evaluated for the candidates found in the trie.
+    """
+    
+    _ANY_BUCKET = "*"
+    
+    def __init__(self):
+        self._root: Dict[str, Dict[str, Any]] = {}
+        self.entry_count = 0
     
+    @staticmethod
+    def _new_node() -> Dict[str, Any]:
+        return {"children": {}, "entries": []}
+    
+    def add(self, drop_zone: str, workflow_name: str, action: str, order: Tuple[int, int],
+            conditions: Optional[Dict[str, Any]] = None):
+        """Register a drop zone; ``order`` preserves rule precedence (rule, zone)."""
+        conditions = conditions or {}
+        bucket = conditions.get("bucket") or self._ANY_BUCKET
+        suffixes = conditions.get("suffix") or conditions.get("suffixes") or ()
+        if isinstance(suffixes, str):
+            suffixes = (suffixes,)
+        pattern = conditions.get("pattern") or conditions.get("regex")
+        
+        node = self._root.setdefault(bucket, self._new_node())
+        for segment in drop_zone.strip("/").split("/"):
+            node = node["children"].setdefault(segment, self._new_node())
+        node["entries"].append({
+            "order": order,
+            "workflow_name": workflow_name,
+            "action": action,
+            "drop_zone": drop_zone,
+            "suffixes": tuple(suffixes),
+            "pattern": re.compile(pattern) if pattern else None
+        })
+        self.entry_count += 1
+    
+    def match(self, object_key: str, bucket_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the highest-precedence entry whose drop zone contains the key."""
+        directories = object_key.split("/")[:-1]
+        best = None
+        roots = [self._root.get(self._ANY_BUCKET)]
+        if bucket_name:
+            roots.append(self._root.get(bucket_name))
+        
+        for node in roots:
+            if node is None:
+                continue
+            for segment in directories:
+                node = node["children"].get(segment)
+                if node is None:
+                    break
+                for entry in node["entries"]:
+                    if best is not None and entry["order"] >= best["order"]:
+                        continue
+                    if entry["suffixes"] and not object_key.endswith(entry["suffixes"]):
+                        continue
+                    if entry["pattern"] is not None and not entry["pattern"].search(object_key):
+                        continue
+                    best = entry
+        return best
+
+
 class S3FlowParser(UniversalFlowParser):
     """
     S3-integrated flow parser that handles bracket triggers from S3 events.
@@ -78,10 +181,11 @@ class S3FlowParser(UniversalFlowParser):
         self.s3_client = s3_client
         if self.s3_client is None:
             try:
-                # Use UnifiedSessionManager for S3 client
-                from tidyllm.infrastructure.session.unified import UnifiedSessionManager
-                session_mgr = UnifiedSessionManager()
-                self.s3_client = session_mgr.get_s3_client()
+                # Use the global UnifiedSessionManager's shared S3 client
+                from adapters.session.unified_session_manager import get_global_session_manager
+                self.s3_client = get_global_session_manager().get_s3_client()
+                if self.s3_client is None:
+                    raise RuntimeError("UnifiedSessionManager returned no S3 client")
                 logger.info("Initialized S3 client via UnifiedSessionManager")
             except (NoCredentialsError, Exception) as e:
                 logger.warning(f"Could not initialize S3 client via UnifiedSessionManager: {e}")
@@ -92,6 +196,8 @@ class S3FlowParser(UniversalFlowParser):
         # S3 trigger configuration
         self.trigger_rules: List[S3TriggerRule] = []
         self.trigger_bucket_config: Dict[str, Any] = {}
+        self.trigger_index = S3TriggerIndex()
+        self._bracket_cache: Dict[str, Optional[Tuple[str, str, List[str]]]] = {}
         
         # Load S3 trigger rules from workflows
         self._load_s3_trigger_rules()
@@ -132,6 +238,22 @@ class S3FlowParser(UniversalFlowParser):
             
             self.trigger_rules.append(trigger_rule)
             logger.info(f"Loaded S3 triggers for {workflow_name}: {len(trigger_rule.drop_zones)} drop zones")
+        
+        self._build_trigger_index()
+    
+    def _build_trigger_index(self):
+        """Compile drop-zone rules into the prefix trie (once per rule load)."""
+        self.trigger_index = S3TriggerIndex()
+        self._bracket_cache = {}
+        for rule_index, rule in enumerate(self.trigger_rules):
+            for zone_index, drop_zone in enumerate(rule.drop_zones):
+                self.trigger_index.add(
+                    drop_zone,
+                    rule.workflow_name,
+                    self._get_action_for_drop_zone(rule.workflow_name, drop_zone),
+                    order=(rule_index, zone_index),
+                    conditions=rule.conditions
+                )
     
     def match_s3_event_to_workflow(self, s3_event: S3Event) -> Optional[Tuple[str, str, List[str]]]:
         """
@@ -148,20 +270,68 @@ class S3FlowParser(UniversalFlowParser):
             return bracket_match
         
         # Check drop zone matches
-        drop_zone_match = self._match_drop_zone_trigger(object_key)
+        drop_zone_match = self._match_drop_zone_trigger(object_key, s3_event.bucket_name)
         if drop_zone_match:
             return drop_zone_match
         
         return None
     
+    def route_s3_events(self, payload: Union[Dict[str, Any], List[Dict[str, Any]]]) -> S3EventBatch:
+        """
+        Route a full Lambda/S3 notification payload in a single pass.
+        
+        Records are parsed once, de-duplicated on (bucket, key, etag,
+        sequencer) and grouped per workflow.
+        
+        Args:
+            payload: Lambda event ({"Records": [...]}) or a list of records
+            
+        Returns:
+            S3EventBatch with routed events grouped by workflow name
+        """
+        records = payload.get('Records', []) if isinstance(payload, dict) else payload
+        batch = S3EventBatch(total_records=len(records))
+        seen = set()
+        
+        for record in records:
+            try:
+                s3_event = S3Event.from_lambda_record(record)
+            except (KeyError, TypeError) as e:
+                batch.invalid_records += 1
+                logger.error(f"Invalid S3 record skipped: {e}")
+                continue
+            
+            if s3_event.dedup_key in seen:
+                batch.duplicates += 1
+                continue
+            seen.add(s3_event.dedup_key)
+            
+            match = self.match_s3_event_to_workflow(s3_event)
+            if match is None:
+                batch.unmatched.append(s3_event)
+                continue
+            
+            workflow_name, action, parameters = match
+            batch.groups.setdefault(workflow_name, []).append(
+                S3RoutedEvent(s3_event, workflow_name, action, parameters)
+            )
+        
+        return batch
+    
     def _match_bracket_trigger_file(self, object_key: str) -> Optional[Tuple[str, str, List[str]]]:
         """Match bracket trigger files like [mvr_analysis].trigger"""
+        # Cheap reject before any path handling
+        if not object_key.endswith('.trigger'):
+            return None
+        
         # Extract filename from S3 key
-        filename = Path(object_key).name
+        filename = object_key.rsplit('/', 1)[-1]
+        if filename in self._bracket_cache:
+            return self._bracket_cache[filename]
         
         # Check if it's a bracket trigger file
-        bracket_pattern = re.compile(r'\[([^\]]+)\]\.trigger$')
-        match = bracket_pattern.match(filename)
+        result = None
+        match = BRACKET_TRIGGER_PATTERN.match(filename)
         
         if match:
             bracket_content = match.group(1)
@@ -170,25 +340,22 @@ class S3FlowParser(UniversalFlowParser):
                 
                 # Check if workflow exists
                 if command.workflow_name in self.workflows:
-                    return (command.workflow_name, command.action or 'start', command.parameters)
+                    result = (command.workflow_name, command.action or 'start', command.parameters)
             except Exception as e:
                 logger.error(f"Failed to parse bracket trigger {filename}: {e}")
         
-        return None
+        if len(self._bracket_cache) >= BRACKET_CACHE_SIZE:
+            self._bracket_cache.clear()
+        self._bracket_cache[filename] = result
+        return result
     
-    def _match_drop_zone_trigger(self, object_key: str) -> Optional[Tuple[str, str, List[str]]]:
-        """Match drop zone patterns from workflow definitions."""
-        object_path = Path(object_key)
-        
-        for rule in self.trigger_rules:
-            for drop_zone in rule.drop_zones:
-                # Check if object is in this drop zone
-                if str(object_path.parent) == drop_zone or str(object_path).startswith(f"{drop_zone}/"):
-                    # Determine action based on drop zone
-                    action = self._get_action_for_drop_zone(rule.workflow_name, drop_zone)
-                    return (rule.workflow_name, action, [])
-        
-        return None
+    def _match_drop_zone_trigger(self, object_key: str,
+                                 bucket_name: Optional[str] = None) -> Optional[Tuple[str, str, List[str]]]:
+        """Match drop zone patterns from workflow definitions via the prefix trie."""
+        entry = self.trigger_index.match(object_key, bucket_name)
+        if entry is None:
+            return None
+        return (entry["workflow_name"], entry["action"], [])
     
     def _get_action_for_drop_zone(self, workflow_name: str, drop_zone: str) -> str:
         """Get the appropriate action for a drop zone."""
@@ -202,20 +369,24 @@ class S3FlowParser(UniversalFlowParser):
         
         return 'start'  # Default action
     
-    async def process_s3_event(self, s3_event: S3Event, context: Optional[Dict[str, Any]] = None) -> Optional[FlowExecution]:
+    async def process_s3_event(self, s3_event: S3Event, context: Optional[Dict[str, Any]] = None,
+                               workflow_match: Optional[Tuple[str, str, List[str]]] = None) -> Optional[FlowExecution]:
         """
         Process S3 event and trigger appropriate workflow.
         
         Args:
             s3_event: S3 event object
             context: Optional context (Lambda context, etc.)
+            workflow_match: (workflow, action, parameters) already resolved by
+                route_s3_events(); matched here when not given
             
         Returns:
             FlowExecution if workflow was triggered, None otherwise
         """
         try:
-            # Match event to workflow
-            workflow_match = self.match_s3_event_to_workflow(s3_event)
+            # Match event to workflow (unless the router already did)
+            if workflow_match is None:
+                workflow_match = self.match_s3_event_to_workflow(s3_event)
             
             if not workflow_match:
                 logger.info(f"No workflow match for S3 object: {s3_event.object_key}")
@@ -255,45 +426,90 @@ class S3FlowParser(UniversalFlowParser):
             logger.error(f"Failed to process S3 event: {e}")
             return None
     
-    async def process_lambda_event(self, lambda_event: Dict[str, Any], lambda_context: Any = None) -> List[FlowExecution]:
+    async def process_lambda_event(self, lambda_event: Dict[str, Any], lambda_context: Any = None,
+                                   group_executions: bool = False) -> List[FlowExecution]:
         """
         Process Lambda event containing S3 records.
         
+        Records are routed in one pass via route_s3_events(), so duplicate
+        deliveries trigger a single execution.
+        
         Args:
             lambda_event: Lambda event with S3 records
             lambda_context: Lambda context object
+            group_executions: Start one execution per (workflow, action) with
+                all matching object keys in its context, instead of one per object
             
         Returns:
             List of FlowExecution objects for triggered workflows
         """
         executions = []
+        batch = self.route_s3_events(lambda_event)
         
-        # Extract S3 records from Lambda event
-        records = lambda_event.get('Records', [])
+        # Add Lambda context
+        context = {
+            "lambda_request_id": getattr(lambda_context, 'aws_request_id', ''),
+            "lambda_function_name": getattr(lambda_context, 'function_name', ''),
+            "lambda_remaining_time": getattr(lambda_context, 'get_remaining_time_in_millis', lambda: 0)()
+        }
         
-        for record in records:
-            try:
-                # Parse S3 event from Lambda record
-                s3_event = S3Event.from_lambda_record(record)
+        if group_executions:
+            for workflow_name, routed_events in batch.groups.items():
+                by_action: Dict[str, List[S3RoutedEvent]] = {}
+                for routed in routed_events:
+                    by_action.setdefault(routed.action, []).append(routed)
                 
-                # Add Lambda context
-                context = {
-                    "lambda_request_id": getattr(lambda_context, 'aws_request_id', ''),
-                    "lambda_function_name": getattr(lambda_context, 'function_name', ''),
-                    "lambda_remaining_time": getattr(lambda_context, 'get_remaining_time_in_millis', lambda: 0)()
-                }
-                
-                # Process S3 event
-                execution = await self.process_s3_event(s3_event, context)
-                
-                if execution:
-                    executions.append(execution)
+                for action, action_events in by_action.items():
+                    try:
+                        execution = await self._execute_routed_group(workflow_name, action, action_events, context)
+                        executions.append(execution)
+                    except Exception as e:
+                        logger.error(f"Failed to process S3 batch for {workflow_name}: {e}")
+            return executions
+        
+        for routed_events in batch.groups.values():
+            for routed in routed_events:
+                try:
+                    # Process S3 event
+                    execution = await self.process_s3_event(
+                        routed.event, context,
+                        workflow_match=(routed.workflow_name, routed.action, routed.parameters)
+                    )
                     
-            except Exception as e:
-                logger.error(f"Failed to process Lambda record: {e}")
+                    if execution:
+                        executions.append(execution)
+                        
+                except Exception as e:
+                    logger.error(f"Failed to process Lambda record: {e}")
         
         return executions
     
+    async def _execute_routed_group(self, workflow_name: str, action: str,
+                                    routed_events: List[S3RoutedEvent],
+                                    context: Dict[str, Any]) -> FlowExecution:
+        """Trigger one workflow execution covering a group of S3 objects."""
+        bracket_command = f"[{workflow_name}]" if action == 'start' else f"[{workflow_name} {action}]"
+        s3_context = {
+            "trigger_type": "s3_event_batch",
+            "objects": [
+                {
+                    "bucket_name": routed.event.bucket_name,
+                    "object_key": routed.event.object_key,
+                    "event_name": routed.event.event_name,
+                    "event_time": routed.event.event_time,
+                    "object_size": routed.event.object_size
+                }
+                for routed in routed_events
+            ],
+            "object_count": len(routed_events)
+        }
+        s3_context.update(context)
+        
+        logger.info(f"Triggering workflow from S3 batch: {bracket_command} ({len(routed_events)} objects)")
+        execution = await self.execute_bracket_command(bracket_command, s3_context)
+        execution.metadata.update(s3_context)
+        return execution
+    
     def create_trigger_file(self, bucket: str, workflow_name: str, action: str = None, **metadata) -> str:
         """
         Create a trigger file in S3 to initiate workflow.
@@ -11,6 +11,11 @@ from .model_risk_analysis import (
     ModelRiskAnalyzer,
     main
 )
+from .risk_pattern_registry import (
+    PatternHit,
+    PatternScan,
+    RiskPatternRegistry
+)
 from .risk_tagging import (
     RiskTagger,
     demonstrate_simple_tagging
@@ -36,6 +41,9 @@ from .tensor_logic import (
 __all__ = [
     "ModelRiskAnalysis",
     "ModelRiskAnalyzer",
+    "PatternHit",
+    "PatternScan",
+    "RiskPatternRegistry",
     "RiskTagger",
     "check_current_mlflow_uri",
     "check_hardcoded_credentials",
@@ -45,21 +45,8 @@ class ActionStepsManager(BaseStepsManager):
         self.action_steps_path = self.steps_path
 
     def get_all_steps(self) -> List[Dict[str, Any]]:
-        """Get all action steps for this project."""
-        steps = []
-
-        # Load from individual JSON files
-        json_files = list(self.steps_path.glob("*.json"))
-        for json_file in json_files:
-            if json_file.name != "action_steps_config.json":
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        step_data = json.load(f)
-                        steps.append(step_data)
-                except Exception as e:
-                    logger.error(f"Error loading {json_file}: {e}")
-
-        return steps
+        """Get all action steps for this project (served from the step index)."""
+        return self.store.all()
 
     # Alias for backward compatibility
     def get_all_action_steps(self) -> List[Dict[str, Any]]:
@@ -83,10 +70,8 @@ class ActionStepsManager(BaseStepsManager):
             step_data['last_modified'] = datetime.now().isoformat()
             step_data['project_id'] = self.project_id
 
-            # Save to file
-            file_path = self.steps_path / f"{step_name}.json"
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(step_data, f, indent=2)
+            # Save to file and index
+            file_path = self.store.put(step_name, step_data)
 
             # Update config
             self._update_config(step_name, "saved")
@@ -110,17 +95,7 @@ class ActionStepsManager(BaseStepsManager):
 
     def load_step(self, step_name: str) -> Optional[Dict[str, Any]]:
         """Load a specific action step."""
-        file_path = self.steps_path / f"{step_name}.json"
-
-        if not file_path.exists():
-            return None
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading action step {step_name}: {e}")
-            return None
+        return self.store.get(step_name)
 
     # Alias for backward compatibility
     def load_action_step(self, step_name: str) -> Optional[Dict[str, Any]]:
@@ -130,10 +105,7 @@ class ActionStepsManager(BaseStepsManager):
     def delete_action_step(self, step_name: str) -> Dict[str, Any]:
         """Delete an action step."""
         try:
-            file_path = self.action_steps_path / f"{step_name}.json"
-
-            if file_path.exists():
-                file_path.unlink()
+            if self.store.delete(step_name):
                 self._update_config(step_name, "deleted")
 
                 return {
@@ -278,9 +250,8 @@ class ActionStepsManager(BaseStepsManager):
 
             for step_data in bundle_data.get('action_steps', []):
                 step_name = step_data.get('step_name', step_data.get('step_type', 'unknown'))
-                file_path = self.action_steps_path / f"{step_name}.json"
 
-                if file_path.exists() and not overwrite:
+                if self.store.exists(step_name) and not overwrite:
                     skipped_count += 1
                     continue
 
@@ -397,11 +368,9 @@ class ActionStepsManager(BaseStepsManager):
     def _update_config(self, step_name: str, action: str):
         """Update the action steps configuration file."""
         try:
-            # Load existing config or create new
-            if self.config_path.exists():
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            else:
+            # Load existing config (cached by mtime) or create new
+            config = self._config_doc.load()
+            if config is None:
                 config = {
                     'project_id': self.project_id,
                     'created_at': datetime.now().isoformat(),
@@ -430,8 +399,7 @@ class ActionStepsManager(BaseStepsManager):
             config['history'] = config['history'][-100:]
 
             # Save config
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            self._config_doc.save(config)
 
         except Exception as e:
             logger.error(f"Error updating config: {e}")
@@ -17,6 +17,8 @@ from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import logging
 
+from .step_index_store import StepIndexStore, CachedJsonDocument
+
 # TidyLLM RL integration
 try:
     from packages.tidyllm.services.workflow_rl_optimizer import create_rl_enhanced_step
@@ -68,6 +70,11 @@ class AskAIStepsManager:
         self.suggestions_path = self.ai_interactions_path / "suggestions"
         self.suggestions_path.mkdir(exist_ok=True)
 
+        # Index-backed storage and cached config, shared across instances
+        self.conversation_store = StepIndexStore.for_directory(self.conversations_path)
+        self.suggestion_store = StepIndexStore.for_directory(self.suggestions_path)
+        self._config_doc = CachedJsonDocument.for_path(self.config_path)
+
     def start_conversation(self, conversation_id: str = None) -> Dict[str, Any]:
         """
         Start a new AI conversation session.
@@ -96,9 +103,7 @@ class AskAIStepsManager:
         }
 
         # Save initial conversation
-        conv_file = self.conversations_path / f"{conversation_id}.json"
-        with open(conv_file, 'w', encoding='utf-8') as f:
-            json.dump(conversation_data, f, indent=2)
+        self.conversation_store.put(conversation_id, conversation_data)
 
         return {
             'success': True,
@@ -119,19 +124,15 @@ class AskAIStepsManager:
         Returns:
             Result dictionary
         """
-        conv_file = self.conversations_path / f"{conversation_id}.json"
+        conversation = self.conversation_store.get(conversation_id)
 
-        if not conv_file.exists():
+        if conversation is None:
             return {
                 'success': False,
                 'error': f"Conversation {conversation_id} not found"
             }
 
         try:
-            # Load conversation
-            with open(conv_file, 'r', encoding='utf-8') as f:
-                conversation = json.load(f)
-
             # Add message
             message = {
                 'role': role,
@@ -143,8 +144,7 @@ class AskAIStepsManager:
             conversation['last_updated'] = datetime.now().isoformat()
 
             # Save updated conversation
-            with open(conv_file, 'w', encoding='utf-8') as f:
-                json.dump(conversation, f, indent=2)
+            self.conversation_store.put(conversation_id, conversation)
 
             return {
                 'success': True,
@@ -159,17 +159,7 @@ class AskAIStepsManager:
 
     def get_conversation(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Load a conversation history."""
-        conv_file = self.conversations_path / f"{conversation_id}.json"
-
-        if not conv_file.exists():
-            return None
-
-        try:
-            with open(conv_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading conversation {conversation_id}: {e}")
-            return None
+        return self.conversation_store.get(conversation_id)
 
     def save_ai_suggestion(self, suggestion_name: str, suggestion_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -197,10 +187,8 @@ class AskAIStepsManager:
             if 'confidence_score' not in suggestion_data:
                 suggestion_data['confidence_score'] = 0.0
 
-            # Save to file
-            file_path = self.suggestions_path / f"{suggestion_name}.json"
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(suggestion_data, f, indent=2)
+            # Save to file and index
+            file_path = self.suggestion_store.put(suggestion_name, suggestion_data)
 
             # Update config
             self._update_config(f"suggestion_{suggestion_name}", "created")
@@ -368,23 +356,20 @@ class AskAIStepsManager:
         Returns:
             Learning insights and patterns
         """
-        all_conversations = list(self.conversations_path.glob("*.json"))
-        all_suggestions = list(self.suggestions_path.glob("*.json"))
+        all_conversations = self.conversation_store.all()
+        suggestion_count = len(self.suggestion_store.names())
 
         insights = {
             'total_conversations': len(all_conversations),
-            'total_suggestions': len(all_suggestions),
+            'total_suggestions': suggestion_count,
             'common_requirements': {},
             'successful_patterns': [],
             'workflow_types': {}
         }
 
         # Analyze conversations
-        for conv_file in all_conversations:
+        for conv in all_conversations:
             try:
-                with open(conv_file, 'r', encoding='utf-8') as f:
-                    conv = json.load(f)
-
                 # Extract patterns
                 if 'context' in conv:
                     wf_type = conv['context'].get('workflow_type')
@@ -425,15 +410,8 @@ class AskAIStepsManager:
             bundle_path = export_path / bundle_name
 
             # Collect all data
-            conversations = []
-            for conv_file in self.conversations_path.glob("*.json"):
-                with open(conv_file, 'r', encoding='utf-8') as f:
-                    conversations.append(json.load(f))
-
-            suggestions = []
-            for sugg_file in self.suggestions_path.glob("*.json"):
-                with open(sugg_file, 'r', encoding='utf-8') as f:
-                    suggestions.append(json.load(f))
+            conversations = self.conversation_store.all()
+            suggestions = self.suggestion_store.all()
 
             # Create export bundle
             export_data = {
@@ -466,8 +444,8 @@ class AskAIStepsManager:
 
     def get_ai_summary(self) -> Dict[str, Any]:
         """Get a summary of all AI interactions."""
-        conversations = list(self.conversations_path.glob("*.json"))
-        suggestions = list(self.suggestions_path.glob("*.json"))
+        conversations = self.conversation_store.all()
+        suggestions = self.suggestion_store.all()
 
         summary = {
             'total_conversations': len(conversations),
@@ -478,11 +456,8 @@ class AskAIStepsManager:
         }
 
         # Analyze conversations
-        for conv_file in conversations:
+        for conv in conversations:
             try:
-                with open(conv_file, 'r', encoding='utf-8') as f:
-                    conv = json.load(f)
-
                 if conv.get('status') == 'active':
                     summary['active_conversations'] += 1
 
@@ -495,11 +470,8 @@ class AskAIStepsManager:
                 logger.error(f"Error reading conversation: {e}")
 
         # Analyze suggestions
-        for sugg_file in suggestions:
+        for sugg in suggestions:
             try:
-                with open(sugg_file, 'r', encoding='utf-8') as f:
-                    sugg = json.load(f)
-
                 if sugg.get('status') == 'implemented':
                     summary['implemented_suggestions'] += 1
 
@@ -511,11 +483,9 @@ class AskAIStepsManager:
     def _update_config(self, item_name: str, action: str):
         """Update the AI interactions configuration file."""
         try:
-            # Load existing config or create new
-            if self.config_path.exists():
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            else:
+            # Load existing config (cached by mtime) or create new
+            config = self._config_doc.load()
+            if config is None:
                 config = {
                     'project_id': self.project_id,
                     'created_at': datetime.now().isoformat(),
@@ -544,8 +514,7 @@ class AskAIStepsManager:
             config['history'] = config['history'][-100:]
 
             # Save config
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            self._config_doc.save(config)
 
         except Exception as e:
             logger.error(f"Error updating config: {e}")
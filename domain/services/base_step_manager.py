@@ -14,6 +14,8 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 import logging
 
+from .step_index_store import StepIndexStore, CachedJsonDocument
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,6 +54,10 @@ class BaseStepsManager(ABC):
         # Path for the main configuration
         self.config_path = self.steps_path / f"{step_type}_config.json"
 
+        # Index-backed step storage and cached config, shared across instances
+        self.store = StepIndexStore.for_directory(self.steps_path, exclude={self.config_path.name})
+        self._config_doc = CachedJsonDocument.for_path(self.config_path)
+
     @abstractmethod
     def get_all_steps(self) -> List[Dict[str, Any]]:
         """Get all steps for this project. Must be implemented by subclasses."""
@@ -70,10 +76,7 @@ class BaseStepsManager(ABC):
     def delete_step(self, step_name: str) -> Dict[str, Any]:
         """Delete a step. Common implementation."""
         try:
-            file_path = self.steps_path / f"{step_name}.json"
-
-            if file_path.exists():
-                file_path.unlink()
+            if self.store.delete(step_name):
                 self._update_config(step_name, "deleted")
 
                 return {
@@ -157,9 +160,8 @@ class BaseStepsManager(ABC):
 
             for step_data in bundle_data.get('steps', []):
                 step_name = self._extract_step_name(step_data)
-                file_path = self.steps_path / f"{step_name}.json"
 
-                if file_path.exists() and not overwrite:
+                if self.store.exists(step_name) and not overwrite:
                     skipped_count += 1
                     continue
 
@@ -214,11 +216,9 @@ class BaseStepsManager(ABC):
     def _update_config(self, step_name: str, action: str):
         """Update the configuration file. Common implementation."""
         try:
-            # Load existing config or create new
-            if self.config_path.exists():
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            else:
+            # Load existing config (cached by mtime) or create new
+            config = self._config_doc.load()
+            if config is None:
                 config = {
                     'project_id': self.project_id,
                     'step_type': self.step_type,
@@ -248,8 +248,7 @@ class BaseStepsManager(ABC):
             config['history'] = config['history'][-100:]
 
             # Save config
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            self._config_doc.save(config)
 
         except Exception as e:
             logger.error(f"Error updating config: {e}")
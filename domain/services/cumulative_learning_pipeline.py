@@ -4,15 +4,21 @@ Cumulative Learning Pipeline
 
 Connects DSPy, AI Advisor, RL, and Model Router for compound improvements.
 Tracks performance metrics across all components to show trending improvements.
+
+Trends are kept in fixed-size ring buffers with running window sums, so
+trend reads are O(1). Batch optimization from collected feedback runs on a
+background worker; triggers that arrive while a run is pending or in
+progress are coalesced into the next run.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterable
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 import json
 from pathlib import Path
 import logging
-from collections import deque
+import threading
+from array import array
 
 from .step_attributes import BaseStep
 from .model_router_service import ModelRouterService, get_model_router
@@ -21,6 +27,109 @@ from .dspy_step_integration import DSPyStepIntegration
 logger = logging.getLogger(__name__)
 
 
+class TrendBuffer:
+    """
+    Fixed-size ring buffer of floats with running sums over the two most
+    recent windows (the last ``window`` values and the ``window`` before them).
+    """
+
+    def __init__(self, capacity: int = 100, window: int = 10):
+        if capacity < 2 * window:
+            raise ValueError("capacity must hold at least two windows")
+        self.capacity = capacity
+        self.window = window
+        self._values = array('d', bytes(8 * capacity))
+        self._start = 0
+        self._count = 0
+        self._recent_sum = 0.0
+        self._older_sum = 0.0
+        self._appends_since_resum = 0
+
+    @classmethod
+    def from_values(cls, values: Iterable[float], capacity: int = 100, window: int = 10) -> "TrendBuffer":
+        buffer = cls(capacity, window)
+        for value in values:
+            buffer.append(value)
+        return buffer
+
+    def _at(self, index: int) -> float:
+        """Value at chronological position ``index`` (0 = oldest kept)."""
+        return self._values[(self._start + index) % self.capacity]
+
+    def append(self, value: float):
+        value = float(value)
+        count = self._count
+        if count == self.capacity:
+            # Overwrite the oldest value; windows only span the newest 2 * window
+            self._values[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._values[(self._start + count) % self.capacity] = value
+            self._count = count = count + 1
+        # Positions below are relative to the updated buffer
+        if count > self.window:
+            moved = self._at(count - 1 - self.window)
+            self._recent_sum -= moved
+            self._older_sum += moved
+            if count > 2 * self.window:
+                self._older_sum -= self._at(count - 1 - 2 * self.window)
+        self._recent_sum += value
+
+        # Re-sum once per lap so floating-point drift can't accumulate
+        self._appends_since_resum += 1
+        if self._appends_since_resum >= self.capacity:
+            self._resum()
+
+    def _resum(self):
+        count = self._count
+        split = max(0, count - self.window)
+        self._recent_sum = sum(self._at(i) for i in range(split, count))
+        self._older_sum = sum(self._at(i) for i in range(max(0, count - 2 * self.window), split))
+        self._appends_since_resum = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> float:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("TrendBuffer index out of range")
+        return self._at(index)
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._at(i)
+
+    def tolist(self) -> List[float]:
+        return list(self)
+
+    def recent_mean(self) -> Optional[float]:
+        """Mean of the last ``window`` values (fewer if not yet filled)."""
+        n = min(self._count, self.window)
+        return self._recent_sum / n if n else None
+
+    def older_mean(self) -> Optional[float]:
+        """Mean of the ``window`` values before the recent window, if any."""
+        n = min(max(self._count - self.window, 0), self.window)
+        return self._older_sum / n if n else None
+
+    def trend(self) -> str:
+        if self._count < 2:
+            return "stable"
+        older_avg = self.older_mean()
+        if older_avg is None:
+            return "stable"
+        recent_avg = self.recent_mean()
+
+        if recent_avg > older_avg * 1.1:
+            return "improving ↑"
+        elif recent_avg < older_avg * 0.9:
+            return "degrading ↓"
+        else:
+            return "stable →"
+
+
 @dataclass
 class PerformanceLedger:
     """Tracks cumulative performance metrics across all components."""
@@ -31,9 +140,9 @@ class PerformanceLedger:
     failed_executions: int = 0
 
     # Performance trends
-    avg_latency_trend: deque = field(default_factory=lambda: deque(maxlen=100))
-    avg_reward_trend: deque = field(default_factory=lambda: deque(maxlen=100))
-    success_rate_trend: deque = field(default_factory=lambda: deque(maxlen=100))
+    avg_latency_trend: TrendBuffer = field(default_factory=TrendBuffer)
+    avg_reward_trend: TrendBuffer = field(default_factory=TrendBuffer)
+    success_rate_trend: TrendBuffer = field(default_factory=TrendBuffer)
 
     # DSPy metrics
     total_compilations: int = 0
@@ -48,7 +157,7 @@ class PerformanceLedger:
     # Token usage
     total_tokens_used: int = 0
     avg_tokens_per_step: float = 0.0
-    token_efficiency_trend: deque = field(default_factory=lambda: deque(maxlen=100))
+    token_efficiency_trend: TrendBuffer = field(default_factory=TrendBuffer)
 
     # Learning metrics
     feedback_collected: int = 0
@@ -78,39 +187,21 @@ class PerformanceLedger:
 
     def get_trending_metrics(self) -> Dict[str, Any]:
         """Get trending performance indicators."""
-        def calculate_trend(values: deque) -> str:
-            if len(values) < 2:
-                return "stable"
-            recent = list(values)[-10:]
-            older = list(values)[-20:-10] if len(values) >= 20 else list(values)[:-10]
-            if not older:
-                return "stable"
-
-            recent_avg = sum(recent) / len(recent)
-            older_avg = sum(older) / len(older)
-
-            if recent_avg > older_avg * 1.1:
-                return "improving ↑"
-            elif recent_avg < older_avg * 0.9:
-                return "degrading ↓"
-            else:
-                return "stable →"
-
         return {
-            "latency_trend": calculate_trend(self.avg_latency_trend),
-            "reward_trend": calculate_trend(self.avg_reward_trend),
-            "success_trend": calculate_trend(self.success_rate_trend),
-            "token_efficiency_trend": calculate_trend(self.token_efficiency_trend),
+            "latency_trend": self.avg_latency_trend.trend(),
+            "reward_trend": self.avg_reward_trend.trend(),
+            "success_trend": self.success_rate_trend.trend(),
+            "token_efficiency_trend": self.token_efficiency_trend.trend(),
             "current_success_rate": round(self.success_rate_trend[-1], 2) if self.success_rate_trend else 0,
-            "avg_recent_latency": round(sum(list(self.avg_latency_trend)[-10:]) / 10, 2) if len(self.avg_latency_trend) >= 10 else 0,
-            "avg_recent_reward": round(sum(list(self.avg_reward_trend)[-10:]) / 10, 2) if len(self.avg_reward_trend) >= 10 else 0
+            "avg_recent_latency": round(self.avg_latency_trend.recent_mean(), 2) if len(self.avg_latency_trend) >= 10 else 0,
+            "avg_recent_reward": round(self.avg_reward_trend.recent_mean(), 2) if len(self.avg_reward_trend) >= 10 else 0
         }
 
 
 class CumulativeLearningPipeline:
     """Orchestrates cumulative learning across DSPy, AI Advisor, RL, and Model Router."""
 
-    def __init__(self, project_id: str):
+    def __init__(self, project_id: str, background_optimization: bool = True):
         """Initialize the cumulative learning pipeline."""
         self.project_id = project_id
 
@@ -127,6 +218,16 @@ class CumulativeLearningPipeline:
         # Feedback buffer for batch optimization
         self.feedback_buffer: List[Dict[str, Any]] = []
 
+        # Guards ledger and feedback buffer; the optimizer worker updates both
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+
+        # Background batch optimization (coalescing trigger)
+        self.background_optimization = background_optimization
+        self._optimizer_cond = threading.Condition()
+        self._optimization_pending = False
+        self._optimizer_running = False
+
         # Load existing ledger if available
         self._load_ledger()
 
@@ -166,7 +267,8 @@ class CumulativeLearningPipeline:
             initial_reward = 0.5 if success else -0.5
 
             # 4. Update performance metrics
-            self.ledger.update_execution(latency, initial_reward, success, tokens)
+            with self._lock:
+                self.ledger.update_execution(latency, initial_reward, success, tokens)
             self.model_router.update_performance(step, initial_reward, latency)
 
             # 5. Check for automatic optimizations
@@ -192,7 +294,8 @@ class CumulativeLearningPipeline:
 
             # Track failure
             latency = (datetime.now() - start_time).total_seconds()
-            self.ledger.update_execution(latency, -1.0, False, 0)
+            with self._lock:
+                self.ledger.update_execution(latency, -1.0, False, 0)
 
             return {
                 'success': False,
@@ -226,17 +329,55 @@ class CumulativeLearningPipeline:
             'timestamp': datetime.now().isoformat()
         }
 
-        self.feedback_buffer.append(feedback)
-        self.ledger.feedback_collected += 1
+        with self._lock:
+            self.feedback_buffer.append(feedback)
+            self.ledger.feedback_collected += 1
 
-        if reward > 0:
-            self.ledger.positive_feedback += 1
-        else:
-            self.ledger.negative_feedback += 1
+            if reward > 0:
+                self.ledger.positive_feedback += 1
+            else:
+                self.ledger.negative_feedback += 1
+
+            threshold_reached = len(self.feedback_buffer) >= self.optimization_threshold
 
         # Trigger batch optimization if threshold reached
-        if len(self.feedback_buffer) >= self.optimization_threshold:
-            self._trigger_batch_optimization()
+        if threshold_reached:
+            if self.background_optimization:
+                self._schedule_batch_optimization()
+            else:
+                self._trigger_batch_optimization()
+
+    def _schedule_batch_optimization(self):
+        """Request a background optimization run; coalesces with a pending one."""
+        with self._optimizer_cond:
+            self._optimization_pending = True
+            if self._optimizer_running:
+                return
+            self._optimizer_running = True
+        threading.Thread(
+            target=self._run_batch_optimizations,
+            name=f"batch-optimizer-{self.project_id}",
+            daemon=True
+        ).start()
+
+    def _run_batch_optimizations(self):
+        """Worker loop: run until no optimization is pending, then exit."""
+        while True:
+            with self._optimizer_cond:
+                if not self._optimization_pending:
+                    self._optimizer_running = False
+                    self._optimizer_cond.notify_all()
+                    return
+                self._optimization_pending = False
+            try:
+                self._trigger_batch_optimization()
+            except Exception as e:
+                logger.error(f"Batch optimization failed: {e}")
+
+    def wait_for_optimization(self, timeout: Optional[float] = None) -> bool:
+        """Block until background optimization is idle. Returns False on timeout."""
+        with self._optimizer_cond:
+            return self._optimizer_cond.wait_for(lambda: not self._optimizer_running, timeout)
 
     def _check_optimization_triggers(self, step: BaseStep, reward: float):
         """Check if automatic optimizations should be triggered."""
@@ -261,10 +402,17 @@ class CumulativeLearningPipeline:
 
     def _trigger_batch_optimization(self):
         """Trigger batch optimization using collected feedback."""
-        logger.info(f"Triggering batch optimization with {len(self.feedback_buffer)} feedback items")
+        with self._lock:
+            feedback_batch = self.feedback_buffer
+            self.feedback_buffer = []
+        if not feedback_batch:
+            # Already drained by an earlier coalesced run
+            return
+
+        logger.info(f"Triggering batch optimization with {len(feedback_batch)} feedback items")
 
         # Convert feedback to DSPy examples
-        high_reward_feedback = [f for f in self.feedback_buffer if f['reward'] > 0]
+        high_reward_feedback = [f for f in feedback_batch if f['reward'] > 0]
 
         if high_reward_feedback:
             # Group by step for optimization
@@ -278,11 +426,11 @@ class CumulativeLearningPipeline:
             # Optimize each step with its feedback
             for step_name, feedbacks in step_feedback.items():
                 logger.info(f"Optimizing {step_name} with {len(feedbacks)} positive examples")
-                self.ledger.signatures_optimized += 1
+                with self._lock:
+                    self.ledger.signatures_optimized += 1
 
-        # Clear feedback buffer
-        self.feedback_buffer.clear()
-        self.ledger.total_compilations += 1
+        with self._lock:
+            self.ledger.total_compilations += 1
 
         # Save updated ledger
         self._save_ledger()
@@ -373,28 +521,30 @@ class CumulativeLearningPipeline:
             root = get_path_manager().root_folder
             ledger_file = Path(root) / "domain" / "workflows" / "projects" / self.project_id / "performance_ledger.json"
 
-            # Convert ledger to serializable format
-            ledger_data = {
-                "total_executions": self.ledger.total_executions,
-                "successful_executions": self.ledger.successful_executions,
-                "failed_executions": self.ledger.failed_executions,
-                "total_compilations": self.ledger.total_compilations,
-                "signatures_optimized": self.ledger.signatures_optimized,
-                "model_upgrades": self.ledger.model_upgrades,
-                "model_downgrades": self.ledger.model_downgrades,
-                "total_tokens_used": self.ledger.total_tokens_used,
-                "feedback_collected": self.ledger.feedback_collected,
-                "positive_feedback": self.ledger.positive_feedback,
-                "negative_feedback": self.ledger.negative_feedback,
-                "avg_latency_trend": list(self.ledger.avg_latency_trend),
-                "avg_reward_trend": list(self.ledger.avg_reward_trend),
-                "success_rate_trend": list(self.ledger.success_rate_trend),
-                "token_efficiency_trend": list(self.ledger.token_efficiency_trend)
-            }
+            # Convert ledger to serializable format (consistent snapshot)
+            with self._lock:
+                ledger_data = {
+                    "total_executions": self.ledger.total_executions,
+                    "successful_executions": self.ledger.successful_executions,
+                    "failed_executions": self.ledger.failed_executions,
+                    "total_compilations": self.ledger.total_compilations,
+                    "signatures_optimized": self.ledger.signatures_optimized,
+                    "model_upgrades": self.ledger.model_upgrades,
+                    "model_downgrades": self.ledger.model_downgrades,
+                    "total_tokens_used": self.ledger.total_tokens_used,
+                    "feedback_collected": self.ledger.feedback_collected,
+                    "positive_feedback": self.ledger.positive_feedback,
+                    "negative_feedback": self.ledger.negative_feedback,
+                    "avg_latency_trend": self.ledger.avg_latency_trend.tolist(),
+                    "avg_reward_trend": self.ledger.avg_reward_trend.tolist(),
+                    "success_rate_trend": self.ledger.success_rate_trend.tolist(),
+                    "token_efficiency_trend": self.ledger.token_efficiency_trend.tolist()
+                }
 
             ledger_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(ledger_file, 'w') as f:
-                json.dump(ledger_data, f, indent=2)
+            with self._save_lock:
+                with open(ledger_file, 'w') as f:
+                    json.dump(ledger_data, f, indent=2)
 
         except Exception as e:
             logger.debug(f"Could not save ledger: {e}")
@@ -423,15 +573,15 @@ class CumulativeLearningPipeline:
                     self.ledger.positive_feedback = data.get("positive_feedback", 0)
                     self.ledger.negative_feedback = data.get("negative_feedback", 0)
 
-                    # Restore trends as deques
+                    # Restore trends as ring buffers
                     if "avg_latency_trend" in data:
-                        self.ledger.avg_latency_trend = deque(data["avg_latency_trend"], maxlen=100)
+                        self.ledger.avg_latency_trend = TrendBuffer.from_values(data["avg_latency_trend"])
                     if "avg_reward_trend" in data:
-                        self.ledger.avg_reward_trend = deque(data["avg_reward_trend"], maxlen=100)
+                        self.ledger.avg_reward_trend = TrendBuffer.from_values(data["avg_reward_trend"])
                     if "success_rate_trend" in data:
-                        self.ledger.success_rate_trend = deque(data["success_rate_trend"], maxlen=100)
+                        self.ledger.success_rate_trend = TrendBuffer.from_values(data["success_rate_trend"])
                     if "token_efficiency_trend" in data:
-                        self.ledger.token_efficiency_trend = deque(data["token_efficiency_trend"], maxlen=100)
+                        self.ledger.token_efficiency_trend = TrendBuffer.from_values(data["token_efficiency_trend"])
 
         except Exception as e:
             logger.debug(f"Could not load ledger: {e}")
@@ -10,10 +10,13 @@ This is a domain service that adds compliance-specific rules and workflows.
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 import json
-import pandas as pd
 from pathlib import Path
 import sys
 
+from common.utilities.lazy_imports import lazy_import
+
+pd = lazy_import("pandas")  # only needed for spreadsheet ingestion
+
 # Add tidyllm to path for VectorQA capabilities
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'packages' / 'tidyllm'))
 
@@ -4,15 +4,50 @@ DSPy Compiler Service
 =====================
 Compiles markdown definitions into DSPy programs.
 Handles parsing, validation, and code generation.
+
+Section patterns are compiled once at import, and parse results are
+memoized process-wide by markdown content hash, so re-viewing or
+re-executing an unchanged definition skips extraction and code generation.
+Saved programs live one file per program in the program library directory,
+listed through a step index manifest.
 """
 
+import copy
+import hashlib
 import re
+import threading
 import yaml
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 import json
 from pathlib import Path
 
+from .step_index_store import StepIndexStore
+
+_SECTION_FLAGS = re.MULTILINE | re.DOTALL
+
+SECTION_PATTERNS = {
+    'name': re.compile(r"^#\s+(.+)$", _SECTION_FLAGS),
+    'objective': re.compile(r"##\s+Objective\s*(.+?)(?=##|$)", _SECTION_FLAGS),
+    'inputs': re.compile(r"##\s+Input[s]?\s*(.+?)(?=##|$)", _SECTION_FLAGS),
+    'outputs': re.compile(r"##\s+Output[s]?\s*(.+?)(?=##|$)", _SECTION_FLAGS),
+    'process': re.compile(r"##\s+(?:Process|Steps)\s*(.+?)(?=##|$)", _SECTION_FLAGS),
+    'constraints': re.compile(r"##\s+Constraint[s]?\s*(.+?)(?=##|$)", _SECTION_FLAGS),
+}
+
+NUMBERED_ITEM_PATTERN = re.compile(r'^\d+[\.)\s]')
+NUMBERED_PREFIX_PATTERN = re.compile(r'^\d+[\.)\s]+(?:Step\s+\d+:?\s*)?')
+WORD_PATTERN = re.compile(r'\w+')
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+
+PARSE_CACHE_SIZE = 128
+
+# Shared across instances: the portals build a new service on every rerun
+_parse_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
 @dataclass
 class DSPyProgramSpec:
     """Specification for a DSPy program."""
@@ -27,9 +62,14 @@ class DSPyProgramSpec:
 class DSPyCompilerService:
     """Compiles markdown to DSPy programs."""
 
-    def __init__(self):
+    def __init__(self, library_path: Path = None):
         self.templates = self._load_templates()
-        self.program_cache = {}
+
+        if library_path is None:
+            library_path = Path(__file__).parent.parent / "workflows" / "dspy_programs"
+        # Created by the first save_program, so read-only callers leave no trace
+        self.library_path = Path(library_path)
+        self.program_store = StepIndexStore.for_directory(self.library_path)
 
     def _load_templates(self) -> Dict[str, str]:
         """Load pre-defined templates."""
@@ -42,7 +82,24 @@ class DSPyCompilerService:
         }
 
     def parse_markdown(self, markdown_text: str) -> Dict[str, Any]:
-        """Parse markdown definition into structured format."""
+        """Parse markdown definition into structured format (memoized by content)."""
+        key = hashlib.sha256(markdown_text.encode('utf-8')).hexdigest()
+
+        with _parse_cache_lock:
+            result = _parse_cache.get(key)
+            if result is not None:
+                _parse_cache.move_to_end(key)
+        if result is None:
+            result = self._parse_markdown_uncached(markdown_text)
+            with _parse_cache_lock:
+                _parse_cache[key] = result
+                while len(_parse_cache) > PARSE_CACHE_SIZE:
+                    _parse_cache.popitem(last=False)
+
+        # Callers keep results in session state; never hand out the cached objects
+        return copy.deepcopy(result)
+
+    def _parse_markdown_uncached(self, markdown_text: str) -> Dict[str, Any]:
         try:
             # Extract sections
             spec = self._extract_specification(markdown_text)
@@ -72,24 +129,24 @@ class DSPyCompilerService:
     def _extract_specification(self, markdown: str) -> DSPyProgramSpec:
         """Extract structured specification from markdown."""
 
-        # Parse sections using regex
-        name = self._extract_section(markdown, "^#\\s+(.+)$", default="Unnamed Program")
-        objective = self._extract_section(markdown, "##\\s+Objective\\s*(.+?)(?=##|$)", default="")
+        # Parse sections using the precompiled patterns
+        name = self._extract_section(markdown, SECTION_PATTERNS['name'], default="Unnamed Program")
+        objective = self._extract_section(markdown, SECTION_PATTERNS['objective'], default="")
 
         # Parse inputs
-        inputs_text = self._extract_section(markdown, "##\\s+Input[s]?\\s*(.+?)(?=##|$)", default="")
+        inputs_text = self._extract_section(markdown, SECTION_PATTERNS['inputs'], default="")
         inputs = self._parse_field_list(inputs_text)
 
         # Parse outputs
-        outputs_text = self._extract_section(markdown, "##\\s+Output[s]?\\s*(.+?)(?=##|$)", default="")
+        outputs_text = self._extract_section(markdown, SECTION_PATTERNS['outputs'], default="")
         outputs = self._parse_field_list(outputs_text)
 
         # Parse process steps
-        process_text = self._extract_section(markdown, "##\\s+(?:Process|Steps)\\s*(.+?)(?=##|$)", default="")
+        process_text = self._extract_section(markdown, SECTION_PATTERNS['process'], default="")
         process_steps = self._parse_numbered_list(process_text)
 
         # Parse constraints
-        constraints_text = self._extract_section(markdown, "##\\s+Constraint[s]?\\s*(.+?)(?=##|$)", default="")
+        constraints_text = self._extract_section(markdown, SECTION_PATTERNS['constraints'], default="")
         constraints = self._parse_bullet_list(constraints_text)
 
         # Determine task type
@@ -105,9 +162,11 @@ class DSPyCompilerService:
             task_type=task_type
         )
 
-    def _extract_section(self, text: str, pattern: str, default: str = "") -> str:
-        """Extract a section using regex."""
-        match = re.search(pattern, text, re.MULTILINE | re.DOTALL)
+    def _extract_section(self, text: str, pattern: Union[str, "re.Pattern"], default: str = "") -> str:
+        """Extract a section using a compiled pattern (or a regex string)."""
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern, _SECTION_FLAGS)
+        match = pattern.search(text)
         return match.group(1) if match else default
 
     def _parse_field_list(self, text: str) -> Dict[str, str]:
@@ -137,8 +196,8 @@ class DSPyCompilerService:
         for line in lines:
             line = line.strip()
             # Match patterns like "1.", "1)", "Step 1:", etc.
-            if re.match(r'^\d+[\.)\s]', line):
-                step_text = re.sub(r'^\d+[\.)\s]+(?:Step\s+\d+:?\s*)?', '', line)
+            if NUMBERED_ITEM_PATTERN.match(line):
+                step_text = NUMBERED_PREFIX_PATTERN.sub('', line)
                 steps.append(step_text.strip())
             elif line.startswith('**') and line.endswith('**'):
                 # Handle bold step headers
@@ -225,13 +284,13 @@ Process Steps:
     def _to_class_name(self, name: str) -> str:
         """Convert name to valid Python class name."""
         # Remove special characters and convert to CamelCase
-        words = re.findall(r'\w+', name)
+        words = WORD_PATTERN.findall(name)
         return ''.join(word.capitalize() for word in words)
 
     def _to_variable_name(self, name: str) -> str:
         """Convert name to valid Python variable name."""
         # Remove special characters and convert to snake_case
-        name = re.sub(r'[^\w\s]', '', name)
+        name = NON_WORD_PATTERN.sub('', name)
         words = name.lower().split()
         return '_'.join(words)
 
@@ -276,14 +335,15 @@ Process Steps:
         try:
             program_id = self._generate_program_id(name)
 
-            self.program_cache[program_id] = {
+            self.library_path.mkdir(parents=True, exist_ok=True)
+            self.program_store.put(program_id, {
                 'id': program_id,
                 'name': name,
                 'description': description,
                 'markdown': markdown,
                 'dspy_program': dspy_program,
-                'created_at': Path.cwd()  # Would use datetime in production
-            }
+                'created_at': datetime.now().isoformat()
+            })
 
             return True
         except Exception:
@@ -291,19 +351,19 @@ Process Steps:
 
     def _generate_program_id(self, name: str) -> str:
         """Generate unique program ID."""
-        import hashlib
         return hashlib.md5(name.encode()).hexdigest()[:8]
 
     def list_saved_programs(self) -> List[Dict[str, Any]]:
-        """List all saved programs."""
-        return list(self.program_cache.values())
+        """List all saved programs (served from the library index)."""
+        return sorted(self.program_store.all(), key=lambda program: program.get('name', ''))
+
+    def load_program(self, program_id: str) -> Optional[Dict[str, Any]]:
+        """Load a saved program by ID."""
+        return self.program_store.get(program_id)
 
     def delete_program(self, program_id: str) -> bool:
         """Delete a saved program."""
-        if program_id in self.program_cache:
-            del self.program_cache[program_id]
-            return True
-        return False
+        return self.program_store.delete(program_id)
 
     # Template methods
     def _get_compliance_template(self) -> str:
@@ -17,20 +17,16 @@ from datetime import datetime
 qa_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(qa_root))
 
-# Try to import DSPy
-try:
-    import dspy
-    DSPY_AVAILABLE = True
-except ImportError:
-    DSPY_AVAILABLE = False
+from common.utilities.lazy_imports import lazy_import, module_available
+
+# DSPy and MLflow are imported on first use
+dspy = lazy_import("dspy")
+DSPY_AVAILABLE = module_available("dspy")
+if not DSPY_AVAILABLE:
     print("Warning: DSPy not available")
 
-# Try to import MLflow
-try:
-    import mlflow
-    MLFLOW_AVAILABLE = True
-except ImportError:
-    MLFLOW_AVAILABLE = False
+mlflow = lazy_import("mlflow")
+MLFLOW_AVAILABLE = module_available("mlflow")
 
 class DSPyExecutionService:
     """Executes DSPy programs with infrastructure integration."""
@@ -16,12 +16,11 @@ from .step_attributes import BaseStep, ActionStep, PromptStep, AIInteractionStep
 from .dspy_compiler_service import DSPyCompilerService
 from .dspy_execution_service import DSPyExecutionService
 
-# Try to import DSPy
-try:
-    import dspy
-    DSPY_AVAILABLE = True
-except ImportError:
-    DSPY_AVAILABLE = False
+from common.utilities.lazy_imports import lazy_import, module_available
+
+# DSPy is imported on first use
+dspy = lazy_import("dspy")
+DSPY_AVAILABLE = module_available("dspy")
 
 
 class DSPyStepIntegration:
@@ -13,13 +13,17 @@ Extended risk assessment for multiple file types including:
 - Configuration: .ini, .cfg, .conf, .properties, .env
 """
 
-import re
 import json
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 from dataclasses import dataclass
 import mimetypes
 
+try:
+    from .risk_pattern_registry import RiskPatternRegistry, PatternScan
+except ImportError:
+    from risk_pattern_registry import RiskPatternRegistry, PatternScan
+
 @dataclass
 class FileRiskAssessment:
     """Risk assessment for a single file."""
@@ -118,6 +122,8 @@ class EnhancedRiskTagger:
         self.total_risk_score = 0.0
         self.file_type_stats = {category: {'count': 0, 'risk_score': 0.0} 
                                for category in self.FILE_CATEGORIES.keys()}
+        # Compiled once per process and shared by every tagger instance
+        self.pattern_registry = RiskPatternRegistry.for_patterns(self.RISK_PATTERNS)
 
     def get_file_category(self, file_path: Path) -> str:
         """Determine the category of a file based on its extension."""
@@ -174,23 +180,27 @@ class EnhancedRiskTagger:
         
         # Extract content
         content = self.extract_text_content(file_path)
-        line_count = len(content.split('\n')) if content else 0
+        line_count = content.count('\n') + 1 if content else 0
+        
+        # Normalize and scan once; every detector below reads from the scan
+        content_lower = content.lower()
+        scan = self.pattern_registry.scan(content_lower)
         
         # Risk level detection
-        risk_level = self._detect_risk_level(content)
+        risk_level = self._detect_risk_level(content_lower, scan)
         risk_score = self._calculate_risk_score(risk_level, file_category, file_size_mb)
         
         # Compliance requirements
-        compliance_requirements = self._extract_compliance_requirements(content)
+        compliance_requirements = self._extract_compliance_requirements(content_lower, scan)
         
         # Security concerns
-        security_concerns = self._detect_security_concerns(content)
+        security_concerns = self._detect_security_concerns(content_lower, scan)
         
         # Privacy concerns
-        privacy_concerns = self._detect_privacy_concerns(content)
+        privacy_concerns = self._detect_privacy_concerns(content_lower, scan)
         
         # Data classification
-        data_classification = self._classify_data(content, file_category)
+        data_classification = self._classify_data(content_lower, file_category, normalized=True)
         
         # Assessment flags
         needs_audit = risk_level == 'HIGH' or len(security_concerns) > 0
@@ -217,17 +227,30 @@ class EnhancedRiskTagger:
             }
         )
 
-    def _detect_risk_level(self, content: str) -> str:
-        """Detect risk level from content."""
+    def _prepare(self, content: str, scan: Optional[PatternScan]):
+        """Return (lowercased content, scan).
+
+        Callers that already hold a scan pass content that is lowercased, so
+        neither the normalization nor the pattern pass is repeated.
+        """
+        if scan is not None:
+            return content, scan
         content_lower = content.lower()
-        
-        # Check for explicit risk tags
-        for pattern in self.RISK_PATTERNS['general']:
-            match = re.search(pattern, content_lower, re.IGNORECASE)
-            if match:
-                risk_level = match.group(1).upper()
-                if risk_level in ['HIGH', 'MEDIUM', 'LOW', 'NONE']:
-                    return risk_level
+        return content_lower, self.pattern_registry.scan(content_lower)
+
+    def _detect_risk_level(self, content: str, scan: Optional[PatternScan] = None) -> str:
+        """Detect risk level from content."""
+        content_lower, scan = self._prepare(content, scan)
+        
+        # Check for explicit risk tags (first match of each pattern, in pattern order)
+        seen_patterns = set()
+        for hit in scan.by_pattern_order('general'):
+            if hit.pattern_index in seen_patterns:
+                continue
+            seen_patterns.add(hit.pattern_index)
+            risk_level = hit.group(1).upper()
+            if risk_level in ['HIGH', 'MEDIUM', 'LOW', 'NONE']:
+                return risk_level
         
         # Default risk assessment based on content
         if any(keyword in content_lower for keyword in ['password', 'secret', 'private_key', 'api_key']):
@@ -268,15 +291,14 @@ class EnhancedRiskTagger:
         
         return min(1.0, base_score * multiplier * size_factor)
 
-    def _extract_compliance_requirements(self, content: str) -> List[str]:
+    def _extract_compliance_requirements(self, content: str,
+                                         scan: Optional[PatternScan] = None) -> List[str]:
         """Extract compliance requirements from content."""
         requirements = []
-        content_lower = content.lower()
+        content_lower, scan = self._prepare(content, scan)
         
-        for pattern in self.RISK_PATTERNS['compliance']:
-            matches = re.findall(pattern, content_lower, re.IGNORECASE)
-            for match in matches:
-                requirements.extend([req.strip() for req in match.split(',')])
+        for hit in scan.by_category('compliance'):
+            requirements.extend([req.strip() for req in hit.group(1).split(',')])
         
         # Also look for common compliance frameworks
         compliance_frameworks = [
@@ -290,31 +312,29 @@ class EnhancedRiskTagger:
         
         return list(set(requirements))  # Remove duplicates
 
-    def _detect_security_concerns(self, content: str) -> List[str]:
+    def _detect_security_concerns(self, content: str,
+                                  scan: Optional[PatternScan] = None) -> List[str]:
         """Detect security concerns in content."""
-        concerns = []
-        content_lower = content.lower()
-        
-        for pattern in self.RISK_PATTERNS['security']:
-            if re.search(pattern, content_lower, re.IGNORECASE):
-                concerns.append(f"Potential security issue: {pattern}")
+        _, scan = self._prepare(content, scan)
+        matched = {hit.pattern_index for hit in scan.by_category('security')}
         
-        return concerns
+        return [f"Potential security issue: {pattern}"
+                for index, pattern in enumerate(self.RISK_PATTERNS['security'])
+                if index in matched]
 
-    def _detect_privacy_concerns(self, content: str) -> List[str]:
+    def _detect_privacy_concerns(self, content: str,
+                                 scan: Optional[PatternScan] = None) -> List[str]:
         """Detect privacy concerns in content."""
-        concerns = []
-        content_lower = content.lower()
-        
-        for pattern in self.RISK_PATTERNS['privacy']:
-            if re.search(pattern, content_lower, re.IGNORECASE):
-                concerns.append(f"Privacy concern: {pattern}")
+        _, scan = self._prepare(content, scan)
+        matched = {hit.pattern_index for hit in scan.by_category('privacy')}
         
-        return concerns
+        return [f"Privacy concern: {pattern}"
+                for index, pattern in enumerate(self.RISK_PATTERNS['privacy'])
+                if index in matched]
 
-    def _classify_data(self, content: str, file_category: str) -> str:
+    def _classify_data(self, content: str, file_category: str, normalized: bool = False) -> str:
         """Classify data sensitivity level."""
-        content_lower = content.lower()
+        content_lower = content if normalized else content.lower()
         
         # Check for restricted data
         if any(keyword in content_lower for keyword in ['password', 'secret', 'private_key', 'ssn', 'credit card']):
@@ -413,8 +433,11 @@ class EnhancedRiskTagger:
                 'privacy_concerns': scan_results['privacy_concerns']
             },
             'audit_readiness': {
-                'files_requiring_audit': len(scan_results['files_needing_audit']),
-                'files_requiring_review': len(scan_results['files_needing_review']),
+                # Streaming callers pass counts plus a bounded sample of paths
+                'files_requiring_audit': scan_results.get(
+                    'files_needing_audit_count', len(scan_results['files_needing_audit'])),
+                'files_requiring_review': scan_results.get(
+                    'files_needing_review_count', len(scan_results['files_needing_review'])),
                 'audit_priority_files': scan_results['files_needing_audit'][:10]  # Top 10
             },
             'recommendations': self._generate_regulatory_recommendations(scan_results)
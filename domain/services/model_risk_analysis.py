@@ -10,7 +10,6 @@ Uses V2 documents module with V1 capabilities for professional analysis.
 
 import sys
 import json
-import pandas as pd
 import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -18,6 +17,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import re
 
+from common.utilities.lazy_imports import lazy_import
+
+pd = lazy_import("pandas")  # loaded on first use
+
 # PathManager import with fallback
 try:
     from common.utilities.path_manager import get_path_manager
@@ -49,6 +52,15 @@ except ImportError:
         DOCUMENTS_AVAILABLE = False
         # Documents module is optional - gracefully degrade functionality
 
+try:
+    from .risk_pattern_registry import RiskPatternRegistry, PatternScan
+    from .pdf_page_extraction import ParallelPdfExtractor, ExtractedPdf, PDF_BACKEND
+except ImportError:
+    from risk_pattern_registry import RiskPatternRegistry, PatternScan
+    from pdf_page_extraction import ParallelPdfExtractor, ExtractedPdf, PDF_BACKEND
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
 @dataclass
 class ModelRiskAnalysis:
     """Analysis results for model risk management documents."""
@@ -67,12 +79,29 @@ class ModelRiskAnalysis:
 class ModelRiskAnalyzer:
     """Analyze regulatory documents for model risk management requirements."""
     
-    def __init__(self):
-        """Initialize the analyzer."""
-        if not DOCUMENTS_AVAILABLE:
-            raise ImportError("Documents module required for analysis")
-        
-        self.processor = SimpleDocumentProcessor()
+    def __init__(self, max_documents: Optional[int] = None, max_pages: Optional[int] = 20,
+                 max_workers: Optional[int] = None, cache_dir: Optional[Path] = None):
+        """Initialize the analyzer.
+        
+        Args:
+            max_documents: Document budget per knowledge-base run (None = all)
+            max_pages: Pages extracted per PDF (None = all)
+            max_workers: PDF extraction worker processes (default: CPU count)
+            cache_dir: Page-text cache directory (default: <root>/.cache/pdf_pages)
+        """
+        if PDF_BACKEND is None and not DOCUMENTS_AVAILABLE:
+            raise ImportError("PyMuPDF, PyPDF2 or the documents module is required for analysis")
+        
+        self.processor = SimpleDocumentProcessor() if DOCUMENTS_AVAILABLE else None
+        self.max_documents = max_documents
+        
+        if cache_dir is None:
+            cache_dir = Path(get_path_manager().root_folder) / ".cache" / "pdf_pages"
+        self.extractor = ParallelPdfExtractor(
+            max_workers=max_workers,
+            cache_dir=cache_dir,
+            max_pages=max_pages
+        ) if PDF_BACKEND else None
         
         # Model risk management keywords and patterns
         self.patterns = {
@@ -122,6 +151,8 @@ class ModelRiskAnalyzer:
                 r'version\s+control'
             ]
         }
+        # All pattern types merged into one matcher, compiled once per process
+        self.pattern_registry = RiskPatternRegistry.for_patterns(self.patterns)
         
         # Regulatory source identification
         self.regulatory_sources = {
@@ -143,6 +174,43 @@ class ModelRiskAnalyzer:
     
     def analyze_document(self, pdf_path: Path) -> ModelRiskAnalysis:
         """Analyze a single document for model risk management content."""
+        if self.extractor is None:
+            return self._analyze_with_documents_module(pdf_path)
+        return self.analyze_extracted(self.extractor.extract(pdf_path))
+    
+    def analyze_extracted(self, extracted: ExtractedPdf) -> ModelRiskAnalysis:
+        """Analyze a PDF whose page text has already been extracted."""
+        pdf_path = Path(extracted.path)
+        print(f"Analyzing: {pdf_path.name}")
+        
+        text = extracted.text
+        if not extracted.success or not text:
+            print(f"  ERROR: Failed to extract text from {pdf_path.name}"
+                  + (f" ({extracted.error})" if extracted.error else ""))
+            return ModelRiskAnalysis(
+                document_path=str(pdf_path),
+                document_type="unknown",
+                regulatory_source="unknown"
+            )
+        
+        analysis = self._analyze_text(pdf_path, text, document_type="pdf")
+        analysis.analysis_metadata = {
+            'text_length': len(text),
+            'pages_extracted': len(extracted.pages),
+            'page_count': extracted.page_count,
+            'from_cache': extracted.from_cache,
+            'processing_time': extracted.extraction_time,
+            'file_hash': extracted.file_hash,
+            'analysis_timestamp': datetime.utcnow().isoformat()
+        }
+        
+        print(f"  SUCCESS: Found {len(analysis.key_requirements)} requirements, "
+              f"score: {analysis.compliance_score:.1%}")
+        
+        return analysis
+    
+    def _analyze_with_documents_module(self, pdf_path: Path) -> ModelRiskAnalysis:
+        """Fallback path when no PDF backend is installed."""
         print(f"Analyzing: {pdf_path.name}")
         
         # Extract document content
@@ -156,26 +224,11 @@ class ModelRiskAnalyzer:
                 regulatory_source="unknown"
             )
         
-        # Create analysis
-        analysis = ModelRiskAnalysis(
-            document_path=str(pdf_path),
-            document_type=result.classification.get('document_type', 'unknown'),
-            regulatory_source=self._identify_regulatory_source(pdf_path.name, result.text)
+        analysis = self._analyze_text(
+            pdf_path, result.text,
+            document_type=result.classification.get('document_type', 'unknown')
         )
         
-        # Extract requirements and criteria
-        analysis.key_requirements = self._extract_patterns(result.text, 'regulatory_requirements')
-        analysis.validation_criteria = self._extract_patterns(result.text, 'validation_criteria')
-        analysis.governance_requirements = self._extract_patterns(result.text, 'governance_requirements')
-        analysis.testing_requirements = self._extract_patterns(result.text, 'testing_requirements')
-        analysis.documentation_requirements = self._extract_patterns(result.text, 'documentation_requirements')
-        
-        # Identify risk categories
-        analysis.risk_categories = self._identify_risk_categories(result.text)
-        
-        # Calculate compliance score
-        analysis.compliance_score = self._calculate_compliance_score(analysis)
-        
         # Store analysis metadata
         analysis.analysis_metadata = {
             'text_length': len(result.text),
@@ -190,6 +243,30 @@ class ModelRiskAnalyzer:
         
         return analysis
     
+    def _analyze_text(self, pdf_path: Path, text: str, document_type: str) -> ModelRiskAnalysis:
+        """Run requirement extraction and scoring over document text."""
+        analysis = ModelRiskAnalysis(
+            document_path=str(pdf_path),
+            document_type=document_type,
+            regulatory_source=self._identify_regulatory_source(pdf_path.name, text)
+        )
+        
+        # Extract requirements and criteria from a single pass over the text
+        scan = self.pattern_registry.scan(text)
+        analysis.key_requirements = self._extract_patterns(text, 'regulatory_requirements', scan)
+        analysis.validation_criteria = self._extract_patterns(text, 'validation_criteria', scan)
+        analysis.governance_requirements = self._extract_patterns(text, 'governance_requirements', scan)
+        analysis.testing_requirements = self._extract_patterns(text, 'testing_requirements', scan)
+        analysis.documentation_requirements = self._extract_patterns(text, 'documentation_requirements', scan)
+        
+        # Identify risk categories
+        analysis.risk_categories = self._identify_risk_categories(text)
+        
+        # Calculate compliance score
+        analysis.compliance_score = self._calculate_compliance_score(analysis)
+        
+        return analysis
+    
     def _identify_regulatory_source(self, filename: str, text: str) -> str:
         """Identify the regulatory source of the document."""
         filename_lower = filename.lower()
@@ -202,28 +279,35 @@ class ModelRiskAnalyzer:
         
         return "unknown"
     
-    def _extract_patterns(self, text: str, pattern_type: str) -> List[str]:
-        """Extract patterns from text based on pattern type."""
+    def _extract_patterns(self, text: str, pattern_type: str,
+                          scan: Optional[PatternScan] = None) -> List[str]:
+        """Extract patterns from text based on pattern type.
+
+        Pass the ``scan`` produced by ``self.pattern_registry`` to reuse a single
+        pass over the document across all pattern types.
+        """
         if pattern_type not in self.patterns:
             return []
         
+        if scan is None:
+            scan = self.pattern_registry.scan(text)
+        
         found_items = []
-        text_lower = text.lower()
         
-        for pattern in self.patterns[pattern_type]:
-            matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-            for match in matches:
-                # Extract surrounding context
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 100)
-                context = text[start:end].strip()
-                
-                # Clean up the context
-                context = re.sub(r'\s+', ' ', context)
-                if len(context) > 10 and context not in found_items:
-                    found_items.append(context)
-        
-        return found_items[:10]  # Limit to top 10 matches
+        for hit in scan.by_pattern_order(pattern_type):
+            # Extract surrounding context
+            start = max(0, hit.start - 50)
+            end = min(len(text), hit.end + 100)
+            context = text[start:end].strip()
+            
+            # Clean up the context
+            context = _WHITESPACE_RE.sub(' ', context)
+            if len(context) > 10 and context not in found_items:
+                found_items.append(context)
+                if len(found_items) >= 10:
+                    break
+        
+        return found_items  # Limit to top 10 matches
     
     def _identify_risk_categories(self, text: str) -> List[str]:
         """Identify model risk categories mentioned in the document."""
@@ -257,25 +341,45 @@ class ModelRiskAnalyzer:
         
         return score / max_score
     
-    def analyze_knowledge_base(self, knowledge_base_path: Path) -> List[ModelRiskAnalysis]:
-        """Analyze all documents in the knowledge base."""
+    def analyze_knowledge_base(self, knowledge_base_path: Path,
+                               max_documents: Optional[int] = None) -> List[ModelRiskAnalysis]:
+        """Analyze all documents in the knowledge base.
+        
+        PDFs are extracted page-parallel in a process pool and analyzed as each
+        one completes. ``max_documents`` (or the analyzer's budget) caps the run;
+        None analyzes every PDF.
+        """
         pdfs_path = knowledge_base_path / "pdfs"
         
         if not pdfs_path.exists():
             print(f"ERROR: PDFs directory not found: {pdfs_path}")
             return []
         
-        pdf_files = list(pdfs_path.glob("*.pdf"))
+        pdf_files = sorted(pdfs_path.glob("*.pdf"))
         print(f"Found {len(pdf_files)} PDF documents for analysis")
         
+        budget = max_documents if max_documents is not None else self.max_documents
+        if budget is not None and len(pdf_files) > budget:
+            print(f"Document budget: analyzing {budget} of {len(pdf_files)} PDFs")
+            pdf_files = pdf_files[:budget]
+        
+        if self.extractor is None:
+            documents = (pdf_file for pdf_file in pdf_files)
+            analyze = self._analyze_with_documents_module
+        else:
+            documents = self.extractor.iter_extract(pdf_files)
+            analyze = self.analyze_extracted
+        
         analyses = []
-        for pdf_file in pdf_files[:10]:  # Limit to first 10 for this demo
+        for document in documents:
+            name = Path(getattr(document, 'path', document)).name
             try:
-                analysis = self.analyze_document(pdf_file)
-                analyses.append(analysis)
+                analyses.append(analyze(document))
             except Exception as e:
-                print(f"ERROR analyzing {pdf_file.name}: {e}")
+                print(f"ERROR analyzing {name}: {e}")
         
+        # Completion order varies between runs; report in a stable order
+        analyses.sort(key=lambda a: a.document_path)
         return analyses
     
     def generate_regulatory_summary(self, analyses: List[ModelRiskAnalysis]) -> Dict[str, Any]:
@@ -363,12 +467,13 @@ def main():
     print("MODEL RISK MANAGEMENT DOCUMENT ANALYZER")
     print("="*60)
     
-    if not DOCUMENTS_AVAILABLE:
-        print("ERROR: Documents module not available")
+    if PDF_BACKEND is None and not DOCUMENTS_AVAILABLE:
+        print("ERROR: No PDF backend or documents module available")
         return 1
     
-    # Initialize analyzer
-    analyzer = ModelRiskAnalyzer()
+    # Initialize analyzer (MODEL_RISK_MAX_DOCUMENTS caps the run; unset = all PDFs)
+    max_documents = os.environ.get("MODEL_RISK_MAX_DOCUMENTS")
+    analyzer = ModelRiskAnalyzer(max_documents=int(max_documents) if max_documents else None)
     
     # Set paths
     path_manager = get_path_manager()
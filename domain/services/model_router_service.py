@@ -4,19 +4,41 @@ Model Router Service
 
 Intelligent model routing based on step kind and performance history.
 Routes requests to appropriate Claude model tier based on task complexity.
+
+Routing is cheap enough to sit on the hot path of workflow execution:
+- the best model per kind is kept incrementally as performance updates
+  arrive, so lookups don't scan the performance history;
+- step features (kind, complexity) are computed once per step and
+  memoized on a fingerprint of the attributes they depend on;
+- routing history is a fixed-size ring buffer.
+
+Besides the default rule-based policy, routing_policy="ucb" or
+"thompson" treats the tiers as bandit arms per kind, with the rule-based
+tier as a small prior bonus.
 """
 
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+from collections import OrderedDict, deque
 import json
+import math
+import random
 from pathlib import Path
 import logging
 
 from .step_attributes import BaseStep
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+ROUTING_POLICIES = ("rules", "ucb", "thompson")
+
 
 @dataclass
 class ModelPerformance:
@@ -87,14 +109,52 @@ class ModelRouterService:
         "low": ["simple", "basic", "quick", "brief"]
     }
 
-    def __init__(self, project_id: str = None):
-        """Initialize the model router."""
+    TIER_ORDER = ["speed", "balanced", "quality", "premium"]
+
+    def __init__(self, project_id: str = None, routing_policy: str = "rules",
+                 feature_cache_size: int = 4096, history_size: int = 100,
+                 exploration: float = 1.0, rule_prior_bonus: float = 0.1,
+                 seed: Optional[int] = None):
+        """
+        Initialize the model router.
+
+        Args:
+            project_id: Project whose performance history is loaded/saved
+            routing_policy: "rules" (default), "ucb" or "thompson"
+            feature_cache_size: Memoized step fingerprints kept
+            history_size: Routing decisions kept in the ring buffer
+            exploration: UCB exploration constant
+            rule_prior_bonus: Prior reward bonus for the rule-based tier (bandit policies)
+            seed: Seed for Thompson sampling
+        """
+        if routing_policy not in ROUTING_POLICIES:
+            raise ValueError(f"Unknown routing policy '{routing_policy}', expected one of {ROUTING_POLICIES}")
+
         self.project_id = project_id
+        self.routing_policy = routing_policy
+        self.exploration = exploration
+        self.rule_prior_bonus = rule_prior_bonus
         self.performance_history: Dict[str, ModelPerformance] = {}
-        self.routing_history: List[Dict[str, Any]] = []
+        self.routing_history: deque = deque(maxlen=history_size)
+
+        # Incremental per-kind leaderboard: kind -> {perf_key: ModelPerformance}
+        self._kind_models: Dict[str, Dict[str, ModelPerformance]] = {}
+        self._kind_leaders: Dict[str, Tuple[float, int, str]] = {}
+        self._perf_rank: Dict[str, int] = {}
+        self._model_to_tier = {model: tier for tier, model in self.MODEL_TIERS.items()}
+
+        # Memoized (kind, complexity) per step fingerprint
+        self.feature_cache_size = feature_cache_size
+        self._feature_cache: "OrderedDict[tuple, Tuple[str, str]]" = OrderedDict()
+
+        if NUMPY_AVAILABLE:
+            self._rng = np.random.default_rng(seed)
+        else:
+            self._rng = random.Random(seed)
 
         # Load performance history if available
         self._load_performance_history()
+        self._rebuild_leaderboard()
 
     def route_step(self, step: BaseStep) -> str:
         """
@@ -106,40 +166,41 @@ class ModelRouterService:
         Returns:
             Model identifier for the step
         """
-        # Determine step kind
-        kind = self._determine_kind(step)
+        # Determine step kind and complexity (memoized per step fingerprint)
+        kind, complexity = self._step_features(step)
         step.kind = kind
 
         # Check for explicit model preference in params
         if step.params and "model" in step.params:
             model = step.params["model"]
             step.last_routed_model = model
-            self._record_routing(step, model, "explicit")
+            self._record_routing(step, model, "explicit", complexity)
             return model
 
-        # Analyze complexity from description and validation rules
-        complexity = self._analyze_complexity(step)
-
         # Get base tier from kind
         base_tier = self.KIND_TO_TIER.get(kind, "balanced")
 
         # Adjust tier based on complexity
         tier = self._adjust_tier_for_complexity(base_tier, complexity)
 
-        # Check performance history for optimization
-        if self.performance_history:
-            tier = self._optimize_tier_by_performance(kind, tier)
+        if self.routing_policy == "rules":
+            # Check performance history for optimization
+            if self.performance_history:
+                tier = self._optimize_tier_by_performance(kind, tier)
 
-        # Consider RL feedback if available
-        if step.last_reward is not None:
-            tier = self._adjust_tier_by_reward(tier, step.last_reward)
+            # Consider RL feedback if available
+            if step.last_reward is not None:
+                tier = self._adjust_tier_by_reward(tier, step.last_reward)
+        else:
+            tier = self._select_tier_bandit(kind, tier)
 
         # Get model from tier
         model = self.MODEL_TIERS[tier]
 
         # Update step tracking
         step.last_routed_model = model
-        self._record_routing(step, model, f"auto:{tier}")
+        method = "auto" if self.routing_policy == "rules" else self.routing_policy
+        self._record_routing(step, model, f"{method}:{tier}", complexity)
 
         return model
 
@@ -159,14 +220,17 @@ class ModelRouterService:
         perf_key = f"{step.last_routed_model}:{step.kind}"
 
         # Get or create performance tracker
-        if perf_key not in self.performance_history:
-            self.performance_history[perf_key] = ModelPerformance(
+        perf = self.performance_history.get(perf_key)
+        if perf is None:
+            perf = ModelPerformance(
                 model_name=step.last_routed_model,
                 kind=step.kind
             )
+            self.performance_history[perf_key] = perf
 
-        # Update metrics
-        self.performance_history[perf_key].update(reward, latency)
+        # Update metrics and the kind's leader
+        perf.update(reward, latency)
+        self._update_leaderboard(perf_key, perf)
 
         # Store in step
         step.last_reward = reward
@@ -176,23 +240,54 @@ class ModelRouterService:
 
     def get_best_model_for_kind(self, kind: str) -> str:
         """Get the best performing model for a specific task kind."""
-        best_model = None
-        best_score = -float('inf')
-
-        for perf_key, perf in self.performance_history.items():
-            if perf.kind == kind:
-                # Score combines reward and success rate
-                score = perf.avg_reward * 0.7 + perf.success_rate * 0.3
-                if score > best_score:
-                    best_score = score
-                    best_model = perf.model_name
+        leader = self._kind_leaders.get(kind)
+        if leader:
+            return self.performance_history[leader[2]].model_name
 
         # Fallback to default if no history
-        if not best_model:
-            tier = self.KIND_TO_TIER.get(kind, "balanced")
-            best_model = self.MODEL_TIERS[tier]
-
-        return best_model
+        tier = self.KIND_TO_TIER.get(kind, "balanced")
+        return self.MODEL_TIERS[tier]
+
+    @staticmethod
+    def _performance_score(perf: ModelPerformance) -> float:
+        """Score combines reward and success rate."""
+        return perf.avg_reward * 0.7 + perf.success_rate * 0.3
+
+    def _leader_entry(self, perf_key: str, perf: ModelPerformance) -> Tuple[float, int, str]:
+        # Ties go to the earliest tracked model, as a scan in insertion order would
+        return (self._performance_score(perf), -self._perf_rank[perf_key], perf_key)
+
+    def _rebuild_leaderboard(self):
+        """Index performance_history by kind and compute every kind's leader."""
+        self._kind_models = {}
+        self._kind_leaders = {}
+        self._perf_rank = {}
+        for perf_key, perf in self.performance_history.items():
+            self._perf_rank[perf_key] = len(self._perf_rank)
+            self._kind_models.setdefault(perf.kind, {})[perf_key] = perf
+        for kind in self._kind_models:
+            self._recompute_leader(kind)
+
+    def _recompute_leader(self, kind: str):
+        models = self._kind_models.get(kind)
+        if models:
+            self._kind_leaders[kind] = max(self._leader_entry(k, p) for k, p in models.items())
+        else:
+            self._kind_leaders.pop(kind, None)
+
+    def _update_leaderboard(self, perf_key: str, perf: ModelPerformance):
+        """Fold one performance update into the kind's leader."""
+        if perf_key not in self._perf_rank:
+            self._perf_rank[perf_key] = len(self._perf_rank)
+            self._kind_models.setdefault(perf.kind, {})[perf_key] = perf
+
+        entry = self._leader_entry(perf_key, perf)
+        leader = self._kind_leaders.get(perf.kind)
+        if leader is None or entry > leader:
+            self._kind_leaders[perf.kind] = entry
+        elif leader[2] == perf_key:
+            # The leader's own score dropped; only this kind's models need rechecking
+            self._recompute_leader(perf.kind)
 
     def get_routing_stats(self) -> Dict[str, Any]:
         """Get statistics about model routing."""
@@ -307,7 +402,7 @@ class ModelRouterService:
 
     def _adjust_tier_for_complexity(self, base_tier: str, complexity: str) -> str:
         """Adjust model tier based on complexity."""
-        tier_order = ["speed", "balanced", "quality", "premium"]
+        tier_order = self.TIER_ORDER
 
         try:
             current_idx = tier_order.index(base_tier)
@@ -324,19 +419,53 @@ class ModelRouterService:
 
     def _optimize_tier_by_performance(self, kind: str, tier: str) -> str:
         """Optimize tier selection based on performance history."""
-        # Find best performing model for this kind
+        # Find best performing model for this kind and map it back to its tier
         best_model = self.get_best_model_for_kind(kind)
+        return self._model_to_tier.get(best_model, tier)
+
+    def _tier_statistics(self, kind: str) -> Tuple[List[int], List[float]]:
+        """Uses and total reward per tier (in TIER_ORDER) for one kind."""
+        uses = [0] * len(self.TIER_ORDER)
+        rewards = [0.0] * len(self.TIER_ORDER)
+        for perf in self._kind_models.get(kind, {}).values():
+            tier = self._model_to_tier.get(perf.model_name)
+            if tier is not None:
+                i = self.TIER_ORDER.index(tier)
+                uses[i] += perf.total_uses
+                rewards[i] += perf.total_reward
+        return uses, rewards
+
+    def _select_tier_bandit(self, kind: str, rule_tier: str) -> str:
+        """Pick a tier for this kind with UCB1 or Gaussian Thompson sampling."""
+        uses, rewards = self._tier_statistics(kind)
+        rule_index = self.TIER_ORDER.index(rule_tier) if rule_tier in self.TIER_ORDER else 1
+        # Rewards lie in [-1, 1]: a N(bonus, 1) prior per arm, unit observation noise
+        prior = [self.rule_prior_bonus if i == rule_index else 0.0 for i in range(len(uses))]
+
+        if self.routing_policy == "ucb":
+            total = sum(uses)
+            if total == 0 or uses[rule_index] == 0:
+                return rule_tier
+            for i, n in enumerate(uses):
+                if n == 0:
+                    return self.TIER_ORDER[i]  # Try every arm once
+            log_total = math.log(total)
+            scores = [rewards[i] / n + prior[i] + self.exploration * math.sqrt(2 * log_total / n)
+                      for i, n in enumerate(uses)]
+        else:
+            means = [(rewards[i] + prior[i]) / (n + 1) for i, n in enumerate(uses)]
+            stds = [1.0 / math.sqrt(n + 1) for n in uses]
+            if NUMPY_AVAILABLE:
+                scores = self._rng.normal(np.asarray(means), np.asarray(stds)).tolist()
+            else:
+                scores = [self._rng.gauss(m, sd) for m, sd in zip(means, stds)]
 
-        # Map model back to tier
-        for t, model in self.MODEL_TIERS.items():
-            if model == best_model:
-                return t
-
-        return tier
+        best = max(range(len(scores)), key=scores.__getitem__)
+        return self.TIER_ORDER[best]
 
     def _adjust_tier_by_reward(self, tier: str, last_reward: float) -> str:
         """Adjust tier based on previous reward."""
-        tier_order = ["speed", "balanced", "quality", "premium"]
+        tier_order = self.TIER_ORDER
 
         try:
             current_idx = tier_order.index(tier)
@@ -352,22 +481,35 @@ class ModelRouterService:
 
         return tier
 
-    def _record_routing(self, step: BaseStep, model: str, method: str):
-        """Record a routing decision."""
-        routing = {
+    def _step_features(self, step: BaseStep) -> Tuple[str, str]:
+        """(kind, complexity) for a step, memoized on the attributes they depend on."""
+        fingerprint = (
+            step.kind, step.step_type, step.description,
+            len(step.validation_rules) if step.validation_rules else 0,
+            len(step.requires), len(step.produces)
+        )
+        cache = self._feature_cache
+        features = cache.get(fingerprint)
+        if features is not None:
+            cache.move_to_end(fingerprint)
+            return features
+
+        features = (self._determine_kind(step), self._analyze_complexity(step))
+        cache[fingerprint] = features
+        if len(cache) > self.feature_cache_size:
+            cache.popitem(last=False)
+        return features
+
+    def _record_routing(self, step: BaseStep, model: str, method: str, complexity: str = None):
+        """Record a routing decision (the ring buffer keeps the most recent ones)."""
+        self.routing_history.append({
             "timestamp": datetime.now().isoformat(),
             "step_name": step.step_name,
             "kind": step.kind,
             "model": model,
             "method": method,
-            "complexity": self._analyze_complexity(step)
-        }
-
-        self.routing_history.append(routing)
-
-        # Keep only last 100 routings
-        if len(self.routing_history) > 100:
-            self.routing_history = self.routing_history[-100:]
+            "complexity": complexity if complexity is not None else self._step_features(step)[1]
+        })
 
     def _load_performance_history(self):
         """Load performance history from storage."""
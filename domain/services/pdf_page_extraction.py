@@ -0,0 +1,252 @@
+"""
+Parallel PDF Page Extraction
+============================
+
+Page-level PDF text extraction on a process pool with an on-disk page cache.
+
+Documents are split into page ranges so a large PDF keeps several workers
+busy, and extracted page text is cached under the SHA-256 of the file so
+re-analysis of unchanged documents skips extraction entirely.
+
+Usage:
+    extractor = ParallelPdfExtractor(cache_dir=Path(".cache/pdf_pages"))
+    for doc in extractor.iter_extract(pdf_files):
+        print(doc.path, doc.page_count, doc.from_cache)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# PDF backends - PyMuPDF is primary, PyPDF2 secondary
+try:
+    import fitz  # PyMuPDF
+    PDF_BACKEND = 'pymupdf'
+except ImportError:
+    try:
+        import PyPDF2
+        PDF_BACKEND = 'pypdf2'
+    except ImportError:
+        PDF_BACKEND = None
+
+CACHE_FORMAT_VERSION = 1
+
+
+def _count_pages(pdf_path: str) -> int:
+    """Return the number of pages in a PDF (runs in a worker process)."""
+    if PDF_BACKEND == 'pymupdf':
+        with fitz.open(pdf_path) as doc:
+            return doc.page_count
+    if PDF_BACKEND == 'pypdf2':
+        with open(pdf_path, 'rb') as handle:
+            return len(PyPDF2.PdfReader(handle).pages)
+    raise ImportError("PyMuPDF or PyPDF2 required for PDF extraction")
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> Tuple[int, List[str]]:
+    """Extract text for pages [start, end) (runs in a worker process)."""
+    pages = []
+    if PDF_BACKEND == 'pymupdf':
+        with fitz.open(pdf_path) as doc:
+            for page_number in range(start, end):
+                pages.append(doc.load_page(page_number).get_text())
+    elif PDF_BACKEND == 'pypdf2':
+        with open(pdf_path, 'rb') as handle:
+            reader = PyPDF2.PdfReader(handle)
+            for page_number in range(start, end):
+                pages.append(reader.pages[page_number].extract_text() or '')
+    else:
+        raise ImportError("PyMuPDF or PyPDF2 required for PDF extraction")
+    return start, pages
+
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Stream a file through SHA-256."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class ExtractedPdf:
+    """Extracted page text for one PDF."""
+    path: Path
+    file_hash: str = ''
+    pages: List[str] = field(default_factory=list)
+    page_count: int = 0
+    from_cache: bool = False
+    extraction_time: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(self.pages)
+
+
+class PdfPageCache:
+    """On-disk cache of extracted page text keyed by file content hash."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, file_hash: str) -> Path:
+        return self.cache_dir / f"{file_hash}.json"
+
+    def get(self, file_hash: str, max_pages: Optional[int] = None) -> Optional[Dict]:
+        """Return the cached entry if it covers the requested pages."""
+        entry_path = self._entry_path(file_hash)
+        if not entry_path.exists():
+            return None
+        try:
+            entry = json.loads(entry_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if entry.get('version') != CACHE_FORMAT_VERSION:
+            return None
+
+        wanted = entry['page_count'] if max_pages is None else min(max_pages, entry['page_count'])
+        if len(entry['pages']) < wanted:
+            return None
+        entry['pages'] = entry['pages'][:wanted]
+        return entry
+
+    def put(self, file_hash: str, pages: List[str], page_count: int):
+        """Write an entry atomically so readers never see a partial file."""
+        payload = json.dumps({
+            'version': CACHE_FORMAT_VERSION,
+            'page_count': page_count,
+            'pages': pages
+        })
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+                handle.write(payload)
+            os.replace(tmp_path, self._entry_path(file_hash))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+
+class ParallelPdfExtractor:
+    """Extract PDF text at page granularity over a worker pool."""
+
+    def __init__(self, max_workers: Optional[int] = None, cache_dir: Optional[Path] = None,
+                 max_pages: Optional[int] = 20, pages_per_task: int = 4,
+                 use_processes: bool = True):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache = PdfPageCache(cache_dir) if cache_dir else None
+        self.max_pages = max_pages
+        self.pages_per_task = max(1, pages_per_task)
+        self.use_processes = use_processes
+
+    def _make_pool(self):
+        if self.use_processes:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def extract(self, pdf_path: Path) -> ExtractedPdf:
+        """Extract a single PDF."""
+        return next(self.iter_extract([pdf_path]))
+
+    def extract_many(self, pdf_paths: Iterable[Path]) -> List[ExtractedPdf]:
+        """Extract several PDFs, returned in input order."""
+        pdf_paths = [Path(p) for p in pdf_paths]
+        by_path = {doc.path: doc for doc in self.iter_extract(pdf_paths)}
+        return [by_path[path] for path in pdf_paths]
+
+    def iter_extract(self, pdf_paths: Iterable[Path]) -> Iterator[ExtractedPdf]:
+        """Yield extracted PDFs as they complete (cache hits first).
+
+        Only documents still in flight are held in memory.
+        """
+        misses: Dict[Path, ExtractedPdf] = {}
+        for pdf_path in pdf_paths:
+            pdf_path = Path(pdf_path)
+            doc = ExtractedPdf(path=pdf_path)
+            try:
+                doc.file_hash = file_sha256(pdf_path)
+            except OSError as e:
+                doc.error = f"Cannot read file: {e}"
+                yield doc
+                continue
+
+            cached = self.cache.get(doc.file_hash, self.max_pages) if self.cache else None
+            if cached is not None:
+                doc.pages = cached['pages']
+                doc.page_count = cached['page_count']
+                doc.from_cache = True
+                yield doc
+            else:
+                misses[pdf_path] = doc
+
+        if not misses:
+            return
+        if PDF_BACKEND is None:
+            for doc in misses.values():
+                doc.error = "PyMuPDF or PyPDF2 required for PDF extraction"
+                yield doc
+            return
+
+        yield from self._extract_misses(misses)
+
+    def _extract_misses(self, misses: Dict[Path, ExtractedPdf]) -> Iterator[ExtractedPdf]:
+        started: Dict[Path, float] = {path: time.perf_counter() for path in misses}
+        chunks: Dict[Path, Dict[int, List[str]]] = {path: {} for path in misses}
+        remaining: Dict[Path, int] = {}
+
+        with self._make_pool() as pool:
+            pending = {pool.submit(_count_pages, str(path)): ('count', path) for path in misses}
+
+            while pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, path = pending.pop(future)
+                    doc = misses[path]
+                    if doc.error:
+                        continue  # Document already failed; drop late page ranges
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        doc.error = f"PDF extraction failed: {e}"
+                        doc.extraction_time = time.perf_counter() - started[path]
+                        yield doc
+                        continue
+
+                    if kind == 'count':
+                        doc.page_count = result
+                        wanted = result if self.max_pages is None else min(self.max_pages, result)
+                        ranges = [(start, min(start + self.pages_per_task, wanted))
+                                  for start in range(0, wanted, self.pages_per_task)]
+                        remaining[path] = len(ranges)
+                        for start, end in ranges:
+                            pending[pool.submit(_extract_page_range, str(path), start, end)] = ('pages', path)
+                    else:
+                        start, pages = result
+                        chunks[path][start] = pages
+                        remaining[path] -= 1
+
+                    if remaining.get(path) == 0:
+                        doc.pages = [page for start in sorted(chunks[path]) for page in chunks[path][start]]
+                        doc.extraction_time = time.perf_counter() - started[path]
+                        del chunks[path]
+                        if self.cache:
+                            try:
+                                self.cache.put(doc.file_hash, doc.pages, doc.page_count)
+                            except OSError as e:
+                                print(f"  WARNING: Could not cache pages for {path.name}: {e}")
+                        yield doc
@@ -41,44 +41,25 @@ class PromptStepsManager(BaseStepsManager):
             project_id: The workflow/project ID
             project_path: Optional custom project path
         """
-        self.project_id = project_id
-
-        # Determine project path
-        if project_path:
-            self.project_path = Path(project_path)
-        else:
-            # Try to use path manager if available
-            try:
-                from common.utilities.path_manager import get_path_manager
-                root = get_path_manager().root_folder
-            except ImportError:
-                # Fallback to relative path
-                root = Path(__file__).parent.parent.parent
-            self.project_path = Path(root) / "domain" / "workflows" / "projects" / project_id
-
-        # Create prompts directory
-        self.prompts_path = self.project_path / "prompts"
-        self.prompts_path.mkdir(parents=True, exist_ok=True)
-
-        # Path for the main prompts configuration
-        self.config_path = self.prompts_path / "prompts_config.json"
+        # Prompts live in <project>/prompts with prompts_config.json
+        super().__init__(project_id, "prompts", project_path)
+
+        # For backward compatibility
+        self.prompts_path = self.steps_path
 
     def get_all_prompts(self) -> List[Dict[str, Any]]:
-        """Get all prompts for this project."""
-        prompts = []
-
-        # Load from individual JSON files
-        json_files = list(self.prompts_path.glob("*.json"))
-        for json_file in json_files:
-            if json_file.name != "prompts_config.json":
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        prompt_data = json.load(f)
-                        prompts.append(prompt_data)
-                except Exception as e:
-                    logger.error(f"Error loading {json_file}: {e}")
-
-        return prompts
+        """Get all prompts for this project (served from the step index)."""
+        return self.store.all()
+
+    # BaseStepsManager interface
+    def get_all_steps(self) -> List[Dict[str, Any]]:
+        return self.get_all_prompts()
+
+    def save_step(self, step_name: str, step_data: Dict[str, Any]) -> Dict[str, Any]:
+        return self.save_prompt(step_name, step_data)
+
+    def load_step(self, step_name: str) -> Optional[Dict[str, Any]]:
+        return self.load_prompt(step_name)
 
     def save_prompt(self, prompt_name: str, prompt_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -105,10 +86,8 @@ class PromptStepsManager(BaseStepsManager):
             if 'version' not in prompt_data:
                 prompt_data['version'] = "1.0.0"
 
-            # Save to file
-            file_path = self.prompts_path / f"{prompt_name}.json"
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(prompt_data, f, indent=2)
+            # Save to file and index
+            file_path = self.store.put(prompt_name, prompt_data)
 
             # Update config
             self._update_config(prompt_name, "saved")
@@ -127,25 +106,12 @@ class PromptStepsManager(BaseStepsManager):
 
     def load_prompt(self, prompt_name: str) -> Optional[Dict[str, Any]]:
         """Load a specific prompt template."""
-        file_path = self.prompts_path / f"{prompt_name}.json"
-
-        if not file_path.exists():
-            return None
-
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.error(f"Error loading prompt {prompt_name}: {e}")
-            return None
+        return self.store.get(prompt_name)
 
     def delete_prompt(self, prompt_name: str) -> Dict[str, Any]:
         """Delete a prompt template."""
         try:
-            file_path = self.prompts_path / f"{prompt_name}.json"
-
-            if file_path.exists():
-                file_path.unlink()
+            if self.store.delete(prompt_name):
                 self._update_config(prompt_name, "deleted")
 
                 return {
@@ -342,9 +308,8 @@ class PromptStepsManager(BaseStepsManager):
 
             for prompt_data in bundle_data.get('prompts', []):
                 prompt_name = prompt_data.get('prompt_name', prompt_data.get('name', 'unknown'))
-                file_path = self.prompts_path / f"{prompt_name}.json"
 
-                if file_path.exists() and not overwrite:
+                if self.store.exists(prompt_name) and not overwrite:
                     skipped_count += 1
                     continue
 
@@ -413,11 +378,9 @@ class PromptStepsManager(BaseStepsManager):
     def _update_config(self, prompt_name: str, action: str):
         """Update the prompts configuration file."""
         try:
-            # Load existing config or create new
-            if self.config_path.exists():
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            else:
+            # Load existing config (cached by mtime) or create new
+            config = self._config_doc.load()
+            if config is None:
                 config = {
                     'project_id': self.project_id,
                     'created_at': datetime.now().isoformat(),
@@ -446,8 +409,7 @@ class PromptStepsManager(BaseStepsManager):
             config['history'] = config['history'][-100:]
 
             # Save config
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            self._config_doc.save(config)
 
         except Exception as e:
             logger.error(f"Error updating config: {e}")
@@ -10,13 +10,25 @@ Features:
 - Performance tracking and feedback
 - Adaptive model routing
 - Cumulative learning across executions
+- Dependency-aware concurrent step execution
+
+Steps form an execution graph. A step depends on the steps listed in its
+``depends_on`` and on every earlier step (in step-number order) that
+``produces`` one of the artifacts it ``requires``. Steps that only need
+the uploaded files and field values are independent and run concurrently
+on a bounded pool (``max_parallel_steps``, overridable per workflow).
+RL factor reads and updates are serialized under one lock, and progress
+messages are delivered on the calling thread, grouped per step in
+completion order.
 """
 
 from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 from pathlib import Path
 import json
 import logging
+import threading
 
 from .rl_factor_optimizer import RLFactorOptimizer
 from .cumulative_learning_pipeline import CumulativeLearningPipeline
@@ -32,9 +44,10 @@ logger = logging.getLogger(__name__)
 class RLWorkflowExecutor:
     """RL-enhanced workflow execution service."""
 
-    def __init__(self, project_id: str):
+    def __init__(self, project_id: str, max_parallel_steps: int = 4):
         """Initialize the RL workflow executor."""
         self.project_id = project_id
+        self.max_parallel_steps = max(1, max_parallel_steps)
         self.session_id = f"{project_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
         # Initialize RL components
@@ -54,6 +67,10 @@ class RLWorkflowExecutor:
         self.workflow_results = {}
         self.step_results = []
         self.performance_metrics = {}
+        self.execution_graph: Dict[str, List[str]] = {}
+
+        # Serializes RL factor updates and result bookkeeping across step threads
+        self._rl_lock = threading.RLock()
 
     def execute_workflow_with_rl(
         self,
@@ -82,29 +99,23 @@ class RLWorkflowExecutor:
         start_time = datetime.now()
 
         try:
-            # Load and sort workflow steps
+            # Load and sort workflow steps, then build the execution graph
             steps_config = self._load_step_configuration(workflow)
             sorted_steps = self._sort_steps_by_number(steps_config)
+            self.execution_graph = self._build_execution_graph(sorted_steps)
+            max_parallel = max(1, int(workflow.get('max_parallel_steps', self.max_parallel_steps)))
 
             if progress_callback:
                 progress_callback("🚀 RL-enhanced execution pipeline initialized")
 
-            # Execute each step with RL optimization
-            for i, step_config in enumerate(sorted_steps):
-                step_result = self._execute_step_with_rl(
-                    step_config,
-                    uploaded_files,
-                    field_values,
-                    progress_callback
-                )
-
-                # Update progress
-                if progress_callback:
-                    progress = (i + 1) / len(sorted_steps)
-                    progress_callback(
-                        f"Step {i+1}/{len(sorted_steps)} completed",
-                        progress
-                    )
+            # Execute steps with RL optimization, independent steps concurrently
+            self._execute_step_graph(
+                sorted_steps,
+                uploaded_files,
+                field_values,
+                progress_callback,
+                max_parallel
+            )
 
             # Generate final results with RL summary
             execution_time = (datetime.now() - start_time).total_seconds()
@@ -119,6 +130,141 @@ class RLWorkflowExecutor:
             logger.error(f"Workflow execution failed: {e}")
             return self._generate_error_results(str(e))
 
+    def _build_execution_graph(self, sorted_steps: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """
+        Map each step_id to the step_ids it must wait for.
+
+        Explicit ``depends_on`` entries are kept as given. Inferred edges only
+        point to earlier steps in step-number order, so they never form a cycle.
+        """
+        step_ids = [step['step_id'] for step in sorted_steps]
+        known = set(step_ids)
+        producers: Dict[str, List[str]] = {}
+        graph: Dict[str, List[str]] = {}
+
+        for step in sorted_steps:
+            step_id = step['step_id']
+            deps = []
+            for dep in step.get('depends_on', []) or []:
+                if dep not in known:
+                    raise ValueError(f"Step '{step_id}' depends on unknown step '{dep}'")
+                if dep not in deps:
+                    deps.append(dep)
+            for artifact in step.get('requires', []) or []:
+                for producer in producers.get(artifact, []):
+                    if producer not in deps:
+                        deps.append(producer)
+            graph[step_id] = deps
+            for artifact in step.get('produces', []) or []:
+                producers.setdefault(artifact, []).append(step_id)
+
+        # Explicit dependencies may still point forward; reject cycles
+        state: Dict[str, int] = {}
+        for root in step_ids:
+            if root in state:
+                continue
+            stack = [(root, iter(graph[root]))]
+            state[root] = 1
+            while stack:
+                node, deps = stack[-1]
+                dep = next(deps, None)
+                if dep is None:
+                    state[node] = 2
+                    stack.pop()
+                elif state.get(dep) == 1:
+                    raise ValueError(f"Dependency cycle involving step '{dep}'")
+                elif dep not in state:
+                    state[dep] = 1
+                    stack.append((dep, iter(graph[dep])))
+
+        return graph
+
+    def _upstream_steps(self, step_id: str) -> List[str]:
+        """Every step ``step_id`` transitively depends on, in dependency-first order."""
+        upstream: List[str] = []
+        seen = set()
+
+        def visit(node: str):
+            for dep in self.execution_graph.get(node, []):
+                if dep not in seen:
+                    seen.add(dep)
+                    visit(dep)
+                    upstream.append(dep)
+
+        visit(step_id)
+        return upstream
+
+    def _execute_step_graph(
+        self,
+        sorted_steps: List[Dict[str, Any]],
+        uploaded_files: List,
+        field_values: Dict,
+        progress_callback=None,
+        max_parallel: int = 1
+    ):
+        """
+        Run steps as their dependencies complete, at most ``max_parallel`` at once.
+
+        Ready steps are started in step-number order. Progress messages from a
+        step are buffered and replayed on this thread when the step finishes.
+        The first failure stops new steps from starting; running steps finish
+        and the failure is re-raised.
+        """
+        total = len(sorted_steps)
+        remaining = {step['step_id']: set(self.execution_graph[step['step_id']]) for step in sorted_steps}
+        dependents: Dict[str, List[str]] = {}
+        for step_id, deps in remaining.items():
+            for dep in deps:
+                dependents.setdefault(dep, []).append(step_id)
+        order = {step['step_id']: i for i, step in enumerate(sorted_steps)}
+        configs = {step['step_id']: step for step in sorted_steps}
+        ready = [step['step_id'] for step in sorted_steps if not remaining[step['step_id']]]
+
+        completed = 0
+        failure: Optional[BaseException] = None
+
+        def run(step_config, messages):
+            buffered = (lambda *args: messages.append(args)) if progress_callback else None
+            return self._execute_step_with_rl(step_config, uploaded_files, field_values, buffered)
+
+        with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="rl-step") as pool:
+            in_flight = {}
+            while ready or in_flight:
+                while ready and failure is None and len(in_flight) < max_parallel:
+                    step_id = ready.pop(0)
+                    messages: List[tuple] = []
+                    in_flight[pool.submit(run, configs[step_id], messages)] = (step_id, messages)
+                if not in_flight:
+                    break
+
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: order[in_flight[f][0]]):
+                    step_id, messages = in_flight.pop(future)
+                    if progress_callback:
+                        for args in messages:
+                            progress_callback(*args)
+                    error = future.exception()
+                    if error is not None:
+                        failure = failure or error
+                        continue
+
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(f"Step {completed}/{total} completed", completed / total)
+
+                    newly_ready = []
+                    for dependent in dependents.get(step_id, []):
+                        remaining[dependent].discard(step_id)
+                        if not remaining[dependent]:
+                            newly_ready.append(dependent)
+                    ready = sorted(ready + newly_ready, key=order.__getitem__)
+
+        # Keep step results in workflow order regardless of completion order
+        self.step_results.sort(key=lambda r: order.get(r['name'], total))
+
+        if failure is not None:
+            raise failure
+
     def _execute_step_with_rl(
         self,
         step_config: Dict[str, Any],
@@ -146,12 +292,17 @@ class RLWorkflowExecutor:
                 kind=step_config.get('kind', step_type)
             )
 
-            # Get RL-optimized factors
-            rl_factors = self.rl_optimizer.optimize_step_factors(
-                step_type=step_type,
-                historical_data=self.workflow_results,
-                context={'project_id': self.project_id, 'session_id': self.session_id}
-            )
+            # Get RL-optimized factors from the results this step depends on;
+            # steps running in parallel may finish in any order, so nothing else
+            with self._rl_lock:
+                historical_data = {dep: self.workflow_results[dep]
+                                   for dep in self._upstream_steps(step_id)
+                                   if dep in self.workflow_results}
+                rl_factors = self.rl_optimizer.optimize_step_factors(
+                    step_type=step_type,
+                    historical_data=historical_data,
+                    context={'project_id': self.project_id, 'session_id': self.session_id}
+                )
 
             if progress_callback:
                 progress_callback(
@@ -167,37 +318,38 @@ class RLWorkflowExecutor:
             # Calculate execution metrics
             step_duration = (datetime.now() - step_start_time).total_seconds()
 
-            # RL feedback for successful execution
-            reward = self.learning_pipeline.calculate_step_reward(
-                step=base_step,
-                result=result,
-                execution_time=step_duration,
-                success=True
-            )
+            with self._rl_lock:
+                # RL feedback for successful execution
+                reward = self.learning_pipeline.calculate_step_reward(
+                    step=base_step,
+                    result=result,
+                    execution_time=step_duration,
+                    success=True
+                )
 
-            # Update RL factors with feedback
-            self.rl_optimizer.update_with_feedback(
-                step_type=step_type,
-                reward=reward,
-                context={'execution_time': step_duration, 'result_quality': len(str(result))}
-            )
+                # Update RL factors with feedback
+                self.rl_optimizer.update_with_feedback(
+                    step_type=step_type,
+                    reward=reward,
+                    context={'execution_time': step_duration, 'result_quality': len(str(result))}
+                )
 
-            # Update step attributes
-            base_step.last_reward = reward
-            base_step.last_modified = datetime.now().isoformat()
-
-            # Store results
-            self.workflow_results[step_id] = result
-            self.step_results.append({
-                'step': step_config.get('step_number', 0),
-                'name': step_id,
-                'type': step_type,
-                'status': 'completed',
-                'result': result,
-                'rl_reward': reward,
-                'execution_time': step_duration,
-                'rl_factors': rl_factors
-            })
+                # Update step attributes
+                base_step.last_reward = reward
+                base_step.last_modified = datetime.now().isoformat()
+
+                # Store results
+                self.workflow_results[step_id] = result
+                self.step_results.append({
+                    'step': step_config.get('step_number', 0),
+                    'name': step_id,
+                    'type': step_type,
+                    'status': 'completed',
+                    'result': result,
+                    'rl_reward': reward,
+                    'execution_time': step_duration,
+                    'rl_factors': rl_factors
+                })
 
             if progress_callback:
                 progress_callback(
@@ -211,21 +363,22 @@ class RLWorkflowExecutor:
             step_duration = (datetime.now() - step_start_time).total_seconds()
             reward = -0.5  # Penalty for failure
 
-            self.rl_optimizer.update_with_feedback(
-                step_type=step_type,
-                reward=reward,
-                context={'execution_time': step_duration, 'error': str(e)}
-            )
+            with self._rl_lock:
+                self.rl_optimizer.update_with_feedback(
+                    step_type=step_type,
+                    reward=reward,
+                    context={'execution_time': step_duration, 'error': str(e)}
+                )
 
-            self.step_results.append({
-                'step': step_config.get('step_number', 0),
-                'name': step_id,
-                'type': step_type,
-                'status': 'failed',
-                'error': str(e),
-                'rl_reward': reward,
-                'execution_time': step_duration
-            })
+                self.step_results.append({
+                    'step': step_config.get('step_number', 0),
+                    'name': step_id,
+                    'type': step_type,
+                    'status': 'failed',
+                    'error': str(e),
+                    'rl_reward': reward,
+                    'execution_time': step_duration
+                })
 
             if progress_callback:
                 progress_callback(f"❌ Step {step_name} failed: {e}")
@@ -284,7 +437,8 @@ class RLWorkflowExecutor:
                     'total_steps': total_steps,
                     'successful_steps': successful_steps,
                     'success_rate': success_rate,
-                    'step_results': self.step_results
+                    'step_results': self.step_results,
+                    'execution_graph': self.execution_graph
                 },
                 'workflow_results': self.workflow_results,
                 'rl_optimization': {
@@ -0,0 +1,311 @@
+"""
+Step Index Store
+================
+
+Index-backed storage for the file-per-step managers (Action, Prompt, AskAI,
+Unified).
+
+Each step is still one ``<name>.json`` file in the step directory, so
+existing tooling and exports keep working. Alongside the directory a
+single manifest (``.<directory>_index.json``) caches every step record
+with the mtime and size it was read at:
+
+- Listing, summaries and category queries are served from memory.
+- A fresh process needs a single manifest read; only step files whose
+  mtime or size changed since the manifest was written are re-parsed.
+- The directory mtime is checked on every access (one stat), and a full
+  stat pass runs at most once per ``refresh_interval`` seconds to pick up
+  in-place edits made outside the store.
+
+Writes go through the store: the step file is replaced atomically
+(temp file + ``os.replace``) under the store lock, so readers never see a
+partially written step. The manifest is rewritten lazily - at most once
+per ``index_write_interval`` seconds, on ``flush()`` and at interpreter
+exit - so a burst of saves pays for one manifest write, not one each.
+Step files remain the source of truth: a stale or missing manifest only
+means the changed files are re-parsed.
+
+Stores and config documents are shared per path within the process, so
+managers re-created on every Streamlit rerun reuse the warm cache.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+_shared_lock = threading.Lock()
+_shared: Dict[tuple, Any] = {}
+_pending_index_writes: "weakref.WeakSet[StepIndexStore]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_pending_indexes():
+    for store in list(_pending_index_writes):
+        store.flush()
+
+
+def _shared_instance(kind: str, path: Path, factory: Callable[[], Any]) -> Any:
+    """Return the process-wide instance for (kind, resolved path), creating it once."""
+    key = (kind, str(Path(path).resolve()))
+    with _shared_lock:
+        instance = _shared.get(key)
+        if instance is None:
+            instance = factory()
+            _shared[key] = instance
+        return instance
+
+
+def atomic_write_json(path: Path, data: Any) -> str:
+    """Serialize ``data`` and atomically replace ``path``. Returns the written text."""
+    path = Path(path)
+    text = json.dumps(data, indent=2)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return text
+
+
+class CachedJsonDocument:
+    """A JSON file (e.g. a step config) cached in memory and revalidated by mtime."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._data: Optional[Dict[str, Any]] = None
+        self._stamp = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_path(cls, path: Path) -> "CachedJsonDocument":
+        return _shared_instance("document", path, lambda: cls(path))
+
+    def _current_stamp(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return a copy of the document, or None if the file doesn't exist."""
+        with self._lock:
+            stamp = self._current_stamp()
+            if stamp is None:
+                self._data, self._stamp = None, None
+                return None
+            if stamp != self._stamp:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+                self._stamp = stamp
+            return copy.deepcopy(self._data)
+
+    def save(self, data: Dict[str, Any]):
+        with self._lock:
+            text = atomic_write_json(self.path, data)
+            self._data = json.loads(text)
+            self._stamp = self._current_stamp()
+
+
+class StepIndexStore:
+    """Manifest-indexed view of a directory of ``<name>.json`` step files."""
+
+    def __init__(self, directory: Path, exclude: Iterable[str] = (), refresh_interval: float = 5.0,
+                 index_write_interval: Optional[float] = None):
+        self.directory = Path(directory)
+        self.index_path = self.directory.parent / f".{self.directory.name}_index.json"
+        self.exclude = set(exclude)
+        self.refresh_interval = refresh_interval
+        self.index_write_interval = refresh_interval if index_write_interval is None else index_write_interval
+        self._index_dirty = False
+        self._last_index_write = float('-inf')
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dir_mtime_ns: Optional[int] = None
+        self._last_full_check = 0.0
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_directory(cls, directory: Path, exclude: Iterable[str] = (),
+                      refresh_interval: float = 5.0) -> "StepIndexStore":
+        """Process-wide store for a step directory."""
+        return _shared_instance("steps", directory, lambda: cls(directory, exclude, refresh_interval))
+
+    # ------------------------------------------------------------------ index
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == INDEX_VERSION:
+                self._entries = index.get('entries', {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable step index {self.index_path}: {e}")
+        self._loaded = True
+
+    def _write_index(self):
+        self._index_dirty = False
+        self._last_index_write = time.monotonic()
+        _pending_index_writes.discard(self)
+        try:
+            atomic_write_json(self.index_path, {
+                'version': INDEX_VERSION,
+                'directory': self.directory.name,
+                'entries': self._entries
+            })
+        except Exception as e:
+            # The manifest is only a cache; the step files are already written
+            logger.error(f"Error writing step index {self.index_path}: {e}")
+
+    def _index_changed(self):
+        """Schedule a manifest write; it happens now only if the last one is old enough."""
+        self._index_dirty = True
+        _pending_index_writes.add(self)
+        self._write_index_if_due()
+
+    def _write_index_if_due(self):
+        if self._index_dirty and time.monotonic() - self._last_index_write >= self.index_write_interval:
+            self._write_index()
+
+    def flush(self):
+        """Write the manifest now if it has pending changes."""
+        with self._lock:
+            if self._index_dirty:
+                self._write_index()
+
+    def _sync(self, force: bool = False):
+        """Bring the in-memory entries in line with the step files on disk."""
+        if not self._loaded:
+            self._load_index()
+            force = True
+
+        try:
+            dir_mtime_ns = os.stat(self.directory).st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime_ns = None
+
+        self._write_index_if_due()
+        now = time.monotonic()
+        if (not force and dir_mtime_ns == self._dir_mtime_ns
+                and now - self._last_full_check < self.refresh_interval):
+            return
+        self._dir_mtime_ns = dir_mtime_ns
+        self._last_full_check = now
+
+        seen = set()
+        changed = False
+        if dir_mtime_ns is not None:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if (not entry.name.endswith('.json') or entry.name in self.exclude
+                            or not entry.is_file()):
+                        continue
+                    name = entry.name[:-len('.json')]
+                    stat = entry.stat()
+                    cached = self._entries.get(name)
+                    if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                        seen.add(name)
+                        continue
+                    try:
+                        with open(entry.path, 'r', encoding='utf-8') as f:
+                            data = json.load(f)
+                    except Exception as e:
+                        logger.error(f"Error loading {entry.path}: {e}")
+                        continue
+                    self._entries[name] = {
+                        'mtime_ns': stat.st_mtime_ns,
+                        'size': stat.st_size,
+                        'data': data
+                    }
+                    seen.add(name)
+                    changed = True
+
+        for name in set(self._entries) - seen:
+            del self._entries[name]
+            changed = True
+
+        if changed:
+            self._index_changed()
+
+    def refresh(self, force: bool = True):
+        """Re-validate the index against the step files."""
+        with self._lock:
+            self._sync(force=force)
+
+    # ---------------------------------------------------------------- queries
+
+    def all(self) -> List[Dict[str, Any]]:
+        """Every step record, ordered by step name."""
+        with self._lock:
+            self._sync()
+            return [copy.deepcopy(self._entries[name]['data']) for name in sorted(self._entries)]
+
+    def names(self) -> List[str]:
+        with self._lock:
+            self._sync()
+            return sorted(self._entries)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._sync()
+            entry = self._entries.get(name)
+            return copy.deepcopy(entry['data']) if entry else None
+
+    def exists(self, name: str) -> bool:
+        with self._lock:
+            self._sync()
+            return name in self._entries
+
+    # ----------------------------------------------------------------- writes
+
+    def path_for(self, name: str) -> Path:
+        return self.directory / f"{name}.json"
+
+    def put(self, name: str, data: Dict[str, Any]) -> Path:
+        """Atomically write one step file and record it in the index."""
+        file_path = self.path_for(name)
+        with self._lock:
+            self._sync()
+            text = atomic_write_json(file_path, data)
+            stat = os.stat(file_path)
+            self._entries[name] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'data': json.loads(text)
+            }
+            self._dir_mtime_ns = os.stat(self.directory).st_mtime_ns
+            self._index_changed()
+        return file_path
+
+    def delete(self, name: str) -> bool:
+        """Remove a step file and its index entry. Returns False if it didn't exist."""
+        file_path = self.path_for(name)
+        with self._lock:
+            self._sync()
+            if not file_path.exists():
+                return False
+            file_path.unlink()
+            self._entries.pop(name, None)
+            self._dir_mtime_ns = os.stat(self.directory).st_mtime_ns
+            self._index_changed()
+        return True
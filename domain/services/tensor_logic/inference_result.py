@@ -197,6 +197,7 @@ class BatchInferenceResult:
     total_processing_time_ms: float = 0.0
     success_count: int = 0
     failure_count: int = 0
+    errors: Dict[int, str] = field(default_factory=dict)  # input index -> error
 
     def get_average_confidence(self) -> float:
         """Calculate average confidence across all results."""
@@ -411,8 +411,9 @@ class TensorLogicService:
         results = []
         success_count = 0
         failure_count = 0
+        errors = {}
 
-        for query, context in zip(queries, contexts):
+        for index, (query, context) in enumerate(zip(queries, contexts)):
             try:
                 result = self.infer(query, context, temperature, compliance_standard)
                 results.append(result)
@@ -420,7 +421,7 @@ class TensorLogicService:
             except Exception as e:
                 # Record failure but continue
                 failure_count += 1
-                # Could add error result here
+                errors[index] = str(e)
 
         total_time = (time.time() - start_time) * 1000
 
@@ -428,7 +429,8 @@ class TensorLogicService:
             results=results,
             total_processing_time_ms=total_time,
             success_count=success_count,
-            failure_count=failure_count
+            failure_count=failure_count,
+            errors=errors
         )
 
     def _load_compliance_rules(
@@ -55,6 +55,36 @@ class UnifiedStepsManager(BaseStepsManager):
         self.execution_context = {}
         self.step_outputs = {}
 
+    def get_all_steps(self) -> List[Dict[str, Any]]:
+        """Get all unified step configurations (served from the step index)."""
+        return self.store.all()
+
+    def save_step(self, step_name: str, step_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Save a unified step configuration."""
+        try:
+            step_data['step_name'] = step_name
+            step_data['last_modified'] = datetime.now().isoformat()
+            step_data['project_id'] = self.project_id
+
+            file_path = self.store.put(step_name, step_data)
+            self._update_config(step_name, "saved")
+
+            return {
+                'success': True,
+                'file_path': str(file_path),
+                'message': f"Unified step '{step_name}' saved successfully"
+            }
+
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e)
+            }
+
+    def load_step(self, step_name: str) -> Optional[Dict[str, Any]]:
+        """Load a specific unified step configuration."""
+        return self.store.get(step_name)
+
     def execute_step(self, step_config: Dict[str, Any], inputs: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Execute a unified step with both action and prompt phases.
@@ -2,14 +2,46 @@
 Dependency Injection Container
 ==============================
 Central container for managing dependencies and wiring the application.
+
+Services registered with ``register_lazy`` form a dependency graph and are
+constructed on first ``get_service`` / ``get_adapter`` call, so a portal
+only pays for the database pools, AWS clients and MLflow connections it
+actually touches. ``warm_up`` builds a set of services ahead of time,
+constructing independent ones concurrently, and every lazy construction
+is timed in ``construction_times``.
 """
 
-from typing import Dict, Any, Type, Callable
+from typing import Dict, Any, Type, Callable, Iterable, List, Optional, Sequence
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
 
+class _LazySection(Mapping):
+    """Read-only mapping of context keys to container services, resolved on access."""
+
+    def __init__(self, container: "DIContainer", names: Dict[str, str]):
+        self._container = container
+        self._names = names
+
+    def __getitem__(self, key: str) -> Any:
+        return self._container.get_service(self._names[key])
+
+    def __contains__(self, key: object) -> bool:
+        # Mapping's default goes through __getitem__, which would build the service
+        return key in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
 class DIContainer:
     """
     Dependency Injection Container for hexagonal architecture.
@@ -27,6 +59,12 @@ class DIContainer:
             "secondary": {}
         }
 
+        # Lazy singletons: name -> {"provider", "depends_on"}
+        self.lazy_services: Dict[str, Dict[str, Any]] = {}
+        self.construction_times: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+
     def register_service(self, name: str, service_class: Type, *args, **kwargs) -> None:
         """Register a service class"""
         self.services[name] = {
@@ -46,6 +84,23 @@ class DIContainer:
         self.singletons[name] = instance
         logger.info(f"Registered singleton: {name}")
 
+    def register_lazy(self, name: str, provider: Callable[..., Any], depends_on: Sequence[str] = ()) -> None:
+        """
+        Register a singleton built on first use.
+
+        ``provider`` is called with the resolved ``depends_on`` services as
+        positional arguments. Re-registering a name discards any instance
+        already built for it.
+        """
+        with self._lock:
+            self.lazy_services[name] = {
+                "provider": provider,
+                "depends_on": tuple(depends_on)
+            }
+            self.singletons.pop(name, None)
+            self.construction_times.pop(name, None)
+        logger.info(f"Registered lazy service: {name}")
+
     def register_adapter(self, type: str, name: str, adapter_class: Type, *args, **kwargs) -> None:
         """Register an adapter (primary or secondary)"""
         if type not in ["primary", "secondary"]:
@@ -58,12 +113,24 @@ class DIContainer:
         }
         logger.info(f"Registered {type} adapter: {name}")
 
+    def bind_adapter(self, type: str, name: str, service_name: str) -> None:
+        """Expose a (lazy) service as an adapter"""
+        if type not in ["primary", "secondary"]:
+            raise ValueError(f"Adapter type must be 'primary' or 'secondary', got {type}")
+
+        self.adapters[type][name] = {"service": service_name}
+        logger.info(f"Bound {type} adapter {name} to service {service_name}")
+
     def get_service(self, name: str) -> Any:
         """Get a service instance"""
         # Check singletons first
         if name in self.singletons:
             return self.singletons[name]
 
+        # Lazy singletons are built once, on first request
+        if name in self.lazy_services:
+            return self._resolve(name)
+
         # Check factories
         if name in self.factories:
             instance = self.factories[name]()
@@ -89,107 +156,233 @@ class DIContainer:
             raise ValueError(f"{type.capitalize()} adapter {name} not found")
 
         adapter_config = self.adapters[type][name]
+        if "service" in adapter_config:
+            return self.get_service(adapter_config["service"])
+
         instance = adapter_config["class"](
             *adapter_config["args"],
             **adapter_config["kwargs"]
         )
         return instance
 
-    def wire(self) -> Dict[str, Any]:
+    # ------------------------------------------------------------------
+    # Lazy construction
+    # ------------------------------------------------------------------
+
+    def _dependency_closure(self, names: Iterable[str]) -> List[str]:
+        """Lazy services needed for ``names``, dependencies first; rejects cycles."""
+        order: List[str] = []
+        state: Dict[str, str] = {}
+
+        def visit(name: str, path: List[str]):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                cycle = " -> ".join(path[path.index(name):] + [name])
+                raise ValueError(f"Circular service dependency: {cycle}")
+            if name not in self.lazy_services:
+                if name in self.singletons or name in self.factories or name in self.services:
+                    return
+                raise ValueError(f"Service {name} not found")
+            state[name] = "visiting"
+            for dependency in self.lazy_services[name]["depends_on"]:
+                visit(dependency, path + [name])
+            state[name] = "done"
+            order.append(name)
+
+        for name in names:
+            visit(name, [])
+        return order
+
+    def _resolve(self, name: str) -> Any:
+        """Build a lazy service (and its dependencies) exactly once."""
+        for dependency in self._dependency_closure([name]):
+            self._construct(dependency)
+        return self.singletons[name]
+
+    def _construct(self, name: str) -> float:
+        """Build one lazy service whose dependencies are already built; returns seconds taken."""
+        with self._lock:
+            if name in self.singletons:
+                return 0.0
+            build_lock = self._build_locks.setdefault(name, threading.Lock())
+
+        with build_lock:
+            if name in self.singletons:
+                return 0.0
+
+            definition = self.lazy_services[name]
+            dependencies = [self.get_service(dependency) for dependency in definition["depends_on"]]
+
+            started = time.perf_counter()
+            instance = definition["provider"](*dependencies)
+            elapsed = time.perf_counter() - started
+
+            with self._lock:
+                self.singletons[name] = instance
+                self.construction_times[name] = elapsed
+            logger.info(f"Constructed service {name} in {elapsed * 1000:.1f}ms")
+            return elapsed
+
+    def warm_up(self, names: Optional[Iterable[str]] = None, max_workers: int = 4) -> Dict[str, float]:
+        """
+        Construct lazy services ahead of first use.
+
+        Services whose dependencies are ready are built concurrently; a
+        service starts as soon as everything it depends on exists. Defaults
+        to every registered lazy service. Returns construction time in
+        seconds for each service built by this call. If a construction fails,
+        no further services are started and the error is re-raised once the
+        in-flight ones finish.
+        """
+        if names is None:
+            names = list(self.lazy_services)
+        pending = [name for name in self._dependency_closure(names) if name not in self.singletons]
+
+        timings: Dict[str, float] = {}
+        if not pending:
+            return timings
+
+        remaining = set(pending)
+        error: Optional[BaseException] = None
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="di-warmup") as pool:
+            in_flight = {}
+            while remaining or in_flight:
+                if error is None:
+                    for name in pending:
+                        if name not in remaining:
+                            continue
+                        if all(dependency not in remaining and dependency not in in_flight.values()
+                               for dependency in self.lazy_services[name]["depends_on"]):
+                            remaining.discard(name)
+                            in_flight[pool.submit(self._construct, name)] = name
+                elif not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = in_flight.pop(future)
+                    try:
+                        timings[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to construct service {name}: {e}")
+                        if error is None:
+                            error = e
+
+        if error is not None:
+            raise error
+        return timings
+
+    def get_construction_times(self) -> Dict[str, float]:
+        """Construction time (seconds) of every lazy service built so far, slowest first"""
+        with self._lock:
+            return dict(sorted(self.construction_times.items(), key=lambda item: item[1], reverse=True))
+
+    def wire(self, warm: Iterable[str] = ()) -> Dict[str, Any]:
         """
         Wire all dependencies and return the application context.
 
-        This method creates all necessary instances and wires them together
-        according to the hexagonal architecture principles.
+        Components are registered as lazy services and only constructed
+        when the context (or ``get_service``) first asks for them. Pass
+        ``warm`` to construct some of them up front.
         """
-        context = {}
-
         try:
-            # Create infrastructure components first
-            from infrastructure.yaml_loader import SettingsLoader
-            from infrastructure.services.credential_carrier import get_credential_carrier
-            from adapters.secondary.session.unified_session_adapter import UnifiedSessionAdapter
-
-            # Create shared infrastructure services (Resource Carrier Pattern)
-            settings_loader = SettingsLoader()
-            credential_carrier = get_credential_carrier()
+            # Infrastructure components (Resource Carrier Pattern)
+            def settings_loader():
+                from infrastructure.yaml_loader import SettingsLoader
+                return SettingsLoader()
+
+            def credential_carrier():
+                from infrastructure.services.credential_carrier import get_credential_carrier
+                carrier = get_credential_carrier()
+                # Ensure environment variables are set for legacy compatibility
+                carrier.set_environment_from_credentials()
+                return carrier
+
+            def session_adapter(carrier):
+                from adapters.secondary.session.unified_session_adapter import UnifiedSessionAdapter
+                return UnifiedSessionAdapter(carrier)
+
+            self.register_lazy("settings_loader", settings_loader)
+            self.register_lazy("credential_carrier", credential_carrier)
+            self.register_lazy("session_adapter", session_adapter, depends_on=["credential_carrier"])
+            self.bind_adapter("secondary", "session", "session_adapter")
+
+            # Repository adapters (secondary)
+            def config_repository(loader):
+                from adapters.secondary.yaml_config_repository import YamlConfigRepository
+                return YamlConfigRepository(loader)
+
+            def portal_repository():
+                from adapters.secondary.in_memory_portal_repository import InMemoryPortalRepository
+                return InMemoryPortalRepository()
+
+            self.register_lazy("config_repository", config_repository, depends_on=["settings_loader"])
+            self.register_lazy("portal_repository", portal_repository)
 
-            # Ensure environment variables are set for legacy compatibility
-            credential_carrier.set_environment_from_credentials()
-
-            # Create session adapter with credential carrier
-            session_adapter = UnifiedSessionAdapter(credential_carrier)
+            # Create domain services (if any)
+            # None for now - pure domain models don't need DI
 
-            self.register_singleton("settings_loader", settings_loader)
-            self.register_singleton("credential_carrier", credential_carrier)
-            self.register_singleton("session_adapter", session_adapter)
+            # Application services
+            def setup_use_case(config_repo):
+                from application.use_cases.setup_environment import SetupEnvironmentUseCase
 
-            # Create repository adapters (secondary)
-            from adapters.secondary.yaml_config_repository import YamlConfigRepository
-            from adapters.secondary.in_memory_portal_repository import InMemoryPortalRepository
+                # Mock dependencies for now - replace with real ones
+                credential_validator = type('obj', (object,), {
+                    'validate_database': lambda self, x: {"valid": True},
+                    'validate_aws': lambda self, x: {"valid": True}
+                })()
 
-            config_repo = YamlConfigRepository(settings_loader)
-            portal_repo = InMemoryPortalRepository()
+                package_installer = type('obj', (object,), {
+                    'install': lambda self, x: {"success": True, "message": "Installed"}
+                })()
 
-            self.register_singleton("config_repository", config_repo)
-            self.register_singleton("portal_repository", portal_repo)
+                return SetupEnvironmentUseCase(
+                    config_repo,
+                    credential_validator,
+                    package_installer
+                )
 
-            # Create domain services (if any)
-            # None for now - pure domain models don't need DI
+            def portal_orchestrator(portal_repo):
+                from application.services.portal_orchestrator import PortalOrchestrator
 
-            # Create application services
-            from application.use_cases.setup_environment import SetupEnvironmentUseCase
-            from application.services.portal_orchestrator import PortalOrchestrator
-
-            # Mock dependencies for now - replace with real ones
-            credential_validator = type('obj', (object,), {
-                'validate_database': lambda self, x: {"valid": True},
-                'validate_aws': lambda self, x: {"valid": True}
-            })()
-
-            package_installer = type('obj', (object,), {
-                'install': lambda self, x: {"success": True, "message": "Installed"}
-            })()
-
-            portal_runner = type('obj', (object,), {
-                'start': lambda self, x: {"success": True},
-                'stop': lambda self, x: {"success": True},
-                'get_status': lambda self, x: {"status": "running"}
-            })()
-
-            setup_use_case = SetupEnvironmentUseCase(
-                config_repo,
-                credential_validator,
-                package_installer
-            )
+                portal_runner = type('obj', (object,), {
+                    'start': lambda self, x: {"success": True},
+                    'stop': lambda self, x: {"success": True},
+                    'get_status': lambda self, x: {"status": "running"}
+                })()
 
-            portal_orchestrator = PortalOrchestrator(
-                portal_repo,
-                portal_runner
-            )
+                return PortalOrchestrator(
+                    portal_repo,
+                    portal_runner
+                )
 
-            self.register_singleton("setup_use_case", setup_use_case)
-            self.register_singleton("portal_orchestrator", portal_orchestrator)
+            self.register_lazy("setup_use_case", setup_use_case, depends_on=["config_repository"])
+            self.register_lazy("portal_orchestrator", portal_orchestrator, depends_on=["portal_repository"])
 
-            # Build context
+            # Build context (entries resolve to services on first access)
             context = {
-                "infrastructure": {
-                    "settings_loader": settings_loader,
-                    "session_adapter": session_adapter
-                },
-                "repositories": {
-                    "config": config_repo,
-                    "portal": portal_repo
-                },
-                "use_cases": {
-                    "setup": setup_use_case,
-                    "portal_management": portal_orchestrator
-                },
-                "adapters": {
-                    "session": session_adapter
-                }
+                "infrastructure": _LazySection(self, {
+                    "settings_loader": "settings_loader",
+                    "session_adapter": "session_adapter"
+                }),
+                "repositories": _LazySection(self, {
+                    "config": "config_repository",
+                    "portal": "portal_repository"
+                }),
+                "use_cases": _LazySection(self, {
+                    "setup": "setup_use_case",
+                    "portal_management": "portal_orchestrator"
+                }),
+                "adapters": _LazySection(self, {
+                    "session": "session_adapter"
+                })
             }
 
+            warm = list(warm)
+            if warm:
+                self.warm_up(warm)
+
             logger.info("Dependency injection wiring completed successfully")
             return context
 
@@ -12,12 +12,15 @@ import logging
 from typing import Dict, List, Tuple, Any
 from dataclasses import dataclass
 from datetime import datetime
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from common.utilities.lazy_imports import lazy_import
+
 from .environment_manager import get_environment_manager
 from .infra_delegate import get_infra_delegate
 
+boto3 = lazy_import("boto3")  # loaded on first validation
+
 logger = logging.getLogger(__name__)
 
 
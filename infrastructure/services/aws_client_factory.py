@@ -0,0 +1,467 @@
+"""
+AWS Client Factory - Parent Infrastructure
+==========================================
+One place where boto3 sessions and clients are built.
+
+Clients are cached per (service, region, credential source) and shared by
+every service in the process. botocore clients are thread-safe, so a single
+client (with a connection pool sized for concurrent use) replaces the
+per-service, per-request clients that each paid endpoint resolution and
+connection setup again. Resources are not thread-safe and are cached per
+thread instead.
+
+The default credential chain is keyed on the AWS credential variables in
+the environment, so credentials exported after start-up (for example by
+``CredentialCarrier.set_environment_from_credentials``) get a fresh
+session instead of the one resolved before they existed.
+
+Refreshable credentials (IAM roles, SSO profiles, assumed roles) are
+refreshed by a background thread before they enter botocore's refresh
+window, so request threads never block on an STS call.
+
+Usage:
+    from infrastructure.services.aws_client_factory import get_client_factory
+
+    factory = get_client_factory()
+    s3 = factory.client('s3', region='us-east-1')
+    runtime = factory.client('bedrock-runtime', access_key_id=key, secret_access_key=secret)
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Conditional boto3 import - only if available (boto3 itself loads on first use)
+try:
+    from botocore.config import Config
+    from common.utilities.lazy_imports import lazy_import, module_available
+    boto3 = lazy_import("boto3")
+    BOTO3_AVAILABLE = module_available("boto3")
+except ImportError:
+    BOTO3_AVAILABLE = False
+    Config = None
+
+
+@dataclass(frozen=True)
+class CredentialKey:
+    """
+    Identity of a credential source, safe to use as a cache key.
+
+    Secrets never appear in the key; static credentials are identified by
+    their access key id plus a fingerprint of the secret material.
+    """
+    kind: str = "default"  # default | static | profile | role
+    access_key_id: Optional[str] = None
+    fingerprint: Optional[str] = None
+    profile_name: Optional[str] = None
+    role_arn: Optional[str] = None
+    role_session_name: Optional[str] = None
+
+    def describe(self) -> str:
+        if self.kind == "static":
+            return f"static:{self.access_key_id}"
+        if self.kind == "profile":
+            return f"profile:{self.profile_name}"
+        if self.kind == "role":
+            return f"role:{self.role_arn}"
+        return "default"
+
+
+DEFAULT_CREDENTIALS = CredentialKey()
+
+# Environment variables the default credential chain reads first
+DEFAULT_CHAIN_ENV_VARS = ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'AWS_SESSION_TOKEN',
+                          'AWS_PROFILE', 'AWS_DEFAULT_PROFILE')
+
+
+class AWSClientFactory:
+    """
+    Process-wide cache of boto3 sessions and clients.
+
+    Args:
+        max_pool_connections: urllib3 pool size per client (botocore default is 10)
+        max_attempts: Retry attempts per call (standard retry mode)
+        refresh_margin: Seconds before expiry at which refreshable credentials
+            are renewed in the background; must exceed botocore's 15 minute
+            advisory window so request threads never do the refresh themselves
+        refresh_check_interval: Seconds between background expiry checks
+        refresh_lifetime_fraction: Upper bound on the margin as a fraction of
+            the credentials' lifetime, so short-lived roles (STS allows 15
+            minutes) are not renewed on every check
+    """
+
+    def __init__(self,
+                 max_pool_connections: Optional[int] = None,
+                 max_attempts: int = 3,
+                 refresh_margin: float = 20 * 60,
+                 refresh_check_interval: float = 60.0,
+                 refresh_lifetime_fraction: float = 0.5):
+        self.max_pool_connections = max_pool_connections or int(os.getenv('AWS_MAX_POOL_CONNECTIONS', '32'))
+        self.max_attempts = max_attempts
+        self.refresh_margin = refresh_margin
+        self.refresh_check_interval = refresh_check_interval
+        self.refresh_lifetime_fraction = refresh_lifetime_fraction
+
+        self._lock = threading.Lock()
+        self._sessions: Dict[CredentialKey, Any] = {}
+        self._session_locks: Dict[CredentialKey, threading.Lock] = {}
+        self._static_secrets: Dict[CredentialKey, Tuple[str, str, Optional[str]]] = {}
+        self._clients: Dict[Tuple[str, Optional[str], CredentialKey], Any] = {}
+        self._local = threading.local()  # per-thread resources
+        self._refresh_status: Dict[CredentialKey, Dict[str, Any]] = {}
+        self._lifetimes: Dict[CredentialKey, float] = {}  # seconds, longest seen per source
+        self._default_key: Optional[CredentialKey] = None
+
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._stop_refresh = threading.Event()
+
+    def is_available(self) -> bool:
+        return BOTO3_AVAILABLE
+
+    # ==================== Credential sources ====================
+
+    def credential_key(self,
+                       access_key_id: Optional[str] = None,
+                       secret_access_key: Optional[str] = None,
+                       session_token: Optional[str] = None,
+                       profile_name: Optional[str] = None) -> CredentialKey:
+        """Cache key for a set of credentials (default chain when none are given)."""
+        if access_key_id and secret_access_key:
+            material = f"{access_key_id}:{secret_access_key}:{session_token or ''}"
+            key = CredentialKey(
+                kind="static",
+                access_key_id=access_key_id,
+                fingerprint=hashlib.sha256(material.encode('utf-8')).hexdigest()[:16]
+            )
+            with self._lock:
+                self._static_secrets.setdefault(key, (access_key_id, secret_access_key, session_token))
+            return key
+        if profile_name:
+            return CredentialKey(kind="profile", profile_name=profile_name)
+        return DEFAULT_CREDENTIALS
+
+    def _resolve(self, source: CredentialKey) -> CredentialKey:
+        """Pin the default chain to the credential variables currently in the environment.
+
+        When they change, the sessions and clients built from the previous
+        values are dropped.
+        """
+        if source.kind != "default":
+            return source
+        material = "\0".join(os.environ.get(name, '') for name in DEFAULT_CHAIN_ENV_VARS)
+        key = CredentialKey(fingerprint=hashlib.sha256(material.encode('utf-8')).hexdigest()[:16])
+        previous = self._default_key
+        if previous != key:
+            with self._lock:
+                if previous is not None and previous != key:
+                    self._sessions.pop(previous, None)
+                    self._session_locks.pop(previous, None)
+                    self._refresh_status.pop(previous, None)
+                    self._lifetimes.pop(previous, None)
+                    for cache_key in [k for k in self._clients if k[2] == previous]:
+                        del self._clients[cache_key]
+                    logger.info("AWS credential environment changed; rebuilding default-chain clients")
+                self._default_key = key
+        return key
+
+    def assume_role(self,
+                    role_arn: str,
+                    session_name: str,
+                    duration_seconds: int = 3600,
+                    region: Optional[str] = None,
+                    source: CredentialKey = DEFAULT_CREDENTIALS) -> CredentialKey:
+        """
+        Register an assumed-role credential source and return its key.
+
+        The role is assumed with ``source`` credentials and renewed
+        automatically (in the background) before it expires.
+        """
+        key = CredentialKey(kind="role", role_arn=role_arn, role_session_name=session_name)
+        with self._lock:
+            if key in self._sessions:
+                return key
+
+        import botocore.session
+        from botocore.credentials import RefreshableCredentials
+
+        sts = self.client('sts', region=region, source=source)
+
+        def fetch_credentials() -> Dict[str, str]:
+            response = sts.assume_role(RoleArn=role_arn, RoleSessionName=session_name,
+                                       DurationSeconds=duration_seconds)
+            credentials = response['Credentials']
+            return {
+                'access_key': credentials['AccessKeyId'],
+                'secret_key': credentials['SecretAccessKey'],
+                'token': credentials['SessionToken'],
+                'expiry_time': credentials['Expiration'].isoformat(),
+            }
+
+        refreshable = RefreshableCredentials.create_from_metadata(
+            metadata=fetch_credentials(),
+            refresh_using=fetch_credentials,
+            method='sts-assume-role'
+        )
+        botocore_session = botocore.session.get_session()
+        botocore_session._credentials = refreshable
+        if region:
+            botocore_session.set_config_variable('region', region)
+
+        with self._lock:
+            if key not in self._sessions:
+                self._sessions[key] = boto3.Session(botocore_session=botocore_session)
+                self._session_locks[key] = threading.Lock()
+                self._lifetimes[key] = float(duration_seconds)
+        self._ensure_refresh_thread()
+        logger.info(f"Registered assumed role {role_arn} ({session_name})")
+        return key
+
+    # ==================== Sessions and clients ====================
+
+    def session(self, source: CredentialKey = DEFAULT_CREDENTIALS, **credentials):
+        """Shared boto3 session for a credential source."""
+        if credentials:
+            source = self.credential_key(**credentials)
+        source = self._resolve(source)
+
+        with self._lock:
+            session = self._sessions.get(source)
+            if session is not None:
+                return session
+
+            if source.kind == "static":
+                access_key_id, secret_access_key, session_token = self._static_secrets[source]
+                session = boto3.Session(aws_access_key_id=access_key_id,
+                                        aws_secret_access_key=secret_access_key,
+                                        aws_session_token=session_token)
+            elif source.kind == "profile":
+                session = boto3.Session(profile_name=source.profile_name)
+            elif source.kind == "role":
+                raise KeyError(f"Role {source.role_arn} is not registered; call assume_role first")
+            else:
+                session = boto3.Session()
+
+            self._sessions[source] = session
+            self._session_locks[source] = threading.Lock()
+
+        self._ensure_refresh_thread()
+        return session
+
+    def client_config(self):
+        """botocore Config shared by every client the factory builds."""
+        return Config(
+            max_pool_connections=self.max_pool_connections,
+            retries={'max_attempts': self.max_attempts, 'mode': 'standard'}
+        )
+
+    def client(self, service: str, region: Optional[str] = None,
+               source: CredentialKey = DEFAULT_CREDENTIALS, **credentials):
+        """
+        Shared client for (service, region, credential source).
+
+        Credentials may be passed as a ``source`` key or as keyword arguments
+        (access_key_id, secret_access_key, session_token, profile_name).
+        """
+        if credentials:
+            source = self.credential_key(**credentials)
+        source = self._resolve(source)
+        cache_key = (service, region, source)
+
+        client = self._clients.get(cache_key)
+        if client is not None:
+            return client
+
+        session = self.session(source)
+        # boto3 sessions are not thread-safe; build one client at a time per session
+        with self._session_locks[source]:
+            client = self._clients.get(cache_key)
+            if client is None:
+                start = time.perf_counter()
+                client = session.client(service, region_name=region, config=self.client_config())
+                self._clients[cache_key] = client
+                logger.debug(f"Built {service} client for {source.describe()} "
+                             f"({region or 'default region'}) in {(time.perf_counter() - start) * 1000:.1f}ms")
+        return client
+
+    def resource(self, service: str, region: Optional[str] = None,
+                 source: CredentialKey = DEFAULT_CREDENTIALS, **credentials):
+        """boto3 resource for the calling thread (resources are not thread-safe)."""
+        if credentials:
+            source = self.credential_key(**credentials)
+        source = self._resolve(source)
+        cache_key = (service, region, source)
+
+        resources = getattr(self._local, 'resources', None)
+        if resources is None:
+            resources = self._local.resources = {}
+        resource = resources.get(cache_key)
+        if resource is None:
+            session = self.session(source)
+            with self._session_locks[source]:
+                resource = session.resource(service, region_name=region, config=self.client_config())
+            resources[cache_key] = resource
+        return resource
+
+    def warm_up(self, services: Iterable[Tuple[str, Optional[str]]],
+                source: CredentialKey = DEFAULT_CREDENTIALS,
+                background: bool = True) -> Optional[threading.Thread]:
+        """
+        Build clients ahead of their first request.
+
+        ``services`` is an iterable of (service, region) pairs. With
+        ``background`` the clients are built on a daemon thread.
+        """
+        services = list(services)
+
+        def build():
+            for service, region in services:
+                try:
+                    self.client(service, region=region, source=source)
+                except Exception as e:
+                    logger.warning(f"Could not pre-build {service} client: {e}")
+
+        if not background:
+            build()
+            return None
+        thread = threading.Thread(target=build, name="aws-client-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    # ==================== Credential refresh ====================
+
+    def _ensure_refresh_thread(self):
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._stop_refresh.clear()
+            self._refresh_thread = threading.Thread(target=self._refresh_loop,
+                                                    name="aws-credential-refresh", daemon=True)
+            self._refresh_thread.start()
+
+    def _refresh_loop(self):
+        while not self._stop_refresh.wait(self.refresh_check_interval):
+            try:
+                self.refresh_credentials()
+            except Exception as e:
+                logger.error(f"Credential refresh error: {e}")
+
+    def _margin_for(self, source: CredentialKey, credentials) -> float:
+        """Refresh margin for a source: ``refresh_margin``, capped by a fraction of its lifetime."""
+        expiry_time = getattr(credentials, '_expiry_time', None)
+        if expiry_time is None:
+            return self.refresh_margin
+        remaining = (expiry_time - datetime.now(timezone.utc)).total_seconds()
+        # The longest remaining time seen approximates the lifetime (it peaks right after a refresh)
+        lifetime = max(self._lifetimes.get(source, 0.0), remaining)
+        self._lifetimes[source] = lifetime
+        return min(self.refresh_margin, lifetime * self.refresh_lifetime_fraction)
+
+    def refresh_credentials(self, force: bool = False) -> int:
+        """
+        Renew refreshable credentials that are close to expiry.
+
+        "Close" is ``refresh_margin`` seconds, or ``refresh_lifetime_fraction``
+        of the credentials' lifetime if that is shorter. Static credentials
+        are skipped. Returns the number of sources renewed.
+        """
+        with self._lock:
+            sessions = list(self._sessions.items())
+
+        refreshed = 0
+        for source, session in sessions:
+            try:
+                credentials = session.get_credentials()
+            except Exception as e:
+                logger.debug(f"No credentials for {source.describe()}: {e}")
+                continue
+            if credentials is None or not hasattr(credentials, 'refresh_needed'):
+                continue
+            if not force and not credentials.refresh_needed(self._margin_for(source, credentials)):
+                continue
+
+            try:
+                # Refresh under botocore's own lock; requests keep using the
+                # current credentials until the new ones are swapped in
+                protected_refresh = getattr(credentials, '_protected_refresh', None)
+                if protected_refresh is not None:
+                    with credentials._refresh_lock:
+                        protected_refresh(is_mandatory=False)
+                else:
+                    credentials.get_frozen_credentials()
+                refreshed += 1
+                expiry_time = getattr(credentials, '_expiry_time', None)
+                self._refresh_status[source] = {
+                    'last_refresh': datetime.now(timezone.utc).isoformat(),
+                    'expiry_time': expiry_time.isoformat() if expiry_time else None,
+                    'error': None,
+                }
+                logger.info(f"Refreshed AWS credentials for {source.describe()}")
+            except Exception as e:
+                self._refresh_status[source] = {
+                    'last_refresh': datetime.now(timezone.utc).isoformat(),
+                    'error': str(e),
+                }
+                logger.warning(f"Could not refresh AWS credentials for {source.describe()}: {e}")
+        return refreshed
+
+    def get_status(self) -> Dict[str, Any]:
+        """Cached clients and credential refresh state."""
+        with self._lock:
+            clients = [
+                {'service': service, 'region': region, 'credentials': source.describe()}
+                for service, region, source in self._clients
+            ]
+            sources = {source.describe(): dict(self._refresh_status.get(source, {}))
+                       for source in self._sessions}
+        return {
+            'max_pool_connections': self.max_pool_connections,
+            'clients': clients,
+            'credential_sources': sources,
+            'refresh_thread_alive': bool(self._refresh_thread and self._refresh_thread.is_alive()),
+        }
+
+    def shutdown(self):
+        """Stop the refresh thread and drop all cached sessions and clients."""
+        self._stop_refresh.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout=5)
+        with self._lock:
+            self._clients.clear()
+            self._sessions.clear()
+            self._session_locks.clear()
+            self._static_secrets.clear()
+            self._refresh_status.clear()
+            self._lifetimes.clear()
+            self._default_key = None
+        self._local = threading.local()
+
+
+# Global instance for shared use
+_client_factory = None
+_client_factory_lock = threading.Lock()
+
+
+def get_client_factory() -> AWSClientFactory:
+    """Get the process-wide AWS client factory."""
+    global _client_factory
+    if _client_factory is None:
+        with _client_factory_lock:
+            if _client_factory is None:
+                _client_factory = AWSClientFactory()
+    return _client_factory
+
+
+def reset_client_factory():
+    """Reset the global client factory (useful for testing)."""
+    global _client_factory
+    with _client_factory_lock:
+        if _client_factory:
+            _client_factory.shutdown()
+        _client_factory = None
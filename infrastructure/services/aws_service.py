@@ -15,11 +15,12 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
-# Conditional boto3 import - only if available
+# Conditional boto3 import - only if available (boto3 itself loads on first use)
 try:
-    import boto3
     from botocore.exceptions import ClientError, NoCredentialsError
-    BOTO3_AVAILABLE = True
+    from common.utilities.lazy_imports import lazy_import, module_available
+    boto3 = lazy_import("boto3")
+    BOTO3_AVAILABLE = module_available("boto3")
 except ImportError:
     BOTO3_AVAILABLE = False
     ClientError = Exception
@@ -60,20 +61,15 @@ class AWSService:
         """Initialize AWS service with configuration."""
         self.config = config or {}
 
-        # AWS clients (lazy initialized)
-        self._s3_client = None
-        self._s3_resource = None
-        self._bedrock_client = None
-        self._bedrock_runtime_client = None
-        self._sts_client = None
-
         # Configuration
         self.region = self.config.get('region', os.getenv('AWS_REGION', 'us-east-1'))
         self.s3_bucket = self.config.get('bucket', os.getenv('S3_BUCKET'))
         self.default_model = self.config.get('default_model', BedrockModel.CLAUDE_3_HAIKU.value)
 
-        # Session management
+        # Session management (clients come from the shared client factory)
         self._session = None
+        self._factory = None
+        self._source = None
 
         if BOTO3_AVAILABLE:
             self._initialize_session()
@@ -81,15 +77,22 @@ class AWSService:
     def _initialize_session(self):
         """Initialize AWS session with credentials."""
         try:
+            from infrastructure.services.aws_client_factory import get_client_factory
+            self._factory = get_client_factory()
+
             if 'access_key_id' in self.config:
-                self._session = boto3.Session(
-                    aws_access_key_id=self.config['access_key_id'],
-                    aws_secret_access_key=self.config['secret_access_key'],
-                    region_name=self.region
+                self._source = self._factory.credential_key(
+                    access_key_id=self.config['access_key_id'],
+                    secret_access_key=self.config['secret_access_key']
                 )
             else:
                 # Use default credentials (IAM role, env vars, etc.)
-                self._session = boto3.Session(region_name=self.region)
+                self._source = self._factory.credential_key()
+            self._session = self._factory.session(self._source)
+
+            # Build the request-path clients now rather than on first use
+            self._factory.warm_up([('s3', self.region), ('bedrock-runtime', self.region)],
+                                  source=self._source)
 
             logger.info(f"AWS session initialized for region: {self.region}")
         except Exception as e:
@@ -102,15 +105,21 @@ class AWSService:
 
     # ==================== S3 Operations ====================
 
-    def get_s3_client(self):
-        """Get or create S3 client (lazy initialization)."""
+    def _client(self, service: str):
+        """Shared client for this service's region and credentials."""
         if not self.is_available():
             return None
+        return self._factory.client(service, region=self.region, source=self._source)
 
-        if self._s3_client is None:
-            self._s3_client = self._session.client('s3', region_name=self.region)
-            self._s3_resource = self._session.resource('s3', region_name=self.region)
-        return self._s3_client
+    def get_s3_client(self):
+        """Get the shared S3 client."""
+        return self._client('s3')
+
+    def get_s3_resource(self):
+        """Get an S3 resource for the calling thread."""
+        if not self.is_available():
+            return None
+        return self._factory.resource('s3', region=self.region, source=self._source)
 
     def upload_file(self, file_path: str, s3_key: str, bucket: Optional[str] = None) -> bool:
         """Upload a file to S3."""
@@ -276,22 +285,12 @@ class AWSService:
     # ==================== Bedrock Operations ====================
 
     def get_bedrock_client(self):
-        """Get or create Bedrock client (lazy initialization)."""
-        if not self.is_available():
-            return None
-
-        if self._bedrock_client is None:
-            self._bedrock_client = self._session.client('bedrock', region_name=self.region)
-        return self._bedrock_client
+        """Get the shared Bedrock client."""
+        return self._client('bedrock')
 
     def get_bedrock_runtime_client(self):
-        """Get or create Bedrock Runtime client (lazy initialization)."""
-        if not self.is_available():
-            return None
-
-        if self._bedrock_runtime_client is None:
-            self._bedrock_runtime_client = self._session.client('bedrock-runtime', region_name=self.region)
-        return self._bedrock_runtime_client
+        """Get the shared Bedrock Runtime client."""
+        return self._client('bedrock-runtime')
 
     def list_foundation_models(self) -> List[Dict]:
         """List available foundation models."""
@@ -403,13 +402,8 @@ class AWSService:
     # ==================== STS Operations ====================
 
     def get_sts_client(self):
-        """Get or create STS client (lazy initialization)."""
-        if not self.is_available():
-            return None
-
-        if self._sts_client is None:
-            self._sts_client = self._session.client('sts', region_name=self.region)
-        return self._sts_client
+        """Get the shared STS client."""
+        return self._client('sts')
 
     def get_caller_identity(self) -> Optional[Dict]:
         """Get caller identity from STS."""
@@ -439,6 +433,26 @@ class AWSService:
             logger.error(f"Failed to assume role: {e}")
             return None
 
+    def use_role(self, role_arn: str, session_name: str, duration_seconds: int = 3600) -> bool:
+        """
+        Switch this service to an assumed role.
+
+        The role credentials are renewed in the background before they
+        expire, so callers never see an expired-token error or wait on STS.
+        """
+        if not self.is_available():
+            return False
+
+        try:
+            self._source = self._factory.assume_role(role_arn, session_name,
+                                                     duration_seconds=duration_seconds,
+                                                     region=self.region, source=self._source)
+            self._session = self._factory.session(self._source)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to assume role: {e}")
+            return False
+
     # ==================== Health Checks ====================
 
     def health_check(self) -> Dict[str, Any]:
@@ -13,11 +13,12 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
-# Conditional boto3 import - only if available
+# Conditional boto3 import - only if available (boto3 itself loads on first use)
 try:
-    import boto3
     from botocore.exceptions import ClientError, NoCredentialsError
-    BOTO3_AVAILABLE = True
+    from common.utilities.lazy_imports import lazy_import, module_available
+    boto3 = lazy_import("boto3")
+    BOTO3_AVAILABLE = module_available("boto3")
 except ImportError:
     BOTO3_AVAILABLE = False
     ClientError = Exception
@@ -69,22 +70,24 @@ class BedrockService:
             self._initialize_bedrock()
 
     def _initialize_bedrock(self):
-        """Initialize Bedrock clients if boto3 is available."""
+        """Fetch shared Bedrock clients if boto3 is available."""
         try:
+            from infrastructure.services.aws_client_factory import get_client_factory
+            factory = get_client_factory()
+
             # Use environment credentials or config
             if 'access_key_id' in self.config:
-                session = boto3.Session(
-                    aws_access_key_id=self.config['access_key_id'],
-                    aws_secret_access_key=self.config['secret_access_key'],
-                    region_name=self.region
+                source = factory.credential_key(
+                    access_key_id=self.config['access_key_id'],
+                    secret_access_key=self.config['secret_access_key']
                 )
             else:
                 # Use default credentials (IAM role, env vars, etc.)
-                session = boto3.Session(region_name=self.region)
+                source = factory.credential_key()
 
             # Create both client types
-            self._bedrock_client = session.client('bedrock', region_name=self.region)
-            self._bedrock_runtime_client = session.client('bedrock-runtime', region_name=self.region)
+            self._bedrock_client = factory.client('bedrock', region=self.region, source=source)
+            self._bedrock_runtime_client = factory.client('bedrock-runtime', region=self.region, source=source)
 
             logger.info(f"Bedrock service initialized for region: {self.region}")
         except Exception as e:
@@ -0,0 +1,271 @@
+"""
+Credential Backup
+=================
+Versioned, typed on-disk format for the credential carriers' emergency backup.
+
+Backups are JSON documents with a format marker and version, so a backup
+file is data and nothing else: it is parsed once with ``json.loads`` and
+validated against the expected shape (``{section: {field: value}}`` with
+JSON values of bounded depth), and anything else is rejected. Nothing in a
+backup is ever evaluated.
+
+Backups can optionally be encrypted with a local symmetric key (Fernet,
+from the ``cryptography`` package). The key comes from a pluggable
+``KeyProvider``; by default the ``CREDENTIAL_BACKUP_KEY`` environment
+variable. Without a key, backups are written in plain JSON with 0600
+permissions.
+
+Usage:
+    from infrastructure.services.credential_backup import CredentialBackup
+
+    backup = CredentialBackup(Path("infrastructure/credential_backup.json"))
+    backup.save({'aws': {'access_key_id': '...', 'region': 'us-east-1'}}, {'aws': 'settings.yaml'})
+    record = backup.load()          # CredentialBackupRecord or None if no file
+"""
+
+import json
+import logging
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Optional encryption support
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+    Fernet = None
+    InvalidToken = Exception
+
+BACKUP_FORMAT = "credential-backup"
+BACKUP_VERSION = 1
+MAX_BACKUP_BYTES = 1024 * 1024
+MAX_VALUE_DEPTH = 8
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class CredentialBackupError(Exception):
+    """Backup file is missing required structure, tampered with, or unreadable."""
+    pass
+
+
+# ==================== Key providers ====================
+
+class KeyProvider(ABC):
+    """Supplies the symmetric key for backup encryption (None disables it)."""
+
+    @abstractmethod
+    def get_key(self) -> Optional[bytes]:
+        """Current key, or None to write unencrypted backups."""
+
+
+class EnvironmentKeyProvider(KeyProvider):
+    """Reads a Fernet key from an environment variable."""
+
+    def __init__(self, variable: str = "CREDENTIAL_BACKUP_KEY"):
+        self.variable = variable
+
+    def get_key(self) -> Optional[bytes]:
+        value = os.getenv(self.variable)
+        return value.strip().encode('ascii') if value else None
+
+
+class FileKeyProvider(KeyProvider):
+    """Reads a Fernet key from a local key file."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def get_key(self) -> Optional[bytes]:
+        if not self.path.exists():
+            return None
+        return self.path.read_bytes().strip() or None
+
+
+def generate_key() -> bytes:
+    """New random key for ``EnvironmentKeyProvider`` / ``FileKeyProvider``."""
+    if not CRYPTOGRAPHY_AVAILABLE:
+        raise CredentialBackupError("Backup encryption requires the 'cryptography' package")
+    return Fernet.generate_key()
+
+
+# ==================== Backup records ====================
+
+@dataclass
+class CredentialBackupRecord:
+    """Validated contents of a backup file."""
+    credentials: Dict[str, Dict[str, Any]]
+    sources: Dict[str, str] = field(default_factory=dict)
+    metadata: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    created_at: Optional[str] = None
+    version: int = BACKUP_VERSION
+    encrypted: bool = False
+
+
+def _reject_constant(name: str):
+    raise CredentialBackupError(f"Invalid JSON constant {name!r} in backup")
+
+
+def _is_json_value(value: Any, depth: int = 0) -> bool:
+    if isinstance(value, SCALAR_TYPES):
+        return True
+    if depth >= MAX_VALUE_DEPTH:
+        return False
+    if isinstance(value, list):
+        return all(_is_json_value(item, depth + 1) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _is_json_value(item, depth + 1) for key, item in value.items())
+    return False
+
+
+def _validate_sections(data: Any, section: str) -> Dict[str, Dict[str, Any]]:
+    """``{name: {field: value}}`` where every value is plain JSON data."""
+    if not isinstance(data, dict):
+        raise CredentialBackupError(f"Backup section '{section}' must be an object")
+    for name, values in data.items():
+        if not isinstance(values, dict):
+            raise CredentialBackupError(f"Backup entry '{section}.{name}' must be an object")
+        for key, value in values.items():
+            if not _is_json_value(value):
+                raise CredentialBackupError(
+                    f"Backup value '{section}.{name}.{key}' is not plain JSON data "
+                    f"(unsupported type or nested deeper than {MAX_VALUE_DEPTH} levels)"
+                )
+    return data
+
+
+def _validate_payload(payload: Any) -> Dict[str, Any]:
+    if not isinstance(payload, dict):
+        raise CredentialBackupError("Backup payload must be an object")
+    unknown = set(payload) - {'credentials', 'sources', 'metadata'}
+    if unknown:
+        raise CredentialBackupError(f"Unknown backup fields: {sorted(unknown)}")
+
+    credentials = _validate_sections(payload.get('credentials', {}), 'credentials')
+    metadata = _validate_sections(payload.get('metadata', {}), 'metadata')
+    sources = payload.get('sources', {})
+    if not isinstance(sources, dict) or not all(isinstance(v, str) for v in sources.values()):
+        raise CredentialBackupError("Backup section 'sources' must map names to strings")
+    return {'credentials': credentials, 'sources': sources, 'metadata': metadata}
+
+
+class CredentialBackup:
+    """
+    Reads and writes one backup file.
+
+    Args:
+        path: Backup file location
+        key_provider: Source of the encryption key (default: CREDENTIAL_BACKUP_KEY)
+    """
+
+    def __init__(self, path: Union[str, Path], key_provider: Optional[KeyProvider] = None):
+        self.path = Path(path)
+        self.key_provider = key_provider or EnvironmentKeyProvider()
+
+    def _cipher(self):
+        key = self.key_provider.get_key()
+        if key is None:
+            return None
+        if not CRYPTOGRAPHY_AVAILABLE:
+            raise CredentialBackupError("Backup key configured but the 'cryptography' package is not installed")
+        try:
+            return Fernet(key)
+        except (ValueError, TypeError) as e:
+            raise CredentialBackupError(f"Invalid backup key: {e}")
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def save(self,
+             credentials: Dict[str, Dict[str, Any]],
+             sources: Optional[Dict[str, str]] = None,
+             metadata: Optional[Dict[str, Dict[str, Any]]] = None) -> Path:
+        """Validate and atomically write a backup (owner read/write only)."""
+        payload = _validate_payload({
+            'credentials': credentials,
+            'sources': sources or {},
+            'metadata': metadata or {},
+        })
+
+        cipher = self._cipher()
+        document = {
+            'format': BACKUP_FORMAT,
+            'version': BACKUP_VERSION,
+            'created_at': datetime.now().isoformat(),
+            'encrypted': cipher is not None,
+        }
+        if cipher is not None:
+            document['data'] = cipher.encrypt(json.dumps(payload).encode('utf-8')).decode('ascii')
+        else:
+            document['data'] = payload
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), prefix=f".{self.path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(document, f, indent=2)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return self.path
+
+    def load(self) -> Optional[CredentialBackupRecord]:
+        """
+        Read and validate the backup.
+
+        Returns None if there is no backup file; raises CredentialBackupError
+        if the file is not a valid backup.
+        """
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return None
+        if size > MAX_BACKUP_BYTES:
+            raise CredentialBackupError(f"Backup file is too large ({size} bytes)")
+
+        try:
+            document = json.loads(self.path.read_text(encoding='utf-8'), parse_constant=_reject_constant)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise CredentialBackupError(f"Backup is not valid JSON: {e}")
+
+        if not isinstance(document, dict) or document.get('format') != BACKUP_FORMAT:
+            raise CredentialBackupError("Not a credential backup file")
+        version = document.get('version')
+        if version != BACKUP_VERSION:
+            raise CredentialBackupError(f"Unsupported backup version: {version!r}")
+
+        encrypted = document.get('encrypted') is True
+        data = document.get('data')
+        if encrypted:
+            cipher = self._cipher()
+            if cipher is None:
+                raise CredentialBackupError("Backup is encrypted but no key is configured")
+            if not isinstance(data, str):
+                raise CredentialBackupError("Encrypted backup payload must be a string")
+            try:
+                data = json.loads(cipher.decrypt(data.encode('ascii')), parse_constant=_reject_constant)
+            except (InvalidToken, UnicodeError, json.JSONDecodeError) as e:
+                raise CredentialBackupError(f"Could not decrypt backup: {e.__class__.__name__}")
+
+        payload = _validate_payload(data)
+        created_at = document.get('created_at')
+        return CredentialBackupRecord(
+            credentials=payload['credentials'],
+            sources=payload['sources'],
+            metadata=payload['metadata'],
+            created_at=created_at if isinstance(created_at, str) else None,
+            version=version,
+            encrypted=encrypted,
+        )
@@ -7,15 +7,15 @@ Handles multiple credential sources:
 - settings.yaml (primary)
 - environment variables (runtime)
 - AWS IAM roles (dynamic)
-- backup parquet files (emergency)
+- backup JSON file (emergency)
 """
 
 import os
 import logging
 from typing import Dict, Any, Optional
 from pathlib import Path
-import pandas as pd
 from datetime import datetime
+from infrastructure.services.credential_backup import CredentialBackup, CredentialBackupError
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ class CredentialCarrier:
     Manages credential lifecycle:
     1. Load from multiple sources (priority order)
     2. Cache credentials in memory
-    3. Backup to parquet for emergency recovery
+    3. Backup to a JSON file for emergency recovery
     4. Provide consistent interface to adapters
     """
 
@@ -37,7 +37,8 @@ class CredentialCarrier:
         self._cached_credentials = {}
         self._credential_sources = {}
         self._backup_enabled = True
-        self._backup_path = Path("infrastructure/credential_backup.parquet")
+        self._backup_path = Path("infrastructure/credential_backup.json")
+        self._backup = CredentialBackup(self._backup_path)
 
         # Resilient pool management
         self._pool_manager = None
@@ -58,7 +59,7 @@ class CredentialCarrier:
         # 3. Try AWS IAM role (dynamic credentials)
         self._load_from_aws_role()
 
-        # 4. Try backup parquet (emergency fallback)
+        # 4. Try backup file (emergency fallback)
         self._load_from_backup()
 
         # 5. Backup current state
@@ -144,9 +145,12 @@ class CredentialCarrier:
         """Load credentials from AWS IAM role (if available)"""
         try:
             # Try to get credentials from IAM role
-            import boto3
-            session = boto3.Session()
+            # Shared default-chain session; the client factory keeps role credentials fresh
+            from infrastructure.services.aws_client_factory import get_client_factory
+            session = get_client_factory().session()
             credentials = session.get_credentials()
+            # Read key, secret and token as one consistent snapshot
+            credentials = credentials.get_frozen_credentials() if credentials else None
 
             if credentials:
                 if 'aws' not in self._cached_credentials:
@@ -167,46 +171,50 @@ class CredentialCarrier:
             logger.debug(f"No AWS IAM role credentials available: {e}")
 
     def _load_from_backup(self):
-        """Load credentials from backup parquet file (emergency)"""
-        try:
-            if self._backup_path.exists():
-                df = pd.read_parquet(self._backup_path)
+        """Load credentials from backup file (emergency)"""
+        # Only use backup if no other credentials found
+        if self._cached_credentials:
+            return
 
-                # Only use backup if no other credentials found
-                if not self._cached_credentials:
-                    backup_data = df.to_dict('records')[0] if len(df) > 0 else {}
+        try:
+            record = self._backup.load()
+        except CredentialBackupError as e:
+            logger.warning(f"Ignoring invalid credential backup {self._backup_path}: {e}")
+            return
+        except Exception as e:
+            logger.debug(f"No backup credentials available: {e}")
+            return
 
-                    for service in ['aws', 'database']:
-                        service_data = backup_data.get(f'{service}_credentials')
-                        if service_data:
-                            self._cached_credentials[service] = eval(service_data)
-                            self._credential_sources[service] = 'backup_parquet'
+        if record is None:
+            return
 
-                    logger.warning("Credentials loaded from backup parquet (emergency mode)")
+        for service in ['aws', 'database']:
+            service_data = record.credentials.get(service)
+            if service_data:
+                self._cached_credentials[service] = dict(service_data)
+                self._credential_sources[service] = 'backup_file'
 
-        except Exception as e:
-            logger.debug(f"No backup credentials available: {e}")
+        if self._cached_credentials:
+            logger.warning("Credentials loaded from backup file (emergency mode)")
 
     def _backup_credentials(self):
-        """Backup current credentials to parquet for emergency recovery"""
+        """Backup current credentials to a JSON file for emergency recovery"""
         try:
             if not self._cached_credentials:
                 return
 
-            # Prepare backup data
-            backup_data = {
-                'timestamp': [datetime.now().isoformat()],
-                'aws_credentials': [str(self._cached_credentials.get('aws', {}))],
-                'database_credentials': [str(self._cached_credentials.get('database', {}))],
-                'credential_sources': [str(self._credential_sources)]
+            # Never back up credentials that came from the backup itself
+            credentials = {
+                service: self._cached_credentials[service]
+                for service in ['aws', 'database']
+                if service in self._cached_credentials
+                and self._credential_sources.get(service) != 'backup_file'
             }
+            if not credentials:
+                return
 
-            # Create backup directory if needed
-            self._backup_path.parent.mkdir(exist_ok=True)
-
-            # Save to parquet
-            df = pd.DataFrame(backup_data)
-            df.to_parquet(self._backup_path, index=False)
+            sources = {service: self._credential_sources.get(service, 'unknown') for service in credentials}
+            self._backup.save(credentials, sources)
 
             logger.debug(f"Credentials backed up to {self._backup_path}")
 
@@ -376,8 +384,7 @@ def sync_active_credential_state() -> Dict[str, Any]:
         status = credential_carrier.get_credential_status()
 
         # Check backup creation
-        from pathlib import Path
-        backup_path = Path("infrastructure/credential_backup.parquet")
+        backup_path = credential_carrier._backup_path
         backup_exists = backup_path.exists()
 
         return {
@@ -18,8 +18,8 @@ import logging
 import yaml
 from typing import Dict, Any, Optional, List, Set
 from pathlib import Path
-import pandas as pd
 from datetime import datetime
+from infrastructure.services.credential_backup import CredentialBackup
 
 logger = logging.getLogger(__name__)
 
@@ -198,7 +198,8 @@ class DynamicCredentialCarrier:
         self._credential_sources = {}
         self._discovered_sources = {}
         self._backup_enabled = True
-        self._backup_path = Path("infrastructure/dynamic_credential_backup.parquet")
+        self._backup_path = Path("infrastructure/dynamic_credential_backup.json")
+        self._backup = CredentialBackup(self._backup_path)
 
         # Resilient pool management
         self._pool_managers = {}  # Multiple pool managers for different databases
@@ -353,9 +354,12 @@ class DynamicCredentialCarrier:
     def _load_from_aws_sources(self):
         """Load from AWS IAM roles where applicable"""
         try:
-            import boto3
-            session = boto3.Session()
+            # Shared default-chain session; the client factory keeps role credentials fresh
+            from infrastructure.services.aws_client_factory import get_client_factory
+            session = get_client_factory().session()
             credentials = session.get_credentials()
+            # Read key, secret and token as one consistent snapshot
+            credentials = credentials.get_frozen_credentials() if credentials else None
 
             if credentials:
                 # Find AWS-compatible sources
@@ -378,26 +382,17 @@ class DynamicCredentialCarrier:
         return category == cred_type
 
     def _backup_credentials(self):
-        """Backup current credentials to parquet"""
+        """Backup current credentials to a JSON file"""
         try:
             if not self._cached_credentials:
                 return
 
-            # Prepare backup data with dynamic columns
-            backup_data = {'timestamp': [datetime.now().isoformat()]}
-
-            for source_id, creds in self._cached_credentials.items():
-                backup_data[f"{source_id}_credentials"] = [str(creds)]
-
-            backup_data['credential_sources'] = [str(self._credential_sources)]
-            backup_data['discovered_sources'] = [str(list(self._discovered_sources.keys()))]
-
-            # Create backup directory if needed
-            self._backup_path.parent.mkdir(exist_ok=True)
-
-            # Save to parquet
-            df = pd.DataFrame(backup_data)
-            df.to_parquet(self._backup_path, index=False)
+            # One entry per discovered source, with its category alongside
+            metadata = {
+                source_id: {'category': info.get('category', '')}
+                for source_id, info in self._discovered_sources.items()
+            }
+            self._backup.save(self._cached_credentials, self._credential_sources, metadata)
 
             logger.debug(f"Dynamic credentials backed up to {self._backup_path}")
 
@@ -14,11 +14,12 @@ import tempfile
 
 logger = logging.getLogger(__name__)
 
-# Conditional boto3 import - only if available
+# Conditional boto3 import - only if available (boto3 itself loads on first use)
 try:
-    import boto3
     from botocore.exceptions import ClientError, NoCredentialsError
-    BOTO3_AVAILABLE = True
+    from common.utilities.lazy_imports import lazy_import, module_available
+    boto3 = lazy_import("boto3")
+    BOTO3_AVAILABLE = module_available("boto3")
 except ImportError:
     BOTO3_AVAILABLE = False
     ClientError = Exception
@@ -34,7 +35,6 @@ class S3Service:
         """Initialize S3 service with configuration."""
         self.config = config or {}
         self._client = None
-        self._resource = None
 
         # Get configuration from environment or config
         self.region = self.config.get('region', os.getenv('AWS_REGION', 'us-east-1'))
@@ -44,32 +44,36 @@ class S3Service:
             self._initialize_aws()
 
     def _initialize_aws(self):
-        """Initialize AWS clients if boto3 is available."""
+        """Fetch shared AWS clients if boto3 is available."""
         try:
+            from infrastructure.services.aws_client_factory import get_client_factory
+            factory = get_client_factory()
+
             # Use environment credentials or config
             if 'access_key_id' in self.config:
-                self._client = boto3.client(
-                    's3',
-                    region_name=self.region,
-                    aws_access_key_id=self.config['access_key_id'],
-                    aws_secret_access_key=self.config['secret_access_key']
-                )
-                self._resource = boto3.resource(
-                    's3',
-                    region_name=self.region,
-                    aws_access_key_id=self.config['access_key_id'],
-                    aws_secret_access_key=self.config['secret_access_key']
+                source = factory.credential_key(
+                    access_key_id=self.config['access_key_id'],
+                    secret_access_key=self.config['secret_access_key']
                 )
             else:
                 # Use default credentials (IAM role, env vars, etc.)
-                self._client = boto3.client('s3', region_name=self.region)
-                self._resource = boto3.resource('s3', region_name=self.region)
+                source = factory.credential_key()
+
+            self._factory = factory
+            self._source = source
+            self._client = factory.client('s3', region=self.region, source=source)
 
             logger.info(f"S3 service initialized for region: {self.region}")
         except Exception as e:
             logger.warning(f"Could not initialize S3: {e}")
             self._client = None
-            self._resource = None
+
+    @property
+    def _resource(self):
+        """S3 resource for the calling thread (boto3 resources are not thread-safe)."""
+        if self._client is None:
+            return None
+        return self._factory.resource('s3', region=self.region, source=self._source)
 
     def is_available(self) -> bool:
         """Check if S3 service is available."""
@@ -18,8 +18,8 @@ import logging
 import yaml
 from typing import Dict, Any, Optional, List, Set
 from pathlib import Path
-import pandas as pd
 from datetime import datetime
+from infrastructure.services.credential_backup import CredentialBackup
 
 logger = logging.getLogger(__name__)
 
@@ -119,7 +119,8 @@ class SelfDescribingCredentialCarrier:
         self._credential_sources = {}
         self._discovered_sources = {}
         self._backup_enabled = True
-        self._backup_path = Path("infrastructure/self_describing_credential_backup.parquet")
+        self._backup_path = Path("infrastructure/self_describing_credential_backup.json")
+        self._backup = CredentialBackup(self._backup_path)
 
         # Load all credentials based on configuration
         self._load_all_credentials()
@@ -285,19 +286,12 @@ class SelfDescribingCredentialCarrier:
             if not self._cached_credentials:
                 return
 
-            backup_data = {'timestamp': [datetime.now().isoformat()]}
-
             # Include type information in backup
-            for source_id, creds in self._cached_credentials.items():
-                source_info = self._discovered_sources.get(source_id, {})
-                backup_data[f"{source_id}_credentials"] = [str(creds)]
-                backup_data[f"{source_id}_type"] = [source_info.get('credential_type', 'unknown')]
-
-            backup_data['credential_sources'] = [str(self._credential_sources)]
-
-            self._backup_path.parent.mkdir(exist_ok=True)
-            df = pd.DataFrame(backup_data)
-            df.to_parquet(self._backup_path, index=False)
+            metadata = {
+                source_id: {'credential_type': self._discovered_sources.get(source_id, {}).get('credential_type', 'unknown')}
+                for source_id in self._cached_credentials
+            }
+            self._backup.save(self._cached_credentials, self._credential_sources, metadata)
 
             logger.debug(f"Self-describing credentials backed up to {self._backup_path}")
 
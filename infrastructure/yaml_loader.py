@@ -3,13 +3,27 @@ Settings Loader - Infrastructure Layer
 
 Reads configuration from settings.yaml to avoid hardcoding credentials.
 Provides secure access to configuration with environment variable fallbacks.
+
+Each settings file is held by one process-wide SettingsStore as an
+immutable, versioned SettingsSnapshot. Readers take ``loader.snapshot``,
+which is a plain attribute read with no lock and no YAML parsing. The store
+picks up edits to the file by comparing its mtime and size. That check runs
+on a watcher thread (``start_watching``) or, without one, at most once per
+``check_interval`` on read. Each change publishes a new snapshot and
+notifies subscribers. ``save_settings`` writes the file atomically and
+publishes the new snapshot directly, without re-parsing it.
 """
 
 import os
+import copy
+import tempfile
+import threading
+import time
 import yaml
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, List, Mapping
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -37,12 +51,193 @@ class SettingsConfig:
     s3_bucket: str
     s3_prefix: str
 
+def _freeze(value: Any) -> Any:
+    """Deep read-only view: dicts become mappingproxies, lists become tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Mutable deep copy of a frozen value."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Immutable view of settings.yaml at one point in time."""
+    version: int
+    path: str
+    mtime_ns: Optional[int]
+    size: Optional[int]
+    data: Mapping[str, Any]
+    loaded_at: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable deep copy of the settings."""
+        return _thaw(self.data)
+
+
+SettingsSubscriber = Callable[[SettingsSnapshot], None]
+
+
+class SettingsStore:
+    """Process-wide, change-aware holder of one settings file's snapshot."""
+
+    _stores: Dict[str, "SettingsStore"] = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self, settings_path: str, check_interval: float = 1.0):
+        self.settings_path = str(settings_path)
+        self.check_interval = check_interval
+        self._lock = threading.RLock()
+        self._subscribers: List[SettingsSubscriber] = []
+        self._last_check = 0.0
+        self._failed_stamp = None
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+        self.snapshot: Optional[SettingsSnapshot] = None
+
+    @classmethod
+    def for_path(cls, settings_path: str) -> "SettingsStore":
+        """Shared store for a settings file (keyed by resolved path)."""
+        key = str(Path(settings_path).resolve())
+        with cls._stores_lock:
+            store = cls._stores.get(key)
+            if store is None:
+                store = cls(settings_path)
+                cls._stores[key] = store
+            return store
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.settings_path)
+        except FileNotFoundError:
+            return None, None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _publish(self, data: Dict[str, Any], mtime_ns: Optional[int], size: Optional[int]) -> SettingsSnapshot:
+        previous = self.snapshot
+        snapshot = SettingsSnapshot(
+            version=(previous.version + 1) if previous else 1,
+            path=self.settings_path,
+            mtime_ns=mtime_ns,
+            size=size,
+            data=_freeze(data or {}),
+            loaded_at=time.time()
+        )
+        # Single reference swap: readers see the old or the new snapshot, never a mix
+        self.snapshot = snapshot
+        if previous is not None:
+            for callback in list(self._subscribers):
+                try:
+                    callback(snapshot)
+                except Exception as e:
+                    logger.error(f"Settings subscriber failed: {e}")
+        return snapshot
+
+    def refresh(self, force: bool = False) -> SettingsSnapshot:
+        """Re-read the file if its mtime/size changed (or always, with ``force``)."""
+        with self._lock:
+            self._last_check = time.monotonic()
+            mtime_ns, size = self._stat()
+            current = self.snapshot
+            if current is not None and not force and (
+                    (current.mtime_ns, current.size) == (mtime_ns, size)
+                    or self._failed_stamp == (mtime_ns, size)):
+                return current
+            try:
+                with open(self.settings_path, 'r') as f:
+                    data = yaml.safe_load(f)
+                logger.info(f"Settings loaded from {self.settings_path}")
+            except Exception as e:
+                logger.error(f"Failed to load settings from {self.settings_path}: {e}")
+                if current is None:
+                    raise
+                # Keep serving the last good snapshot until the file changes again
+                self._failed_stamp = (mtime_ns, size)
+                return current
+            self._failed_stamp = None
+            return self._publish(data, mtime_ns, size)
+
+    def get(self) -> SettingsSnapshot:
+        """Current snapshot; without a watcher, re-validates at most once per check_interval."""
+        snapshot = self.snapshot
+        if snapshot is None:
+            return self.refresh()
+        if self._watcher is None and time.monotonic() - self._last_check >= self.check_interval:
+            return self.refresh()
+        return snapshot
+
+    def save(self, data: Dict[str, Any]) -> SettingsSnapshot:
+        """Atomically write settings and publish them as the new snapshot."""
+        path = Path(self.settings_path)
+        with self._lock:
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    yaml.safe_dump(data, f, default_flow_style=False, indent=2)
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            mtime_ns, size = self._stat()
+            self._last_check = time.monotonic()
+            return self._publish(copy.deepcopy(data), mtime_ns, size)
+
+    def subscribe(self, callback: SettingsSubscriber) -> Callable[[], None]:
+        """Call ``callback(snapshot)`` on every change. Returns an unsubscribe function."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    def start_watching(self, interval: Optional[float] = None):
+        """Poll the file's mtime/size on a daemon thread."""
+        with self._lock:
+            if self._watcher is not None:
+                return
+            if interval is not None:
+                self.check_interval = interval
+            self._stop_watching.clear()
+            self._watcher = threading.Thread(target=self._watch, name="settings-watcher", daemon=True)
+            self._watcher.start()
+
+    def stop_watching(self):
+        with self._lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            self._stop_watching.set()
+            watcher.join(timeout=self.check_interval + 1)
+
+    def _watch(self):
+        while not self._stop_watching.wait(self.check_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Settings watcher error: {e}")
+
+
 class SettingsLoader:
     """Loads configuration from settings.yaml with environment fallbacks."""
 
     def __init__(self, settings_path: Optional[str] = None):
         self.settings_path = settings_path or self._find_settings_file()
-        self._settings_cache: Optional[Dict[str, Any]] = None
+        # Shared per file, so re-instantiating a loader doesn't re-parse YAML
+        self.store = SettingsStore.for_path(self.settings_path)
 
     def _find_settings_file(self) -> str:
         """Find settings.yaml file in infrastructure directory."""
@@ -63,21 +258,49 @@ class SettingsLoader:
 
         raise FileNotFoundError("No settings.yaml file found")
 
+    @property
+    def snapshot(self) -> SettingsSnapshot:
+        """Current immutable settings snapshot."""
+        return self.store.get()
+
+    @property
+    def version(self) -> int:
+        return self.snapshot.version
+
+    def _settings(self) -> Mapping[str, Any]:
+        """Read-only settings data for the getters below."""
+        return self.snapshot.data
+
     def _load_settings(self) -> Dict[str, Any]:
-        """Load settings from YAML file with caching."""
-        if self._settings_cache is None:
-            try:
-                with open(self.settings_path, 'r') as f:
-                    self._settings_cache = yaml.safe_load(f)
-                logger.info(f"Settings loaded from {self.settings_path}")
-            except Exception as e:
-                logger.error(f"Failed to load settings from {self.settings_path}: {e}")
-                raise
-        return self._settings_cache
+        """Raw settings as a mutable dict (a copy; edits don't affect the snapshot)."""
+        return self.snapshot.to_dict()
+
+    def load_settings(self) -> Dict[str, Any]:
+        """Raw settings as a mutable dict."""
+        return self._load_settings()
+
+    def save_settings(self, settings: Dict[str, Any]) -> SettingsSnapshot:
+        """Write settings.yaml and publish the new snapshot to all loaders."""
+        return self.store.save(settings)
+
+    def refresh(self, force: bool = False) -> SettingsSnapshot:
+        """Pick up file changes now instead of waiting for the next check."""
+        return self.store.refresh(force=force)
+
+    def subscribe(self, callback: SettingsSubscriber) -> Callable[[], None]:
+        """Be notified with the new snapshot whenever settings change."""
+        return self.store.subscribe(callback)
+
+    def start_watching(self, interval: float = 1.0):
+        """Watch settings.yaml for changes on a background thread."""
+        self.store.start_watching(interval)
+
+    def stop_watching(self):
+        self.store.stop_watching()
 
     def get_database_config(self) -> Dict[str, Any]:
         """Get database configuration from settings."""
-        settings = self._load_settings()
+        settings = self._settings()
 
         # Try postgresql_primary first (new structure), then postgresql (old structure)
         creds = settings.get('credentials', {}).get('postgresql_primary', {})
@@ -94,7 +317,7 @@ class SettingsLoader:
 
     def get_aws_config(self) -> Dict[str, Any]:
         """Get AWS configuration from settings."""
-        settings = self._load_settings()
+        settings = self._settings()
         creds = settings.get('credentials', {}).get('aws', {})
 
         return {
@@ -105,7 +328,7 @@ class SettingsLoader:
 
     def get_mlflow_config(self) -> Dict[str, Any]:
         """Get MLflow configuration from settings."""
-        settings = self._load_settings()
+        settings = self._settings()
         mlflow_config = settings.get('integrations', {}).get('mlflow', {})
         services_mlflow = settings.get('services', {}).get('mlflow', {})
 
@@ -129,7 +352,7 @@ class SettingsLoader:
 
     def get_s3_config(self) -> Dict[str, Any]:
         """Get S3 configuration from settings."""
-        settings = self._load_settings()
+        settings = self._settings()
         s3_config = settings.get('services', {}).get('s3', {})
 
         return {
@@ -140,7 +363,7 @@ class SettingsLoader:
 
     def get_bedrock_config(self) -> Dict[str, Any]:
         """Get Bedrock configuration from settings - no hardcoding."""
-        settings = self._load_settings()
+        settings = self._settings()
         bedrock_config = settings.get('credentials', {}).get('bedrock_llm', {})
 
         # Return exactly what's in settings without hardcoded fallbacks
@@ -149,7 +372,7 @@ class SettingsLoader:
         # Only include keys that exist in settings
         for key in ['service_provider', 'region', 'default_model', 'model_mapping', 'adapter_config']:
             if key in bedrock_config:
-                result[key] = bedrock_config[key]
+                result[key] = _thaw(bedrock_config[key])
 
         # Extract nested adapter_config values if they exist
         adapter_config = bedrock_config.get('adapter_config', {})
@@ -162,7 +385,7 @@ class SettingsLoader:
 
     def get_environment_type(self) -> str:
         """Get environment type from settings."""
-        settings = self._load_settings()
+        settings = self._settings()
         return os.getenv('ENVIRONMENT', settings.get('environment', 'development'))
 
     def load_config(self) -> SettingsConfig:
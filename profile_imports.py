@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Import-Time Profiler
+====================
+Reports the most expensive imports for each app entry point.
+
+For every entry point the module-level imports are replayed in a fresh
+interpreter under ``python -X importtime`` (the app itself is not run, so
+no Streamlit UI code executes). Costs are attributed to the top-level
+import statement that triggered them, and the slowest are listed.
+
+Usage:
+    python profile_imports.py                       # all portals/**/*_app.py
+    python profile_imports.py portals/dspy/dspy_editor_app.py --top 5
+    python profile_imports.py domain.services.dspy_step_integration
+    python profile_imports.py --budget-ms 500       # exit 1 if any entry is over budget
+"""
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).parent
+
+
+def _module_level_imports(tree: ast.Module) -> List[ast.stmt]:
+    """Import statements executed at import time (including inside try/if blocks)."""
+    imports = []
+
+    def visit(statements):
+        for node in statements:
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                imports.append(node)
+            elif isinstance(node, ast.Try):
+                visit(node.body)
+                visit(node.orelse)
+                visit(node.finalbody)
+            elif isinstance(node, ast.If):
+                visit(node.body)
+                visit(node.orelse)
+
+    visit(tree.body)
+    return imports
+
+
+def _entry_path(entry: str) -> Path:
+    """Source file for an app path or a dotted module name under the repo root."""
+    path = Path(entry)
+    if path.suffix == ".py":
+        return path
+    module_path = ROOT.joinpath(*entry.split("."))
+    for candidate in (module_path.with_suffix(".py"), module_path / "__init__.py"):
+        if candidate.exists():
+            return candidate
+    return path
+
+
+def build_import_script(entry: str) -> Tuple[str, List[str]]:
+    """
+    Build a script that replays an entry point's imports.
+
+    ``entry`` is a path to a .py file or a dotted module name. Returns the
+    script and the extra sys.path entries it needs.
+    """
+    path = _entry_path(entry)
+    if not path.exists():
+        return f"import {entry}", [str(ROOT)]
+
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    package = None
+    try:
+        relative = path.resolve().relative_to(ROOT.resolve())
+        package = ".".join(relative.parent.parts) or None
+    except ValueError:
+        pass
+
+    lines = []
+    for node in _module_level_imports(tree):
+        if isinstance(node, ast.ImportFrom) and node.level and package:
+            # Resolve relative imports against the file's package
+            base = package.split(".")
+            base = base[:len(base) - node.level + 1]
+            node = ast.ImportFrom(module=".".join(base + ([node.module] if node.module else [])),
+                                  names=node.names, level=0)
+        statement = ast.unparse(node)
+        lines.append(f"try:\n    {statement}\nexcept Exception:\n    pass")
+    return "\n".join(lines) or "pass", [str(ROOT), str(path.resolve().parent)]
+
+
+def parse_importtime(stderr: str) -> Tuple[Dict[str, int], int]:
+    """
+    Parse ``-X importtime`` output.
+
+    Returns cumulative microseconds per top-level import (the modules the
+    entry point imported directly, with everything they pulled in) and the
+    total.
+    """
+    costs: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        _, cumulative_us, name = parts
+        # Nesting is shown by indentation; depth 0 entries are top-level imports
+        indent = len(name) - len(name.lstrip(" "))
+        if indent > 1:
+            continue
+        name = name.strip()
+        costs[name] = costs.get(name, 0) + int(cumulative_us)
+    return costs, sum(costs.values())
+
+
+def profile_entry(entry: str, baseline: Dict[str, int]) -> Tuple[List[Tuple[str, int]], int]:
+    """Profile one entry point; returns (top-level imports by cost, total us)."""
+    script, paths = build_import_script(entry)
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(paths + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=str(ROOT), env=env, capture_output=True, text=True
+    )
+    costs, _ = parse_importtime(result.stderr)
+    # Drop interpreter start-up imports (site, encodings, ...)
+    costs = {name: us for name, us in costs.items() if name not in baseline}
+    ranked = sorted(costs.items(), key=lambda item: item[1], reverse=True)
+    return ranked, sum(costs.values())
+
+
+def interpreter_baseline() -> Dict[str, int]:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"],
+                            capture_output=True, text=True)
+    return parse_importtime(result.stderr)[0]
+
+
+def default_entries() -> List[str]:
+    from start_all_apps import discover_apps
+    return [str(Path(app["path"]).relative_to(ROOT)) for app in discover_apps()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the slowest imports per entry point")
+    parser.add_argument("entries", nargs="*", help="App files or dotted module names (default: all portal apps)")
+    parser.add_argument("--top", type=int, default=10, help="Offenders to list per entry (default: 10)")
+    parser.add_argument("--budget-ms", type=float, help="Flag entries whose import time exceeds this budget")
+    args = parser.parse_args()
+
+    entries = args.entries or default_entries()
+    baseline = interpreter_baseline()
+
+    over_budget = []
+    print("=" * 60)
+    print("IMPORT-TIME PROFILE")
+    print("=" * 60)
+
+    for entry in entries:
+        try:
+            ranked, total_us = profile_entry(entry, baseline)
+        except SyntaxError as e:
+            print(f"\n{entry}: [SKIPPED] cannot parse with Python {sys.version_info.major}.{sys.version_info.minor}: {e.msg} (line {e.lineno})")
+            continue
+        total_ms = total_us / 1000
+        flag = ""
+        if args.budget_ms is not None and total_ms > args.budget_ms:
+            over_budget.append((entry, total_ms))
+            flag = f"  [OVER BUDGET {args.budget_ms:.0f}ms]"
+
+        print(f"\n{entry}: {total_ms:.1f}ms{flag}")
+        for name, us in ranked[:args.top]:
+            share = (us / total_us * 100) if total_us else 0
+            print(f"    {us / 1000:8.1f}ms  {share:5.1f}%  {name}")
+
+    if args.budget_ms is not None:
+        print("\n" + "=" * 60)
+        if over_budget:
+            print(f"[FAILED] {len(over_budget)} entry point(s) over {args.budget_ms:.0f}ms:")
+            for entry, total_ms in sorted(over_budget, key=lambda item: item[1], reverse=True):
+                print(f"  - {entry}: {total_ms:.1f}ms")
+            sys.exit(1)
+        print(f"[SUCCESS] All entry points within {args.budget_ms:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,25 @@ Universal App Launcher - Auto-Discovery Version
 ================================================
 Automatically discovers and launches all *_app.py files in the portals/ directory.
 Each app runs on its own port, starting from 8501.
+
+All apps are started at once and each is reported ready when its Streamlit
+health endpoint answers, so bring-up takes about as long as the slowest app.
 """
 
 import subprocess
 import sys
 import os
 import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+# Readiness probing
+HEALTH_PATHS = ("/_stcore/health", "/healthz")  # current and older Streamlit
+READY_TIMEOUT = 90.0
+PROBE_INTERVAL = 0.25
 
 # Add root to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -73,15 +84,8 @@ def discover_apps() -> List[Dict[str, Any]]:
 
     return sorted(apps, key=lambda x: x["port"])
 
-def launch_app(app_config: Dict[str, Any]) -> Optional[subprocess.Popen]:
-    """Launch a single Streamlit app and return its process."""
-    name = app_config["name"]
-    path = app_config["path"]
-    port = app_config["port"]
-
-    print(f"  Launching {name} on port {port}...")
-
-    # Get environment with proper PYTHONPATH
+def build_launch_env() -> Dict[str, str]:
+    """Environment with proper PYTHONPATH for the launched apps."""
     from common.utilities.path_manager import get_path_manager
     path_mgr = get_path_manager()
     env = os.environ.copy()
@@ -89,6 +93,18 @@ def launch_app(app_config: Dict[str, Any]) -> Optional[subprocess.Popen]:
     if "PYTHONPATH" in env:
         python_paths.append(env["PYTHONPATH"])
     env["PYTHONPATH"] = os.pathsep.join(python_paths)
+    return env
+
+def launch_app(app_config: Dict[str, Any], env: Optional[Dict[str, str]] = None) -> Optional[subprocess.Popen]:
+    """Launch a single Streamlit app and return its process."""
+    name = app_config["name"]
+    path = app_config["path"]
+    port = app_config["port"]
+
+    print(f"  Launching {name} on port {port}...")
+
+    if env is None:
+        env = build_launch_env()
 
     # Launch streamlit app
     cmd = [
@@ -113,6 +129,78 @@ def launch_app(app_config: Dict[str, Any]) -> Optional[subprocess.Popen]:
         print(f"    [CANCELLED] Failed to launch: {e}")
         return None
 
+def wait_until_ready(port: int, process: subprocess.Popen,
+                     timeout: float = READY_TIMEOUT) -> Tuple[bool, float]:
+    """
+    Poll the app's health endpoint until it answers 200.
+
+    Returns (ready, seconds waited). Gives up early if the process exits.
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False, time.monotonic() - started
+        for health_path in HEALTH_PATHS:
+            try:
+                with urllib.request.urlopen(f"http://localhost:{port}{health_path}", timeout=1) as response:
+                    if response.status == 200:
+                        return True, time.monotonic() - started
+            except (urllib.error.URLError, ConnectionError, OSError):
+                pass
+        time.sleep(PROBE_INTERVAL)
+    return False, time.monotonic() - started
+
+def launch_all(apps: List[Dict[str, Any]], timeout: float = READY_TIMEOUT) -> List[Tuple[str, int, subprocess.Popen]]:
+    """
+    Start every app at once, then wait for all of them to pass the readiness probe.
+
+    Apps that exit or don't become ready within ``timeout`` are stopped and
+    left out of the returned process list.
+    """
+    env = build_launch_env()
+
+    launched = []
+    for i, app in enumerate(apps, 1):
+        print(f"\n[{i}/{len(apps)}] {app['name']}:")
+        process = launch_app(app, env)
+        if process:
+            launched.append((app['name'], app['port'], process))
+        else:
+            print(f"     [SKIPPED]  Skipped")
+
+    if not launched:
+        return []
+
+    print(f"\n[WAITING] Waiting for {len(launched)} apps to become ready...")
+    started = time.monotonic()
+    processes = []
+    with ThreadPoolExecutor(max_workers=len(launched)) as pool:
+        futures = {
+            pool.submit(wait_until_ready, port, process, timeout): (name, port, process)
+            for name, port, process in launched
+        }
+        try:
+            for future in as_completed(futures):
+                name, port, process = futures[future]
+                ready, waited = future.result()
+                if ready:
+                    print(f"  [READY] {name} (port {port}) in {waited:.1f}s")
+                    processes.append((name, port, process))
+                elif process.poll() is not None:
+                    print(f"  [FAILED] {name} (port {port}) exited with code {process.returncode}")
+                else:
+                    print(f"  [TIMEOUT] {name} (port {port}) not ready after {waited:.0f}s, stopping it")
+                    process.terminate()
+        except BaseException:
+            # Interrupted while waiting: stop everything (probes end once their process exits)
+            for _, _, process in launched:
+                process.terminate()
+            raise
+
+    print(f"\n[READY] {len(processes)}/{len(launched)} apps ready in {time.monotonic() - started:.1f}s")
+    return sorted(processes, key=lambda item: item[1])
+
 def main():
     """Discover and launch all apps."""
     print("=" * 60)
@@ -152,16 +240,8 @@ def main():
     processes = []
 
     try:
-        # Launch each app
-        for i, app in enumerate(apps, 1):
-            print(f"\n[{i}/{len(apps)}] {app['name']}:")
-            process = launch_app(app)
-
-            if process:
-                processes.append((app['name'], app['port'], process))
-                time.sleep(1.5)  # Small delay between launches
-            else:
-                print(f"     [SKIPPED]  Skipped")
+        # Launch all apps concurrently, gated on their readiness probes
+        processes = launch_all(apps)
 
         # Summary
         print("\n" + "=" * 60)
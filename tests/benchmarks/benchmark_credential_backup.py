@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Credential Backup Benchmark
+===========================
+
+Compares cold credential restore from the emergency backup:
+
+  legacy: parquet file of str(dict) columns restored with eval()
+  current: versioned JSON backup (infrastructure.services.credential_backup)
+
+Each restore runs in a fresh interpreter so import costs (pandas vs json)
+are included. The legacy parquet path needs pandas + pyarrow; without them
+only the in-process parse comparison is reported.
+
+Rejection of malicious and malformed backups is covered by
+tests/test_credential_backup.py.
+
+Usage:
+    python tests/benchmarks/benchmark_credential_backup.py
+    python tests/benchmarks/benchmark_credential_backup.py --runs 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from common.utilities.lazy_imports import module_available
+from infrastructure.services.credential_backup import CredentialBackup
+
+SAMPLE_CREDENTIALS = {
+    'aws': {
+        'access_key_id': 'AKIAEXAMPLEEXAMPLE01',
+        'secret_access_key': 'wJalrXUtnFEMI/K7MDENG/bPxRfiCYEXAMPLEKEY',
+        'region': 'us-east-1',
+    },
+    'database': {
+        'host': 'db.example.internal',
+        'port': 5432,
+        'database': 'compliance_qa',
+        'username': 'svc_compliance',
+        'password': 'example-password',
+    },
+}
+SAMPLE_SOURCES = {'aws': 'settings.yaml', 'database': 'environment'}
+
+LEGACY_RESTORE = """
+import time
+start = time.perf_counter()
+import pandas as pd
+df = pd.read_parquet({path!r})
+backup_data = df.to_dict('records')[0]
+credentials = {{}}
+for service in ['aws', 'database']:
+    service_data = backup_data.get(f'{{service}}_credentials')
+    if service_data:
+        credentials[service] = eval(service_data)
+print((time.perf_counter() - start) * 1000)
+"""
+
+CURRENT_RESTORE = """
+import time
+start = time.perf_counter()
+from infrastructure.services.credential_backup import CredentialBackup
+record = CredentialBackup({path!r}).load()
+credentials = {{service: dict(record.credentials[service]) for service in ['aws', 'database']}}
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def cold_restore_ms(script: str, runs: int) -> float:
+    """Median restore time across fresh interpreters."""
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.pathsep.join([str(project_root)] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else []))
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, '-c', script], cwd=str(project_root), env=env,
+                                capture_output=True, text=True, check=True)
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return statistics.median(timings)
+
+
+def write_legacy_backup(path: Path) -> bool:
+    """Write the pre-JSON parquet backup format; False if pandas/pyarrow are missing."""
+    if not (module_available('pandas') and (module_available('pyarrow') or module_available('fastparquet'))):
+        return False
+    import pandas as pd
+    pd.DataFrame({
+        'timestamp': ['2025-01-01T00:00:00'],
+        'aws_credentials': [str(SAMPLE_CREDENTIALS['aws'])],
+        'database_credentials': [str(SAMPLE_CREDENTIALS['database'])],
+        'credential_sources': [str(SAMPLE_SOURCES)],
+    }).to_parquet(path, index=False)
+    return True
+
+
+def parse_comparison(backup: CredentialBackup, iterations: int = 2000):
+    """In-process parse cost: eval() of str(dict) columns vs one JSON load."""
+    legacy_columns = [str(SAMPLE_CREDENTIALS['aws']), str(SAMPLE_CREDENTIALS['database'])]
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for column in legacy_columns:
+            eval(column)
+    legacy_us = (time.perf_counter() - start) / iterations * 1e6
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        backup.load()
+    current_us = (time.perf_counter() - start) / iterations * 1e6
+    return legacy_us, current_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark credential backup restore")
+    parser.add_argument('--runs', type=int, default=10, help="Fresh interpreters per cold restore (default: 10)")
+    args = parser.parse_args()
+
+    # Keep a configured backup key from changing what is measured
+    os.environ.pop('CREDENTIAL_BACKUP_KEY', None)
+
+    print("Credential Backup Benchmark")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        current_path = workdir / 'credential_backup.json'
+        backup = CredentialBackup(current_path)
+        backup.save(SAMPLE_CREDENTIALS, SAMPLE_SOURCES)
+        assert backup.load().credentials == SAMPLE_CREDENTIALS
+
+        print("\nCold restore (median of fresh interpreters):")
+        print("-" * 40)
+        current_ms = cold_restore_ms(CURRENT_RESTORE.format(path=str(current_path)), args.runs)
+        legacy_path = workdir / 'credential_backup.parquet'
+        if write_legacy_backup(legacy_path):
+            legacy_ms = cold_restore_ms(LEGACY_RESTORE.format(path=str(legacy_path)), args.runs)
+            print(f"  legacy parquet + eval: {legacy_ms:8.2f}ms")
+            print(f"  JSON backup:           {current_ms:8.2f}ms  ({legacy_ms / current_ms:.1f}x faster)")
+        else:
+            print("  legacy parquet + eval: skipped (pandas/pyarrow not installed)")
+            print(f"  JSON backup:           {current_ms:8.2f}ms")
+
+        legacy_us, current_us = parse_comparison(backup)
+        print("\nIn-process restore (file already cached by the OS):")
+        print("-" * 40)
+        print(f"  eval() of str(dict) columns:  {legacy_us:8.1f}us (parse only)")
+        print(f"  JSON backup load + validate:  {current_us:8.1f}us (read + parse + validate)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Chat streaming: SSE frames from the offline FakeTokenSource, limits and disconnects."""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from api.concurrency import ConcurrencySettings
+from api.main import create_app
+from api.streaming import FakeTokenSource
+
+
+def make_app(source, **concurrency):
+    return create_app(chat_manager_factory=lambda: source, qa_service_factory=lambda: None,
+                      concurrency=ConcurrencySettings(**concurrency))
+
+
+def parse_sse(body):
+    """(event, data) pairs from an SSE body; unnamed events are None."""
+    frames = []
+    for block in body.strip().split("\n\n"):
+        event = None
+        data = None
+        for line in block.splitlines():
+            if line.startswith("event: "):
+                event = line[len("event: "):]
+            elif line.startswith("data: "):
+                data = json.loads(line[len("data: "):])
+        frames.append((event, data))
+    return frames
+
+
+def test_stream_sends_tokens_then_done():
+    source = FakeTokenSource(text="one two three", delay_seconds=0.0)
+
+    with TestClient(make_app(source)) as client:
+        response = client.post("/chat/stream", json={"message": "hi"})
+        metrics = client.get("/chat/stream/metrics").json()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = parse_sse(response.text)
+    assert [data["token"] for event, data in frames[:-1]] == ["one", " two", " three"]
+    assert all(event is None for event, _ in frames[:-1])
+
+    event, done = frames[-1]
+    assert event == "done"
+    assert done["tokens"] == 3
+    assert done["ttfb_ms"] is not None and done["ttfb_ms"] <= done["total_ms"]
+    assert metrics["completed"] == 1 and metrics["ttfb_samples"] == 1
+
+
+def test_busy_endpoint_streams_an_error_event():
+    source = FakeTokenSource(delay_seconds=0.0)
+    app = make_app(source, endpoint_limits={"chat_stream": 0}, queue_timeout=0.05)
+
+    with TestClient(app) as client:
+        response = client.post("/chat/stream", json={"message": "hi"})
+
+    assert parse_sse(response.text) == [
+        ("error", {"error": "Endpoint 'chat_stream' is at its concurrency limit"})
+    ]
+    assert source.calls == 0
+
+
+def test_deadline_applies_while_tokens_keep_arriving():
+    source = FakeTokenSource(text=" ".join(["word"] * 200), delay_seconds=0.01)
+    app = make_app(source, endpoint_timeouts={"chat_stream": 0.2})
+
+    with TestClient(app) as client:
+        response = client.post("/chat/stream", json={"message": "hi"})
+
+    frames = parse_sse(response.text)
+    assert frames[-1] == ("error", {"error": "chat_stream request timed out"})
+    assert 0 < len(frames) - 1 < 200
+
+
+def test_client_disconnect_cancels_the_producer():
+    source = FakeTokenSource(text=" ".join(["word"] * 200), delay_seconds=0.01)
+    app = make_app(source)
+    body = json.dumps({"message": "hi"}).encode()
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "POST", "scheme": "http",
+        "path": "/chat/stream", "raw_path": b"/chat/stream", "root_path": "", "query_string": b"",
+        "headers": [(b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode())],
+        "client": ("testclient", 50000), "server": ("testserver", 80),
+    }
+
+    async def run():
+        first_token = asyncio.Event()
+        sent = []
+        body_sent = False
+
+        async def receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await first_token.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                sent.append(message["body"])
+                first_token.set()
+
+        async with app.router.lifespan_context(app):
+            scope["app"] = app
+            await app(scope, receive, send)
+            metrics = app.state.stream_metrics.summary()
+            # The producer thread sees the cancel flag on its next token and closes the source
+            deadline = time.monotonic() + 5
+            while not source.closed_early and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+        return sent, metrics
+
+    sent, metrics = asyncio.run(run())
+
+    assert sent and b"event: done" not in b"".join(sent)
+    assert source.closed_early == 1
+    assert source.tokens_emitted < 200
+    assert metrics["disconnected"] == 1
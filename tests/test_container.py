@@ -0,0 +1,34 @@
+"""Lazy container sections build services only when a value is read."""
+
+from infrastructure.container import DIContainer, _LazySection
+
+
+def _container_with_lazy_service(built):
+    container = DIContainer()
+
+    def provider():
+        built.append("config_repository")
+        return object()
+
+    container.register_lazy("config_repository", provider)
+    return container
+
+
+def test_membership_and_iteration_construct_nothing():
+    built = []
+    section = _LazySection(_container_with_lazy_service(built), {"config": "config_repository"})
+
+    assert "config" in section
+    assert "portal" not in section
+    assert list(section) == ["config"]
+    assert list(section.keys()) == ["config"]
+    assert len(section) == 1
+    assert built == []
+
+
+def test_reading_a_value_constructs_it_once():
+    built = []
+    section = _LazySection(_container_with_lazy_service(built), {"config": "config_repository"})
+
+    assert section["config"] is section.get("config")
+    assert built == ["config_repository"]
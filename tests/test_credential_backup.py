@@ -0,0 +1,138 @@
+"""Credential backup format: round trip, and rejection of malicious or malformed files."""
+
+import json
+import stat
+
+import pytest
+
+from infrastructure.services.credential_backup import (
+    BACKUP_FORMAT, BACKUP_VERSION, CRYPTOGRAPHY_AVAILABLE, MAX_BACKUP_BYTES,
+    CredentialBackup, CredentialBackupError, EnvironmentKeyProvider, KeyProvider, generate_key
+)
+
+CREDENTIALS = {
+    'aws': {'access_key_id': 'AKIAEXAMPLEEXAMPLE01', 'secret_access_key': 'secret', 'region': 'us-east-1'},
+    'database': {'host': 'db.example.internal', 'port': 5432, 'password': 'example-password'},
+}
+SOURCES = {'aws': 'settings.yaml', 'database': 'environment'}
+
+
+@pytest.fixture(autouse=True)
+def no_backup_key(monkeypatch):
+    monkeypatch.delenv('CREDENTIAL_BACKUP_KEY', raising=False)
+
+
+@pytest.fixture
+def marker(tmp_path):
+    """File that a backup would create if any of its content were executed."""
+    return tmp_path / 'pwned'
+
+
+@pytest.fixture
+def payload(marker):
+    return f"__import__('pathlib').Path({str(marker)!r}).write_text('x')"
+
+
+def envelope(data, **overrides):
+    document = {'format': BACKUP_FORMAT, 'version': BACKUP_VERSION, 'encrypted': False, 'data': data}
+    document.update(overrides)
+    return json.dumps(document)
+
+
+def _nested(depth):
+    value = {'value': 'leaf'}
+    for _ in range(depth):
+        value = {'value': value}
+    return value
+
+
+REJECTED = {
+    'legacy str(dict) with code': lambda payload: "{'access_key_id': " + payload + "}",
+    'wrong format marker': lambda payload: envelope({'credentials': {}}, format='something-else'),
+    'unsupported version': lambda payload: envelope({'credentials': {}}, version=99),
+    'credentials entry not an object': lambda payload: envelope({'credentials': {'aws': payload}}),
+    'unknown payload field': lambda payload: envelope({'credentials': {}, '__class__': 'os.system'}),
+    'NaN constant': lambda payload: envelope({'credentials': {}}).replace('"data": {', '"nan": NaN, "data": {'),
+    'sources not strings': lambda payload: envelope({'credentials': {}, 'sources': {'aws': ['x']}}),
+    'excessive nesting': lambda payload: envelope({'credentials': {'aws': {'deep': _nested(20)}}}),
+    'encrypted without key': lambda payload: envelope('gAAAAABinvalidtoken', encrypted=True),
+    'oversized file': lambda payload: envelope({'credentials': {'aws': {'pad': 'x' * (MAX_BACKUP_BYTES + 1)}}}),
+    'not JSON': lambda payload: '\x00\x01binary',
+}
+
+
+def test_round_trip_is_owner_only(tmp_path):
+    backup = CredentialBackup(tmp_path / 'credential_backup.json')
+    path = backup.save(CREDENTIALS, SOURCES, {'aws': {'rotated': False}})
+
+    record = backup.load()
+    assert record.credentials == CREDENTIALS
+    assert record.sources == SOURCES
+    assert record.metadata == {'aws': {'rotated': False}}
+    assert not record.encrypted
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_incomplete_key_provider_fails_at_construction():
+    class NoKey(KeyProvider):
+        pass
+
+    with pytest.raises(TypeError):
+        NoKey()
+
+
+def test_missing_file_loads_as_none(tmp_path):
+    assert CredentialBackup(tmp_path / 'absent.json').load() is None
+
+
+@pytest.mark.parametrize('content', REJECTED.values(), ids=list(REJECTED))
+def test_malicious_or_malformed_backup_is_rejected(tmp_path, marker, payload, content):
+    path = tmp_path / 'malicious.json'
+    path.write_text(content(payload), encoding='utf-8')
+
+    with pytest.raises(CredentialBackupError):
+        CredentialBackup(path).load()
+    assert not marker.exists()
+
+
+def test_code_in_a_string_value_is_inert_data(tmp_path, marker, payload):
+    path = tmp_path / 'inert.json'
+    path.write_text(envelope({'credentials': {'aws': {'access_key_id': payload}}}), encoding='utf-8')
+
+    assert CredentialBackup(path).load().credentials['aws']['access_key_id'] == payload
+    assert not marker.exists()
+
+
+def test_save_rejects_values_that_are_not_plain_json(tmp_path):
+    with pytest.raises(CredentialBackupError):
+        CredentialBackup(tmp_path / 'backup.json').save({'aws': {'client': object()}})
+
+
+def test_carrier_ignores_a_malicious_backup(tmp_path, marker, payload):
+    from infrastructure.services.credential_carrier import CredentialCarrier
+
+    carrier = CredentialCarrier.__new__(CredentialCarrier)
+    carrier._cached_credentials = {}
+    carrier._credential_sources = {}
+    carrier._backup_path = tmp_path / 'malicious.json'
+    carrier._backup = CredentialBackup(carrier._backup_path)
+    carrier._backup_path.write_text("{'aws': " + payload + "}")
+
+    carrier._load_from_backup()
+
+    assert carrier._cached_credentials == {}
+    assert not marker.exists()
+
+
+@pytest.mark.skipif(not CRYPTOGRAPHY_AVAILABLE, reason="cryptography is not installed")
+def test_encrypted_backup_needs_the_key(tmp_path, monkeypatch):
+    monkeypatch.setenv('CREDENTIAL_BACKUP_KEY', generate_key().decode('ascii'))
+    path = tmp_path / 'encrypted.json'
+    CredentialBackup(path).save(CREDENTIALS, SOURCES)
+
+    assert 'secret' not in path.read_text(encoding='utf-8')
+    assert CredentialBackup(path).load().credentials == CREDENTIALS
+
+    monkeypatch.setenv('CREDENTIAL_BACKUP_KEY', generate_key().decode('ascii'))
+    with pytest.raises(CredentialBackupError):
+        CredentialBackup(path, EnvironmentKeyProvider()).load()
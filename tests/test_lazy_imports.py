@@ -0,0 +1,41 @@
+"""Lazy module proxies and the installed-but-broken case."""
+
+import sys
+
+import pytest
+
+from common.utilities.lazy_imports import lazy_import, module_available
+
+
+@pytest.fixture
+def broken_package(tmp_path, monkeypatch):
+    package = tmp_path / "broken_optional_dep"
+    package.mkdir()
+    (package / "__init__.py").write_text("import a_native_library_that_is_missing\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "broken_optional_dep"
+    sys.modules.pop("broken_optional_dep", None)
+
+
+def test_proxy_imports_on_first_use():
+    json_proxy = lazy_import("json")
+    assert "not loaded" in repr(json_proxy)
+    assert json_proxy.loads("[1]") == [1]
+    assert json_proxy.is_available()
+
+
+def test_installed_but_broken_module_falls_back_through_is_available(broken_package):
+    proxy = lazy_import(broken_package)
+
+    # The finder locates the package, so the cheap check reports it
+    assert module_available(broken_package)
+
+    assert not proxy.is_available()
+    with pytest.raises(ImportError, match="could not be imported"):
+        proxy.anything
+    assert "import failed" in repr(proxy)
+
+
+def test_missing_module_is_not_available():
+    assert not module_available("no_such_module_for_lazy_import_tests")
+    assert not lazy_import("no_such_module_for_lazy_import_tests").is_available()
@@ -0,0 +1,141 @@
+"""Batch QA jobs: NDJSON download, document loading and error attribution."""
+
+import json
+import time
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from api.main import create_app
+from api.qa_jobs import QAJobSettings, check_chunk
+from domain.rules.mvs_rules import ComplianceStatus
+from domain.services.tensor_logic import BatchInferenceResult, InferenceResult, ReasoningMode
+from domain.services.tensor_logic.inference_result import ProvenanceType
+
+
+class FakeQAService:
+    """Answers every question COMPLIANT unless the document asks to fail."""
+
+    def __init__(self):
+        self.batch_calls = 0
+        self.single_calls = 0
+        self.seen = []
+
+    def _answer(self, document, question):
+        if document.get("fail"):
+            raise ValueError("unreadable document")
+        self.seen.append((document, question))
+        return InferenceResult(
+            answer=ComplianceStatus.COMPLIANT, confidence=0.9,
+            reasoning_mode=ReasoningMode.SYMBOLIC, temperature=0.0,
+            provenance=ProvenanceType.DEDUCTIVE, certifiable=True, query=question or ""
+        )
+
+    def batch_check_compliance(self, documents, compliance_standard, temperature, questions=None):
+        self.batch_calls += 1
+        results, errors = [], {}
+        for index, (document, question) in enumerate(zip(documents, questions)):
+            try:
+                results.append(self._answer(document, question))
+            except Exception as e:
+                errors[index] = str(e)
+        return BatchInferenceResult(results=results, success_count=len(results),
+                                    failure_count=len(errors), errors=errors)
+
+    def check_compliance(self, document, compliance_standard, temperature, question=None):
+        self.single_calls += 1
+        return self._answer(document, question)
+
+
+def test_finished_job_results_download_as_ndjson(tmp_path):
+    (tmp_path / "model.json").write_text(json.dumps({"title": "Model card"}))
+    service = FakeQAService()
+    settings = QAJobSettings(sync_batch_limit=1, chunk_size=2, document_root=str(tmp_path))
+    app = create_app(chat_manager_factory=lambda: None, qa_service_factory=lambda: service,
+                     qa_settings=settings)
+
+    items = [
+        {"document_path": "model.json", "question": "Is validation documented?"},
+        {"document": {"fail": True}, "question": "Does it fail?"},
+        {"document": {"content": "inline"}, "question": "Is it inline?"},
+    ]
+    with TestClient(app) as client:
+        submitted = client.post("/qa", json={"items": items})
+        assert submitted.status_code == 202
+        job_id = submitted.json()["job_id"]
+
+        deadline = time.monotonic() + 10
+        while client.get(f"/qa/jobs/{job_id}").json()["status"] != "completed":
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        response = client.get(f"/qa/jobs/{job_id}/results")
+        assert response.status_code == 200
+        records = sorted((json.loads(line) for line in response.text.splitlines()),
+                         key=lambda r: r["index"])
+
+    assert [r["status"] for r in records] == ["ok", "error", "ok"]
+    assert records[0]["result"]["answer"] == "COMPLIANT"
+    assert records[1]["error"] == "unreadable document"
+    assert service.single_calls == 0
+    assert (({"title": "Model card", "document_path": "model.json"}, "Is validation documented?")
+            in service.seen)
+
+
+def test_document_path_is_rejected_without_a_document_root(tmp_path, monkeypatch):
+    (tmp_path / "settings.yaml").write_text("secret: value")
+    monkeypatch.chdir(tmp_path)
+    service = FakeQAService()
+    app = create_app(chat_manager_factory=lambda: None, qa_service_factory=lambda: service,
+                     qa_settings=QAJobSettings())
+
+    with TestClient(app) as client:
+        response = client.post("/qa", json={"document_path": "settings.yaml", "question": "q"})
+        inline = client.post("/qa", json={"document": {"content": "inline"}, "question": "q"})
+
+    assert response.status_code == 400
+    assert "QA_DOCUMENT_ROOT" in response.json()["detail"]
+    assert inline.status_code == 200
+    assert service.seen == [({"content": "inline"}, "q")]
+
+    records = check_chunk(service, [{"index": 0, "document_path": "settings.yaml", "question": "q"}],
+                          "MVS_5.4.3", 0.0)
+    assert records[0]["status"] == "error"
+    assert "no QA document root" in records[0]["error"]
+
+
+def test_document_path_outside_root_is_an_item_error(tmp_path):
+    root = tmp_path / "documents"
+    root.mkdir()
+    (tmp_path / "secret.json").write_text(json.dumps({"password": "x"}))
+    service = FakeQAService()
+    items = [{"index": 0, "document_path": "../secret.json", "question": "q"},
+             {"index": 1, "document": {"content": "ok"}, "question": "q"}]
+
+    records = check_chunk(service, items, "MVS_5.4.3", 0.0, document_root=str(root))
+
+    assert records[0]["status"] == "error"
+    assert "outside the QA document root" in records[0]["error"]
+    assert records[1]["status"] == "ok"
+
+
+def test_symlink_resolving_outside_root_is_an_item_error(tmp_path):
+    root = tmp_path / "documents"
+    root.mkdir()
+    (tmp_path / "secret.json").write_text(json.dumps({"password": "x"}))
+    try:
+        (root / "linked.json").symlink_to(tmp_path / "secret.json")
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks are not supported here")
+    service = FakeQAService()
+
+    records = check_chunk(service, [{"index": 0, "document_path": "linked.json", "question": "q"}],
+                          "MVS_5.4.3", 0.0, document_root=str(root))
+
+    assert records[0]["status"] == "error"
+    assert "outside the QA document root" in records[0]["error"]
+    assert service.seen == []